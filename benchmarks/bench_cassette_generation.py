@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark reading a play-by-play CSV for cassette generation.
+
+Usage:
+  python benchmarks/bench_cassette_generation.py [--csv PATH] [--repeat N]
+
+Times generate_cassettes_from_csv.group_rows_by_game on the full filtered CSV
+with the per-cell csv.DictReader parser and with the typed pandas reader,
+then renders every game with both results and checks that the cassettes are
+byte-identical.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from pulse_mock.cassettes import generate_cassettes_from_csv as generate  # noqa: E402
+
+DEFAULT_CSV = os.path.join(os.path.dirname(generate.__file__), 'play_by_play_2025_filtered.csv')
+
+
+def time_grouping(csv_path, repeat, typed):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        groups = generate.group_rows_by_game(csv_path, typed=typed)
+        best = min(best, time.perf_counter() - start)
+    return best, groups
+
+
+def time_rendering(groups, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        rendered = {game_id: generate.make_yaml_for_game(game_id, plays) for game_id, plays in groups.items()}
+        best = min(best, time.perf_counter() - start)
+    return best, rendered
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--csv', default=DEFAULT_CSV)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    generate.read_plays_typed(args.csv)  # import pandas outside the timed runs
+    plain, plain_groups = time_grouping(args.csv, args.repeat, typed=False)
+    typed, typed_groups = time_grouping(args.csv, args.repeat, typed=True)
+    render, plain_files = time_rendering(plain_groups, args.repeat)
+    _, typed_files = time_rendering(typed_groups, 1)
+
+    rows = sum(len(plays) for plays in plain_groups.values())
+    print(f'{os.path.basename(args.csv)}: {rows} plays in {len(plain_groups)} games (best of {args.repeat})')
+    print(f'  csv.DictReader  : {plain * 1000:8.1f} ms')
+    print(f'  typed pandas    : {typed * 1000:8.1f} ms  ({plain / typed:5.1f}x)')
+    print(f'  render YAML     : {render * 1000:8.1f} ms')
+    print(f'  identical output: {plain_files == typed_files}')
+
+
+if __name__ == '__main__':
+    main()
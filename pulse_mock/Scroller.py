@@ -10,10 +10,14 @@ import tempfile
 import threading
 import time
 import json
+import sys
 from matplotlib.ticker import MultipleLocator, FuncFormatter, NullFormatter
 import matplotlib.animation as animation
 from matplotlib.widgets import RadioButtons, TextBox, Button
 
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from pulse_mock.play_store import PlayColumns
+
 # Dropdown was added in newer matplotlib versions. Provide a small
 # fallback implementation that mimics the Dropdown API (on_select)
 # using a Button which cycles through options when Dropdown isn't
@@ -95,21 +99,33 @@ def format_mmss(sec):
 	s = int(sec) % 60
 	return f"{m:02d}:{s:02d}"
 
+# columnar copy of the plays: one float64 array per KEY_ORDER column
+columns = PlayColumns.from_plays(plays)
+
 # compute elapsed seconds (since game start) for each play and ordering index
-elapsed = [3600 - p['game_seconds_remaining'] for p in plays]
+elapsed = columns.elapsed().tolist()
 # We'll animate in chronological order (by elapsed) to avoid connecting
 # out-of-order points which causes visual artifacts.
-idx_order = sorted(range(len(plays)), key=lambda i: elapsed[i])
-
-# Helper to extract a numeric series by variable name. Supports special
-# names: 'elapsed' and 'diff' (wpa - qb_epa). Falls back to 0.0 for missing values.
+idx_order = columns.chronological_order()
+
+# Helper to extract a numeric series by variable name, following idx_order.
+# Falls back to 0.0 for missing values. Two names are derived rather than read
+# from the plays:
+#   'elapsed'  seconds since kickoff, 3600 - game_seconds_remaining
+#   'diff'     wpa - qb_epa (see get_diff_series); a play's own 'diff' value,
+#              if it had one, is not used
+# KEY_ORDER columns come from the columnar copy; any other field is read from
+# the play dicts.
 def get_series(var_name):
-	if var_name == 'elapsed':
-		return [elapsed[i] for i in idx_order]
-	#if var_name == 'diff':
-		#return [float(plays[i].get('wpa') or 0.0) - float(plays[i].get('qb_epa') or 0.0) for i in idx_order]
-	# generic numeric field
-	return [float(plays[i].get(var_name) or 0.0) for i in idx_order]
+	if var_name == 'diff':
+		return get_diff_series()
+	if var_name != 'elapsed' and var_name not in columns.columns:
+		return [float(plays[i].get(var_name) or 0.0) for i in idx_order]
+	return columns.series(var_name, idx_order).tolist()
+
+# Derived 'diff' series: wpa - qb_epa following idx_order
+def get_diff_series():
+	return columns.diff('wpa', 'qb_epa', idx_order).tolist()
 
 # Define three graph presets (initially the same 'tpi vs diff' per your request).
 presets = [
@@ -144,7 +160,7 @@ def compute_limits(xseries, yseries):
 
 (xlim, ylim) = compute_limits(xs, ys)
 # initial diff series (wpa - qb_epa) following idx_order
-diff_series = [float(plays[i].get('wpa') or 0.0) - float(plays[i].get('qb_epa') or 0.0) for i in idx_order]
+diff_series = get_diff_series()
 
 min_e, max_e = min(elapsed), max(elapsed)
 # Create tick range bounds
@@ -245,7 +261,7 @@ def apply_preset(event=None):
 	xs = get_series(presets[active_idx]['x'])
 	ys = get_series(presets[active_idx]['y'])
 	# recompute diff series (wpa - qb_epa) relative to idx_order
-	diff_series = [float(plays[i].get('wpa') or 0.0) - float(plays[i].get('qb_epa') or 0.0) for i in idx_order]
+	diff_series = get_diff_series()
 	(xlim, ylim) = compute_limits(xs, ys)
 	ax.set_xlim(xlim[0], xlim[1])
 	ax.set_ylim(ylim[0], ylim[1])
@@ -270,7 +286,7 @@ def on_radio(label):
 	# update series to the selected preset
 	xs = get_series(presets[active_idx]['x'])
 	ys = get_series(presets[active_idx]['y'])
-	diff_series = [float(plays[i].get('wpa') or 0.0) - float(plays[i].get('qb_epa') or 0.0) for i in idx_order]
+	diff_series = get_diff_series()
 	(xlim, ylim) = compute_limits(xs, ys)
 	ax.set_xlim(xlim[0], xlim[1])
 	ax.set_ylim(ylim[0], ylim[1])
@@ -366,7 +382,7 @@ def build_series_for_preset(preset_idx: int):
 	p = presets[preset_idx]
 	xs_local = get_series(p['x'])
 	ys_local = get_series(p['y'])
-	diff_local = [float(plays[i].get('wpa') or 0.0) - float(plays[i].get('qb_epa') or 0.0) for i in idx_order]
+	diff_local = get_diff_series()
 	xlim_local, ylim_local = compute_limits(xs_local, ys_local)
 	return xs_local, ys_local, diff_local, xlim_local, ylim_local
 
@@ -6,14 +6,23 @@ Easily simulate API responses for testing and development.
 """
 
 from .client import MockAPIClient, NFLMockClient
+from .async_client import AsyncMockAPIClient, AsyncNFLMockClient
 from .exceptions import CassetteNotFoundError, RequestNotFoundError, InvalidCassetteError
+from .frozen import FrozenDict, FrozenList, thaw
+from .interaction import Interaction
 
 __version__ = "1.0.0"
 __all__ = [
     "MockAPIClient", 
     "NFLMockClient", 
+    "AsyncMockAPIClient",
+    "AsyncNFLMockClient",
     "CassetteNotFoundError", 
     "RequestNotFoundError", 
     "InvalidCassetteError",
+    "FrozenDict",
+    "FrozenList",
+    "thaw",
+    "Interaction",
     "create_app"
 ]
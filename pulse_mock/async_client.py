@@ -0,0 +1,225 @@
+"""
+Asyncio front-end for the Pulse Mock API Client.
+
+AsyncMockAPIClient wraps a regular MockAPIClient, so both share one interaction
+index and decoded-body cache. Requests that hit already loaded interactions
+are answered directly on the event loop (MockAPIClient.try_request); anything
+that may read cassettes from disk, and all JSON decoding, runs in a thread
+pool. Use `await AsyncNFLMockClient.create()` to build the wrapped client, which
+loads every cassette by default, in the thread pool as well.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Dict, Iterable, List, Optional
+
+from .client import MockAPIClient, MockResponse, NFLMockClient
+
+
+class AsyncMockAPIClient:
+    """
+    An asyncio counterpart of MockAPIClient.
+
+    Example:
+        client = await AsyncMockAPIClient.create()
+        response = await client.get('http://localhost:1339/v1/leagues/NFL/teams')
+        teams = await client.get_json('http://localhost:1339/v1/leagues/NFL/teams')
+        responses = await client.gather_many([url1, url2, url3])
+    """
+
+    # Synchronous client created from **kwargs when no client is given
+    _client_class = MockAPIClient
+
+    def __init__(self, client: Optional[MockAPIClient] = None, executor: Optional[Executor] = None, **kwargs):
+        """
+        Initialize the AsyncMockAPIClient.
+
+        Args:
+            client: Synchronous client whose cassettes and index are shared. A new
+                MockAPIClient is created from **kwargs when omitted.
+            executor: Executor for cassette loading and JSON decoding. Defaults to
+                the event loop's default thread pool.
+            **kwargs: MockAPIClient options used when client is omitted
+        """
+        self.client = client if client is not None else self._client_class(**kwargs)
+        self.executor = executor
+
+    @classmethod
+    async def create(cls, client: Optional[MockAPIClient] = None, executor: Optional[Executor] = None,
+                     **kwargs) -> 'AsyncMockAPIClient':
+        """
+        Create the client without blocking the event loop.
+
+        Constructing the synchronous client can load cassettes (NFLMockClient loads
+        every cassette by default), so when client is omitted it is created in
+        the executor.
+
+        Args:
+            client: Synchronous client to share
+            executor: Executor for client creation, cassette loading and JSON decoding
+            **kwargs: Options for the synchronous client used when client is omitted
+        """
+        if client is None:
+            loop = asyncio.get_running_loop()
+            client = await loop.run_in_executor(executor, functools.partial(cls._client_class, **kwargs))
+        return cls(client, executor)
+
+    async def _run(self, func, *args) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, *args)
+
+    async def request(self, method: str, url: str, headers: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
+        """
+        Make a mock request and return the corresponding response from cassettes.
+
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Request headers
+            **kwargs: Additional arguments (ignored for compatibility)
+
+        Returns:
+            MockResponse object
+
+        Raises:
+            RequestNotFoundError: If no matching interaction is found
+        """
+        response = self.client.try_request(method, url, headers)
+        if response is None:
+            response = await self._run(self.client.request, method, url, headers)
+        return response
+
+    async def get(self, url: str, headers: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
+        """Make a GET request."""
+        return await self.request('GET', url, headers, **kwargs)
+
+    async def post(self, url: str, headers: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
+        """Make a POST request."""
+        return await self.request('POST', url, headers, **kwargs)
+
+    async def put(self, url: str, headers: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
+        """Make a PUT request."""
+        return await self.request('PUT', url, headers, **kwargs)
+
+    async def delete(self, url: str, headers: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
+        """Make a DELETE request."""
+        return await self.request('DELETE', url, headers, **kwargs)
+
+    async def patch(self, url: str, headers: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
+        """Make a PATCH request."""
+        return await self.request('PATCH', url, headers, **kwargs)
+
+    async def json(self, response: MockResponse, copy: bool = False) -> Any:
+        """
+        Decode a response body in the thread pool.
+
+        Args:
+            response: Response returned by this client
+            copy: If True, return a private mutable copy of the body
+        """
+        return await self._run(response.json, copy)
+
+    async def get_json(self, url: str, headers: Optional[Dict[str, Any]] = None) -> Any:
+        """Make a GET request and return its decoded JSON body."""
+        return await self.json(await self.get(url, headers))
+
+    async def gather_many(self, urls: Iterable[str], method: str = 'GET', decode: bool = False,
+                          return_exceptions: bool = False) -> List[Any]:
+        """
+        Issue several requests concurrently.
+
+        Args:
+            urls: Request URLs
+            method: HTTP method used for every request
+            decode: If True, return decoded JSON bodies instead of responses
+            return_exceptions: If True, failed requests yield their exception in
+                place of a result instead of raising
+
+        Returns:
+            Results in the same order as urls
+        """
+        async def one(url: str) -> Any:
+            response = await self.request(method, url)
+            return await self.json(response) if decode else response
+
+        return await asyncio.gather(*(one(url) for url in urls), return_exceptions=return_exceptions)
+
+
+class AsyncNFLMockClient(AsyncMockAPIClient):
+    """
+    An asyncio counterpart of NFLMockClient.
+
+    Example:
+        client = await AsyncNFLMockClient.create()
+        teams = await client.get_teams()
+        stats = await client.get_team_statistics("NFL_team_ram7VKb86QoDRToIZOIN8rH")
+    """
+
+    _client_class = NFLMockClient
+
+    def __init__(self, client: Optional[NFLMockClient] = None, executor: Optional[Executor] = None, **kwargs):
+        """
+        Initialize the AsyncNFLMockClient.
+
+        Args:
+            client: Synchronous NFLMockClient to share. Created from **kwargs when
+                omitted, which loads cassettes on the calling thread; inside a running
+                event loop use `await AsyncNFLMockClient.create(**kwargs)` instead.
+            executor: Executor for cassette loading and JSON decoding
+            **kwargs: NFLMockClient options used when client is omitted
+        """
+        super().__init__(client, executor, **kwargs)
+        self.base_url = self.client.base_url
+
+    async def get_leagues(self) -> List[Dict[str, Any]]:
+        """Get all available leagues."""
+        return await self.get_json(f"{self.base_url}/v1/leagues")
+
+    async def get_teams(self, league: str = "NFL") -> List[Dict[str, Any]]:
+        """Get all teams in a league."""
+        return await self.get_json(f"{self.base_url}/v1/leagues/{league}/teams")
+
+    async def get_team(self, team_id: str, league: str = "NFL") -> Dict[str, Any]:
+        """Get a specific team by ID."""
+        return await self.get_json(f"{self.base_url}/v1/leagues/{league}/teams/{team_id}")
+
+    async def get_team_players(self, team_id: str, league: str = "NFL") -> List[Dict[str, Any]]:
+        """Get all players for a specific team."""
+        return await self.get_json(f"{self.base_url}/v1/leagues/{league}/teams/{team_id}/players")
+
+    async def get_team_games(self, team_id: str, league: str = "NFL") -> List[Dict[str, Any]]:
+        """Get all games for a specific team."""
+        return await self.get_json(f"{self.base_url}/v1/leagues/{league}/teams/{team_id}/games")
+
+    async def get_player(self, player_id: str, league: str = "NFL") -> Dict[str, Any]:
+        """Get a specific player by ID."""
+        return await self.get_json(f"{self.base_url}/v1/leagues/{league}/players/{player_id}")
+
+    async def get_game(self, game_id: str, league: str = "NFL") -> Dict[str, Any]:
+        """Get a specific game by ID."""
+        return await self.get_json(f"{self.base_url}/v1/leagues/{league}/games/{game_id}")
+
+    async def get_all_games(self, league: str = "NFL") -> List[Dict[str, Any]]:
+        """Get all games in a league."""
+        return await self.get_json(f"{self.base_url}/v1/leagues/{league}/games")
+
+    async def get_all_players(self, league: str = "NFL") -> List[Dict[str, Any]]:
+        """Get all players in a league."""
+        data = await self.get_json(f"{self.base_url}/v1/leagues/{league}/players")
+        return data.get("players", [])
+
+    async def get_team_statistics(self, team_id: str, league: str = "NFL") -> Dict[str, Any]:
+        """
+        Get basic statistics for a team, fetching team, players and games concurrently.
+
+        Args:
+            team_id: Team identifier
+            league: League identifier (default: "NFL")
+
+        Returns:
+            Dictionary with team stats including player count, games count, etc.
+        """
+        base = f"{self.base_url}/v1/leagues/{league}/teams/{team_id}"
+        team, players, games = await self.gather_many([base, f"{base}/players", f"{base}/games"], decode=True)
+        return NFLMockClient._summarize_team(team, players, games)
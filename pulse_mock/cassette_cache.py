@@ -0,0 +1,245 @@
+"""
+Compiled cassette cache for the Pulse Mock API Client.
+
+Parsing YAML is by far the most expensive part of constructing a client. The
+cache stores each parsed cassette in a binary (pickle) form next to the
+cassettes, keyed by source path, mtime, size and format version, so warm
+starts skip YAML parsing entirely. Cold parses use the libyaml C loader when
+PyYAML was built with it.
+
+Response bodies are not pickled. They are written as UTF-8 into a separate
+body store file and memory-mapped read-only on load, so each interaction's
+body is a zero-copy memoryview addressed by (offset, length) and processes
+on one host share the same pages.
+"""
+
+import glob
+import hashlib
+import mmap
+import os
+import pickle
+import tempfile
+import uuid
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple
+
+import yaml
+
+CACHE_DIRNAME = '.pulse_mock_cache'
+CACHE_FORMAT_VERSION = 2
+
+# libyaml-backed loader when available, pure-Python SafeLoader otherwise
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def parse_cassette_file(path: str) -> Any:
+    """
+    Parse a cassette YAML file with the fastest available safe loader.
+
+    Args:
+        path: Path to the cassette file
+
+    Returns:
+        The parsed YAML document
+
+    Raises:
+        yaml.YAMLError: If the file is not valid YAML
+        OSError: If the file cannot be read
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+class BodyRef(NamedTuple):
+    """Location of a response body inside a body store file."""
+    offset: int
+    length: int
+
+
+def body_text(body: Any) -> str:
+    """
+    Return a response body as text.
+
+    Args:
+        body: Body as stored on an interaction - str, bytes or memoryview
+
+    Returns:
+        The body decoded as UTF-8 (str bodies are returned unchanged)
+    """
+    if isinstance(body, str):
+        return body
+    return str(body, 'utf-8')
+
+
+def _response_bodies(data: Any) -> List[dict]:
+    """Return the response dicts of a cassette document that carry a str body."""
+    if not isinstance(data, dict) or not isinstance(data.get('interactions'), list):
+        return []
+    responses = []
+    for interaction in data['interactions']:
+        response = interaction.get('response') if isinstance(interaction, dict) else None
+        if isinstance(response, dict) and isinstance(response.get('body'), str):
+            responses.append(response)
+    return responses
+
+
+def _map_body_store(path: str) -> memoryview:
+    """Memory-map a body store file read-only and return a view over it."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return memoryview(b'')
+        return memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+
+class CassetteCache:
+    """
+    On-disk cache of parsed cassettes.
+
+    Each source file gets one compiled entry whose header records the source's
+    absolute path, mtime, size and the cache format version; an entry is only
+    used when all of them still match. Write failures (read-only checkouts,
+    full disks) are ignored and simply leave the cache cold.
+
+    An entry is a pickle of the cassette with every response body replaced by
+    a BodyRef, plus a uniquely named body store file that the pickle points
+    at. Body stores are never rewritten in place, so a store that another
+    process has mapped stays valid until it is unlinked.
+    """
+
+    def __init__(self, cache_dir: str):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory holding compiled cassettes (created on first write)
+        """
+        self.cache_dir = cache_dir
+
+    def compiled_path(self, source_path: str) -> str:
+        """Return the path of the compiled entry for a source cassette."""
+        digest = hashlib.sha1(os.path.abspath(source_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.pickle")
+
+    def _cache_key(self, source_path: str) -> Tuple[str, int, int, int]:
+        st = os.stat(source_path)
+        return (os.path.abspath(source_path), st.st_mtime_ns, st.st_size, CACHE_FORMAT_VERSION)
+
+    def get(self, source_path: str) -> Optional[Any]:
+        """
+        Return the compiled form of a cassette if it is fresh.
+
+        Args:
+            source_path: Path to the source cassette file
+
+        Returns:
+            The cached parsed document with memory-mapped bodies, or None if
+            missing or stale
+        """
+        try:
+            key = self._cache_key(source_path)
+            with open(self.compiled_path(source_path), 'rb') as f:
+                header, store_name, data = pickle.load(f)
+            if header != key:
+                return None
+            view = _map_body_store(os.path.join(self.cache_dir, store_name)) if store_name else None
+        except Exception:
+            return None
+        for response in _body_refs(data):
+            ref = response['body']
+            response['body'] = view[ref.offset:ref.offset + ref.length]
+        return data
+
+    def put(self, source_path: str, data: Any, key: Optional[Tuple[str, int, int, int]] = None) -> None:
+        """
+        Store the compiled form of a cassette.
+
+        Args:
+            source_path: Path to the source cassette file
+            data: Parsed cassette document (left unmodified)
+            key: Cache key of the source as it was before it was parsed (see
+                load); defaults to the source's current state
+        """
+        compiled_path = self.compiled_path(source_path)
+        prefix = os.path.basename(compiled_path)[:-len('.pickle')]
+        store_name = f"{prefix}.{uuid.uuid4().hex}.bodies"
+        store_path = os.path.join(self.cache_dir, store_name)
+        tmp_path = None
+        responses = _response_bodies(data)
+        originals = [response['body'] for response in responses]
+        try:
+            if key is None:
+                key = self._cache_key(source_path)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            offset = 0
+            with open(store_path, 'wb') as store:
+                for response, body in zip(responses, originals):
+                    encoded = body.encode('utf-8')
+                    store.write(encoded)
+                    response['body'] = BodyRef(offset, len(encoded))
+                    offset += len(encoded)
+            fd, tmp_path = tempfile.mkstemp(suffix='.tmp', dir=self.cache_dir)
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump((key, store_name, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, compiled_path)
+        except Exception:
+            for path in (tmp_path, store_path):
+                try:
+                    if path:
+                        os.unlink(path)
+                except OSError:
+                    pass
+            return
+        finally:
+            for response, body in zip(responses, originals):
+                response['body'] = body
+        # Drop body stores of earlier compilations of this cassette
+        for stale in glob.glob(os.path.join(self.cache_dir, f"{prefix}.*.bodies")):
+            if os.path.basename(stale) != store_name:
+                try:
+                    os.unlink(stale)
+                except OSError:
+                    pass
+
+    def load(self, source_path: str, parse: Callable[[str], Any] = parse_cassette_file) -> Any:
+        """
+        Return a parsed cassette, using the compiled form when it is fresh.
+
+        On a miss the source is parsed and compiled, and the freshly written
+        entry is returned so bodies are memory-mapped on cold loads too. The
+        source is stat'ed before it is parsed and the entry is stored under
+        that state, so a file rewritten during the parse leaves an entry that
+        is already stale instead of old content under the new file's key.
+
+        Args:
+            source_path: Path to the source cassette file
+            parse: Function used to parse the source on a cache miss
+
+        Returns:
+            The parsed cassette document
+
+        Raises:
+            Whatever parse raises on a cache miss
+        """
+        data = self.get(source_path)
+        if data is None:
+            try:
+                key = self._cache_key(source_path)
+            except OSError:
+                key = None
+            data = parse(source_path)
+            if key is not None:
+                self.put(source_path, data, key)
+            compiled = self.get(source_path)
+            if compiled is not None:
+                data = compiled
+        return data
+
+
+def _body_refs(data: Any) -> List[dict]:
+    """Return the response dicts of a compiled document whose body is a BodyRef."""
+    if not isinstance(data, dict) or not isinstance(data.get('interactions'), list):
+        return []
+    return [
+        interaction['response'] for interaction in data['interactions']
+        if isinstance(interaction, dict) and isinstance(interaction.get('response'), dict)
+        and isinstance(interaction['response'].get('body'), BodyRef)
+    ]
@@ -1,6 +1,10 @@
-import pandas as pd
+import os
+import sys
 
-df = pd.read_csv("pulse_mock/cassettes/play_by_play_2025_filtered.csv")
-filtered = df[df["passer_player_name"].fillna('').str.lower().str.contains("j.hurts")]
-filtered.to_csv("pulse_mock/cassettes/play_by_play_2025_jhurts.csv", index=False)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from partition_players import partition_players  # noqa: E402
+
+# J. Hurts's passing plays; partition_players.py extracts any set of players in one pass
+partition_players("pulse_mock/cassettes/play_by_play_2025_filtered.csv", "pulse_mock/cassettes",
+                  roles=("passer",), players=["J.Hurts"], contains=True)
 print("Saved to pulse_mock/cassettes/play_by_play_2025_jhurts.csv")
@@ -4,40 +4,58 @@ Generate cassette YAML files from a play-by-play CSV.
 
 Usage:
   python generate_cassettes_from_csv.py [--csv PATH] [--outdir PATH] [--no-backup]
+                                        [--stream] [--max-buffered-rows N]
+                                        [--jobs N] [--force] [--dataset PATH]
 
 By default reads: pulse_mock/play_by_play_2025_jhurts.csv
 and writes to: pulse_mock/cassettes/jhurts_games/
 
 Output format matches existing cassettes: YAML with a literal JSON array
 where each play JSON object is on one line and nulls are explicit.
+
+With --stream, the CSV is read once and plays are written straight to each
+game's file instead of being collected per game first: each game is written to
+a staging file as its rows end. If a game's rows turn out not to be contiguous,
+the rest of the input is grouped through per-game spill files so at most
+--max-buffered-rows plays are held in memory, and the games already staged are
+read back from their staging files. Files are installed once the whole input
+has been read. The output is byte-identical to the default mode.
+
+Either way, only games whose content changed are rewritten: a manifest in the
+output directory records each game file's SHA-256, changed games are written
+to a temp file and atomically renamed into place (in parallel worker
+processes in the default mode, see --jobs), and an existing file is backed up
+only if no .bak with the same content exists yet.
+
+With --dataset PATH the plays are also written as a Parquet dataset (requires
+pyarrow) partitioned by season, game_id and passer_player_name in the hive
+layout, e.g. PATH/season=2025/game_id=2025_03_LA_PHI/passer_player_name=J.Hurts/.
+Plays without a passer go to passer_player_name=NONE (and games whose id has
+no season to season=0), so the whole dataset reads back with a plain
+pd.read_parquet(PATH).
+Each file keeps its column statistics, which are also collected in PATH/_metadata
+and PATH/_stats.json, so readers can skip partitions and read only the columns
+they need:
+
+  pd.read_parquet(PATH, columns=['wpa', 'qb_epa'], filters=[('passer_player_name', '==', 'J.Hurts')])
 """
 import csv
+import itertools
 import json
+import mmap
 import os
 import argparse
+import glob
+import hashlib
+import re
 import shutil
+import tempfile
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-
-KEY_ORDER = [
-    "home_team",
-    "game_seconds_remaining",
-    "yards_gained",
-    "passer_player_name",
-    "comp_air_epa",
-    "air_epa",
-    "qb_epa",
-    "receiver_player_name",
-    "comp_yac_epa",
-    "yac_epa",
-    "xyac_epa",
-    "wp",
-    "wpa",
-    "air_wpa",
-    "comp_air_wpa",
-    "yac_wpa",
-    "comp_yac_wpa"
-]
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from pulse_mock.schema import KEY_ORDER  # noqa: E402
 
 
 def parse_value(v):
@@ -52,83 +70,624 @@ def parse_value(v):
         return v
 
 
-def group_rows_by_game(csv_path):
-    groups = {}
+DEFAULT_PLAYER_ID = 'NFL_player_SyWsd7T30Oev84KlU0vKvQrU'
+
+# Columns read as text by the typed reader; every other KEY_ORDER column is float64
+STRING_COLUMNS = ('game_id', 'home_team', 'passer_player_name', 'receiver_player_name')
+
+# A CSV cell spelled like NaN, which parse_value turns into float('nan'). The
+# typed reader only treats empty cells as missing (as parse_value does), but a
+# float64 column cannot keep a parsed NaN apart from a missing value, so such
+# files are read row by row instead. NAN_CELL is matched at the start of each
+# cell holding 'nan' in any case, found in lower-cased NAN_SCAN_CHUNK-byte chunks.
+NAN_CELL = re.compile(rb'[ \t]*"?[ \t]*[+-]?nan[ \t]*"?[ \t]*(?:,|\r?$)', re.I | re.M)
+NAN_SCAN_CHUNK = 1 << 20
+
+# Plays held in memory by the unsorted streaming mode before spilling to disk
+DEFAULT_MAX_BUFFERED_ROWS = 10000
+
+# Per-game content hashes of the files written to an output directory
+MANIFEST_FILENAME = '.generate_manifest.json'
+MANIFEST_VERSION = 1
+
+# Rows per record batch handed to pyarrow when writing the --dataset output
+DEFAULT_DATASET_BATCH_ROWS = 65536
+
+# Partition values written for plays without a passer, or from a game id
+# without a season. A null partition value would be written as
+# __HIVE_DEFAULT_PARTITION__, which readers that infer the partitioning
+# (e.g. pd.read_parquet(PATH)) cannot unify with the other values.
+NO_PASSER_PARTITION = 'NONE'
+UNKNOWN_SEASON_PARTITION = 0
+
+
+def row_to_play(row):
+    # build play dict in desired order
+    play = {}
+    for k in KEY_ORDER:
+        # csv header names: game_seconds_remaining, home_team, yards_gained, passer_player_name, comp_air_epa, air_epa, wp, wpa, air_wpa, comp_air_wpa, qb_epa, xyac_epa
+        # some keys (like comp_air_epa) match directly; we map by name
+        if k in row:
+            play[k] = parse_value(row[k])
+        else:
+            # fallback mapping for keys that differ (none in this CSV)
+            play[k] = None
+    return play
+
+
+def iter_game_rows(csv_path):
+    # Yield (game_id, play) for every row with a game_id, in file order
     with open(csv_path, newline='') as f:
         reader = csv.DictReader(f)
         for row in reader:
             game_id = row.get('game_id')
             if not game_id:
                 continue
-            # build play dict in desired order
-            play = {}
-            for k in KEY_ORDER:
-                # csv header names: game_seconds_remaining, home_team, yards_gained, passer_player_name, comp_air_epa, air_epa, wp, wpa, air_wpa, comp_air_wpa, qb_epa, xyac_epa
-                # some keys (like comp_air_epa) match directly; we map by name
-                if k in row:
-                    play[k] = parse_value(row[k])
-                else:
-                    # fallback mapping for keys that differ (none in this CSV)
-                    play[k] = None
-            groups.setdefault(game_id, []).append(play)
+            yield game_id, row_to_play(row)
+
+
+def _unique_parsed(values):
+    # parse_value over a column, calling it once per distinct value
+    parsed = {v: parse_value(v) for v in set(values) if v is not None}
+    return [parsed.get(v) for v in values]
+
+
+def _has_nan_cell(data):
+    # True if a cell of the CSV bytes holds NaN text (see NAN_CELL)
+    for offset in range(0, len(data), NAN_SCAN_CHUNK):
+        # chunks overlap by two bytes so a 'nan' across a boundary is found
+        chunk = data[offset:offset + NAN_SCAN_CHUNK + 2].lower()
+        pos = chunk.find(b'nan')
+        while pos != -1:
+            start = offset + pos
+            cell = max(data.rfind(b',', 0, start), data.rfind(b'\n', 0, start)) + 1
+            if NAN_CELL.match(data, cell):
+                return True
+            pos = chunk.find(b'nan', pos + 1)
+    return False
+
+
+def read_plays_typed(csv_path):
+    # Typed, column-projected bulk read with pandas: only game_id and the
+    # KEY_ORDER columns are parsed, numeric columns straight to float64.
+    # Returns (game_ids, plays) equal to what iter_game_rows yields. Raises
+    # ImportError without pandas, and ValueError for input the declared dtypes
+    # cannot represent exactly (e.g. text or NaN cells in a numeric column).
+    import numpy as np
+    import pandas as pd
+
+    with open(csv_path, newline='') as f:
+        header = next(csv.reader(f), [])
+        if len(set(header)) != len(header):
+            raise ValueError('duplicate CSV column names')
+        if 'game_id' not in header:
+            return [], []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            if _has_nan_cell(data):
+                raise ValueError('NaN cell in the CSV')
+        columns = ['game_id'] + [k for k in KEY_ORDER if k in header]
+        f.seek(0)
+        frame = pd.read_csv(
+            f,
+            usecols=columns,
+            dtype={c: (str if c in STRING_COLUMNS else 'float64') for c in columns},
+            keep_default_na=False,
+            na_values=[''],
+            float_precision='round_trip',
+            index_col=False,
+        )
+
+    frame = frame[frame['game_id'].notna().to_numpy()]
+    size = len(frame)
+    values = []
+    for k in KEY_ORDER:
+        if k not in frame:
+            values.append([None] * size)
+            continue
+        column = frame[k]
+        if k in STRING_COLUMNS:
+            # numeric-looking text still becomes a float, as with parse_value
+            values.append(_unique_parsed(column.to_numpy(dtype=object, na_value=None).tolist()))
+            continue
+        floats = column.to_numpy().tolist()
+        for i in np.flatnonzero(column.isna().to_numpy()).tolist():
+            floats[i] = None
+        values.append(floats)
+    game_ids = frame['game_id'].tolist()
+    plays = [dict(zip(KEY_ORDER, row)) for row in zip(*values)]
+    return game_ids, plays
+
+
+def group_rows_by_game(csv_path, typed=True):
+    # With typed=True the pandas reader is used when it is installed and can
+    # read the file exactly; otherwise rows are parsed one at a time.
+    pairs = None
+    if typed:
+        try:
+            pairs = zip(*read_plays_typed(csv_path))
+        except (ImportError, ValueError):
+            pass
+    if pairs is None:
+        pairs = iter_game_rows(csv_path)
+    groups = {}
+    for game_id, play in pairs:
+        groups.setdefault(game_id, []).append(play)
     return groups
 
 
-def make_yaml_for_game(game_id, plays, player_id='NFL_player_SyWsd7T30Oev84KlU0vKvQrU'):
+def play_json(play):
+    # ensure keys are in KEY_ORDER; json.dumps will produce null for None
+    ordered = {k: play.get(k) for k in KEY_ORDER}
+    return json.dumps(ordered, ensure_ascii=False)
+
+
+def yaml_header_lines(game_id, player_id=DEFAULT_PLAYER_ID):
+    return [
+        '---',
+        'version: 1',
+        'interactions:',
+        '  - request:',
+        '      body: ""',
+        '      form: {}',
+        '      headers: {}',
+        f'      url: http://localhost:1339/v1/players/{player_id}/games/{game_id}/playbyplay',
+        '      method: GET',
+        '    response:',
+        '      body: |',
+        '        [',
+    ]
+
+
+YAML_FOOTER_LINES = [
+    '        ]',
+    '      headers:',
+    '        Content-Type:',
+    '          - application/json',
+    '      status: 200 OK',
+    '      code: 200',
+]
+
+
+def make_yaml_for_game(game_id, plays, player_id=DEFAULT_PLAYER_ID):
     # Build the YAML string with a literal block containing a JSON array where each object is one line.
-    lines = []
-    lines.append('---')
-    lines.append('version: 1')
-    lines.append('interactions:')
-    lines.append('  - request:')
-    lines.append('      body: ""')
-    lines.append('      form: {}')
-    lines.append('      headers: {}')
-    lines.append(f'      url: http://localhost:1339/v1/players/{player_id}/games/{game_id}/playbyplay')
-    lines.append('      method: GET')
-    lines.append('    response:')
-    lines.append('      body: |')
-    lines.append('        [')
+    lines = yaml_header_lines(game_id, player_id)
 
     # each play as single-line JSON
     for i, p in enumerate(plays):
-        # ensure keys are in KEY_ORDER
-        ordered = {k: p.get(k) for k in KEY_ORDER}
-        # json.dumps will produce null for None
-        obj = json.dumps(ordered, ensure_ascii=False)
         comma = ',' if i < len(plays) - 1 else ''
-        lines.append('          ' + obj + comma)
-
-    lines.append('        ]')
-    lines.append('      headers:')
-    lines.append('        Content-Type:')
-    lines.append('          - application/json')
-    lines.append('      status: 200 OK')
-    lines.append('      code: 200')
+        lines.append('          ' + play_json(p) + comma)
+
+    lines.extend(YAML_FOOTER_LINES)
     return '\n'.join(lines) + '\n'
 
 
-def write_cassettes(groups, outdir, backup=True):
+def write_yaml_for_game(f, game_id, play_lines, player_id=DEFAULT_PLAYER_ID):
+    # Streaming make_yaml_for_game: write to f from an iterable of play_json()
+    # strings, holding one play at a time. Output is identical.
+    f.write('\n'.join(yaml_header_lines(game_id, player_id)) + '\n')
+    separator = ''
+    for obj in play_lines:
+        # the comma for the previous play is only known once the next one arrives
+        f.write(separator + '          ' + obj)
+        separator = ',\n'
+    if separator:
+        f.write('\n')
+    f.write('\n'.join(YAML_FOOTER_LINES) + '\n')
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def load_manifest(outdir):
+    # game_id -> {'sha256', 'size', 'mtime_ns'} of the file last written for it
+    try:
+        with open(os.path.join(outdir, MANIFEST_FILENAME), encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get('version') != MANIFEST_VERSION or not isinstance(data.get('games'), dict):
+        return {}
+    return data['games']
+
+
+def save_manifest(outdir, games):
+    path = os.path.join(outdir, MANIFEST_FILENAME)
+    data = json.dumps({'version': MANIFEST_VERSION, 'games': games}, indent=2, sort_keys=True) + '\n'
+    tmp = _temp_path(path)
+    try:
+        with open(tmp, 'w', encoding='utf-8', newline='') as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        _remove_quietly(tmp)
+        raise
+
+
+def _temp_path(path):
+    # Hidden sibling of path, so os.replace() stays on one filesystem
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f'.{name}.{os.getpid()}.tmp')
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _record(filename, digest):
+    st = os.stat(filename)
+    return {'sha256': digest, 'size': st.st_size, 'mtime_ns': st.st_mtime_ns}
+
+
+def _current_hash(filename, entry):
+    # Hash of the file on disk, or None if it does not exist. The manifest's
+    # hash is trusted while the file's size and mtime match what was recorded.
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return None
+    if entry and entry.get('size') == st.st_size and entry.get('mtime_ns') == st.st_mtime_ns:
+        return entry.get('sha256')
+    return file_hash(filename)
+
+
+def backup_existing(filename, digest=None):
+    # Copy filename to a timestamped .bak, unless a backup with the same
+    # content already exists. Returns the backup holding its content.
+    if not os.path.exists(filename):
+        return None
+    if digest is None:
+        digest = file_hash(filename)
+    size = os.path.getsize(filename)
+    for bak in sorted(glob.glob(glob.escape(filename) + '.bak.*')):
+        if os.path.getsize(bak) == size and file_hash(bak) == digest:
+            return bak
+    ts = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
+    bak = filename + f'.bak.{ts}'
+    # a second backup within the same second must not overwrite the first
+    n = 1
+    while os.path.exists(bak):
+        bak = filename + f'.bak.{ts}.{n}'
+        n += 1
+    shutil.copy2(filename, bak)
+    return bak
+
+
+def _install(filename, tmp, digest, current, backup):
+    # Atomically move a fully written temp file over filename; content that is
+    # only being rewritten (--force) is not lost, so it is not backed up
+    if backup and current is not None and current != digest:
+        backup_existing(filename, current)
+    os.replace(tmp, filename)
+    return _record(filename, digest)
+
+
+def _write_game(job):
+    # Process pool worker: render one game and write it only if its content
+    # changed. Returns (game_id, filename, changed, manifest entry).
+    outdir, game_id, plays, entry, backup, force = job
+    filename = os.path.join(outdir, f'{game_id}.yaml')
+    data = make_yaml_for_game(game_id, plays).encode('utf-8')
+    digest = content_hash(data)
+    current = _current_hash(filename, entry)
+    if current == digest and not force:
+        return game_id, filename, False, _record(filename, digest)
+    tmp = _temp_path(filename)
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        return game_id, filename, True, _install(filename, tmp, digest, current, backup)
+    except BaseException:
+        _remove_quietly(tmp)
+        raise
+
+
+def write_cassettes(groups, outdir, backup=True, jobs=None, force=False):
+    # Write the games whose content differs from the file on disk, in a process
+    # pool, and record their hashes in the manifest. Returns the files written.
+    os.makedirs(outdir, exist_ok=True)
+    manifest = load_manifest(outdir)
+    game_jobs = [(outdir, game_id, plays, manifest.get(game_id), backup, force) for game_id, plays in groups.items()]
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1 or len(game_jobs) <= 1:
+        results = [_write_game(job) for job in game_jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_write_game, game_jobs, chunksize=max(1, len(game_jobs) // (workers * 4))))
+    written = []
+    for game_id, filename, changed, record in results:
+        manifest[game_id] = record
+        if changed:
+            written.append(filename)
+    save_manifest(outdir, manifest)
+    return written
+
+
+class _HashingWriter:
+    # Text file interface writing UTF-8 to a binary file while hashing it
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.sha256 = hashlib.sha256()
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.sha256.update(data)
+        self.raw.write(data)
+
+
+def _stage_game_file(outdir, game_id, play_lines, suffix='.staged'):
+    # Write a game's cassette to a hidden staging file next to it, returning
+    # (staging path, content hash); _commit_game_file installs it.
+    filename = os.path.join(outdir, f'{game_id}.yaml')
+    staged = _temp_path(filename) + suffix
+    try:
+        with open(staged, 'wb') as raw:
+            f = _HashingWriter(raw)
+            write_yaml_for_game(f, game_id, play_lines)
+    except BaseException:
+        _remove_quietly(staged)
+        raise
+    return staged, f.sha256.hexdigest()
+
+
+def _commit_game_file(outdir, game_id, staged, digest, entry, backup, force):
+    # Streaming _write_game: the staged file replaces the cassette only if its
+    # hash differs. Returns (filename, changed, manifest entry).
+    filename = os.path.join(outdir, f'{game_id}.yaml')
+    try:
+        current = _current_hash(filename, entry)
+        if current == digest and not force:
+            os.remove(staged)
+            return filename, False, _record(filename, digest)
+        return filename, True, _install(filename, staged, digest, current, backup)
+    except BaseException:
+        _remove_quietly(staged)
+        raise
+
+
+def _iter_staged_plays(path):
+    # The play_json() lines of a cassette written by write_yaml_for_game
+    with open(path, encoding='utf-8', newline='') as f:
+        for line in itertools.islice(f, len(yaml_header_lines('')), None):
+            line = line.rstrip('\n')
+            if line == YAML_FOOTER_LINES[0]:
+                return
+            yield line[len('          '):-1] if line.endswith(',') else line[len('          '):]
+
+
+def _spill(spill_dir, spill_files, buffered):
+    # Append each game's buffered play lines to its spill file
+    for game_id, play_lines in buffered.items():
+        path = spill_files.get(game_id)
+        if path is None:
+            path = spill_files[game_id] = os.path.join(spill_dir, f'{len(spill_files)}.jsonl')
+        with open(path, 'a', encoding='utf-8', newline='') as f:
+            f.write('\n'.join(play_lines) + '\n')
+
+
+def _iter_spilled(path):
+    if path is None:
+        return
+    with open(path, encoding='utf-8', newline='') as f:
+        for line in f:
+            yield line.rstrip('\n')
+
+
+def stream_cassettes(csv_path, outdir, backup=True, max_buffered_rows=DEFAULT_MAX_BUFFERED_ROWS, force=False):
+    # Write the same files as write_cassettes(group_rows_by_game(csv_path), ...)
+    # in one pass over the CSV without holding every game in memory.
     os.makedirs(outdir, exist_ok=True)
+    manifest = load_manifest(outdir)
     written = []
-    for game_id, plays in groups.items():
-        filename = os.path.join(outdir, f'{game_id}.yaml')
-        if backup and os.path.exists(filename):
-            ts = datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')
-            bak = filename + f'.bak.{ts}'
-            shutil.copy2(filename, bak)
-        content = make_yaml_for_game(game_id, plays)
-        with open(filename, 'w', newline='') as f:
-            f.write(content)
-        written.append(filename)
+    # game_id -> (staging path, hash) of each game whose rows have ended, in
+    # first-seen order. Nothing is installed until the whole input is read,
+    # as a game's rows may turn out not to be contiguous.
+    staged = {}
+    rows = iter_game_rows(csv_path)
+    pending = next(rows, None)
+
+    def run_lines(game_id):
+        # play_json() lines of the current run of game_id's rows
+        nonlocal pending
+        while pending is not None and pending[0] == game_id:
+            yield play_json(pending[1])
+            pending = next(rows, None)
+
+    def commit(game_id, path, digest):
+        filename, changed, manifest[game_id] = _commit_game_file(
+            outdir, game_id, path, digest, manifest.get(game_id), backup, force)
+        if changed:
+            written.append(filename)
+
+    try:
+        # Game-sorted input: write each game as its rows end, one play at a time
+        while pending is not None and pending[0] not in staged:
+            game_id = pending[0]
+            staged[game_id] = _stage_game_file(outdir, game_id, run_lines(game_id))
+        if pending is None:
+            for game_id, (path, digest) in list(staged.items()):
+                del staged[game_id]
+                commit(game_id, path, digest)
+            save_manifest(outdir, manifest)
+            return written
+
+        # A finished game has more rows, so the input is unsorted. Group the
+        # rest of it by buffering serialized plays per game and spilling the
+        # buffer to per-game files whenever it reaches max_buffered_rows; the
+        # games staged so far are read back from their staging files.
+        order = dict.fromkeys(staged)
+        buffered = {}
+        spill_files = {}
+        buffered_rows = 0
+        with tempfile.TemporaryDirectory(prefix='cassette-spill-') as spill_dir:
+            for game_id, play in itertools.chain([pending], rows):
+                order.setdefault(game_id, None)
+                buffered.setdefault(game_id, []).append(play_json(play))
+                buffered_rows += 1
+                if buffered_rows >= max_buffered_rows:
+                    _spill(spill_dir, spill_files, buffered)
+                    buffered = {}
+                    buffered_rows = 0
+            for game_id in order:
+                earlier = staged.pop(game_id, None)
+                play_lines = itertools.chain(_iter_staged_plays(earlier[0]) if earlier else (),
+                                             _iter_spilled(spill_files.get(game_id)), buffered.pop(game_id, ()))
+                try:
+                    # a different staging name, as earlier is still being read
+                    commit(game_id, *_stage_game_file(outdir, game_id, play_lines, suffix=''))
+                finally:
+                    if earlier:
+                        _remove_quietly(earlier[0])
+    finally:
+        for path, _ in staged.values():
+            _remove_quietly(path)
+    save_manifest(outdir, manifest)
     return written
 
 
+def _dataset_schema(pa):
+    fields = [pa.field('season', pa.int16()), pa.field('week', pa.int8()), pa.field('game_id', pa.string()),
+              pa.field('play_index', pa.int32())]
+    for k in KEY_ORDER:
+        fields.append(pa.field(k, pa.string() if k in STRING_COLUMNS else pa.float64()))
+    return pa.schema(fields)
+
+
+def _season_week(game_id):
+    # nflverse game ids start with SEASON_WEEK_
+    parts = game_id.split('_')
+    try:
+        return int(parts[0]), int(parts[1])
+    except (IndexError, ValueError):
+        return None, None
+
+
+def _dataset_value(k, v):
+    if v is None:
+        return None
+    if k in STRING_COLUMNS:
+        # parse_value turns numeric-looking text into a float
+        return v if isinstance(v, str) else json.dumps(v)
+    if isinstance(v, str):
+        raise ValueError(f'column {k} holds non-numeric value {v!r}; cannot write it as float64')
+    return v
+
+
+def _iter_dataset_batches(pa, schema, pairs, batch_rows):
+    columns = {name: [] for name in schema.names}
+    play_index = {}
+    for game_id, play in pairs:
+        season, week = _season_week(game_id)
+        index = play_index.get(game_id, 0)
+        play_index[game_id] = index + 1
+        columns['season'].append(UNKNOWN_SEASON_PARTITION if season is None else season)
+        columns['week'].append(week)
+        columns['game_id'].append(game_id)
+        columns['play_index'].append(index)
+        for k in KEY_ORDER:
+            columns[k].append(_dataset_value(k, play.get(k)))
+        if not columns['passer_player_name'][-1]:
+            columns['passer_player_name'][-1] = NO_PASSER_PARTITION
+        if len(columns['game_id']) >= batch_rows:
+            yield pa.RecordBatch.from_pydict(columns, schema=schema)
+            columns = {name: [] for name in schema.names}
+    if columns['game_id']:
+        yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+def _column_stats(metadata):
+    # Aggregate the Parquet row-group statistics of one file per column
+    stats = {}
+    for g in range(metadata.num_row_groups):
+        row_group = metadata.row_group(g)
+        for c in range(row_group.num_columns):
+            column = row_group.column(c)
+            entry = stats.setdefault(column.path_in_schema, {'min': None, 'max': None, 'null_count': 0})
+            s = column.statistics
+            if s is None:
+                continue
+            entry['null_count'] += s.null_count
+            if s.has_min_max:
+                entry['min'] = s.min if entry['min'] is None else min(entry['min'], s.min)
+                entry['max'] = s.max if entry['max'] is None else max(entry['max'], s.max)
+    return stats
+
+
+def write_dataset(pairs, dataset_dir, batch_rows=DEFAULT_DATASET_BATCH_ROWS):
+    # Write (game_id, play) pairs as a Parquet dataset partitioned
+    # season=/game_id=/passer_player_name= (hive layout), plus:
+    #   _metadata      Parquet summary file holding every file's row-group
+    #                  statistics, for readers that prune without opening files
+    #   _stats.json    per-file row counts and column min/max/null counts
+    # Partitions that are written replace their previous contents. Requires
+    # pyarrow; returns the written file paths relative to dataset_dir.
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    schema = _dataset_schema(pa)
+    partition_names = ['season', 'game_id', 'passer_player_name']
+    partitioning = ds.partitioning(pa.schema([schema.field(name) for name in partition_names]), flavor='hive')
+    written = []
+
+    def visit(written_file):
+        metadata = written_file.metadata
+        path = os.path.relpath(written_file.path, dataset_dir).replace(os.sep, '/')
+        metadata.set_file_path(path)
+        written.append((path, metadata))
+
+    os.makedirs(dataset_dir, exist_ok=True)
+    ds.write_dataset(
+        _iter_dataset_batches(pa, schema, pairs, batch_rows),
+        dataset_dir,
+        schema=schema,
+        format='parquet',
+        partitioning=partitioning,
+        basename_template='part-{i}.parquet',
+        existing_data_behavior='delete_matching',
+        max_partitions=1 << 20,
+        file_visitor=visit,
+    )
+    written.sort(key=lambda item: item[0])
+
+    file_schema = pa.schema([field for field in schema if field.name not in partition_names])
+    pq.write_metadata(file_schema, os.path.join(dataset_dir, '_metadata'),
+                      metadata_collector=[metadata for _, metadata in written])
+    summary = {
+        'partitioning': partition_names,
+        'files': [
+            {'path': path, 'rows': metadata.num_rows, 'columns': _column_stats(metadata)}
+            for path, metadata in written
+        ],
+    }
+    with open(os.path.join(dataset_dir, '_stats.json'), 'w', encoding='utf-8', newline='') as f:
+        json.dump(summary, f, indent=2, sort_keys=True)
+        f.write('\n')
+    return [path for path, _ in written]
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument('--csv', default=os.path.join('..', 'cassettes','play_by_play_2025_jhurts.csv'), help='Path to play-by-play CSV')
     parser.add_argument('--outdir', default=os.path.join('..', 'cassettes', 'jhurts_games'), help='Output directory for yaml cassettes')
     parser.add_argument('--no-backup', dest='backup', action='store_false', help='Disable backing up existing YAML files')
+    parser.add_argument('--stream', action='store_true', help='Write each game as it is read instead of grouping the whole CSV in memory')
+    parser.add_argument('--max-buffered-rows', type=int, default=DEFAULT_MAX_BUFFERED_ROWS, help='With --stream, plays held in memory for unsorted input before spilling to disk')
+    parser.add_argument('--jobs', type=int, default=None, help='Worker processes for writing changed games (default: CPU count)')
+    parser.add_argument('--force', action='store_true', help='Rewrite every game even if its content is unchanged')
+    parser.add_argument('--dataset', default=None, help='Also write a partitioned Parquet dataset to this directory (requires pyarrow)')
     args = parser.parse_args()
 
     csv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), args.csv))
@@ -138,12 +697,34 @@ def main():
         print('CSV not found:', csv_path)
         return 2
 
-    groups = group_rows_by_game(csv_path)
-    written = write_cassettes(groups, outdir, backup=args.backup)
-    print('Wrote', len(written), 'cassette files:')
+    dataset_dir = None
+    if args.dataset:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            print('--dataset requires pyarrow (pip install pyarrow)')
+            return 2
+        dataset_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), args.dataset))
+
+    groups = None
+    if args.stream:
+        written = stream_cassettes(csv_path, outdir, backup=args.backup, max_buffered_rows=args.max_buffered_rows,
+                                   force=args.force)
+    else:
+        groups = group_rows_by_game(csv_path)
+        written = write_cassettes(groups, outdir, backup=args.backup, jobs=args.jobs, force=args.force)
+    print('Wrote', len(written), 'changed cassette files:')
     for p in written:
         print(' -', p)
 
+    if dataset_dir is not None:
+        if groups is None:
+            pairs = iter_game_rows(csv_path)
+        else:
+            pairs = ((game_id, play) for game_id, plays in groups.items() for play in plays)
+        files = write_dataset(pairs, dataset_dir)
+        print('Wrote', len(files), 'dataset files to', dataset_dir)
+
 
 if __name__ == '__main__':
     raise SystemExit(main())
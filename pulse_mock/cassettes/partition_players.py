@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Split a play-by-play CSV into per-player extracts in a single pass.
+
+Usage:
+  python partition_players.py [--csv PATH] [--outdir PATH] [--prefix NAME]
+                              [--role passer|receiver ...] [--player NAME ...]
+                              [--contains] [--chunk-rows N]
+
+By default reads: pulse_mock/cassettes/play_by_play_2025_filtered.csv
+and writes one CSV per passer and receiver to pulse_mock/cassettes/player_extracts/,
+named PREFIX_SLUG.csv, e.g. play_by_play_2025_jhurts.csv for J.Hurts.
+
+The input is read once, in chunks of --chunk-rows rows. After each chunk the
+rows routed to every player are appended to that player's output, so memory
+stays flat however large the file is and however many players are extracted.
+Rows are copied with their original text, so an extract equals the rows of
+the input that mention the player. With --player only the given players are
+extracted (matched case-insensitively; with --contains, as a substring of the
+name as filter_jhurts.py always did), and each of them gets a file even if
+they have no plays. Outputs are written to temp files and renamed into place
+once the whole input has been read.
+"""
+import argparse
+import csv
+import os
+import re
+
+
+ROLE_COLUMNS = {
+    'passer': 'passer_player_name',
+    'receiver': 'receiver_player_name',
+}
+
+DEFAULT_CHUNK_ROWS = 10000
+
+
+def player_slug(name):
+    # J.Hurts -> jhurts, A.St. Brown -> astbrown
+    return re.sub(r'[^a-z0-9]+', '', name.lower())
+
+
+def default_prefix(csv_path):
+    # play_by_play_2025_filtered.csv -> play_by_play_2025
+    stem = os.path.splitext(os.path.basename(csv_path))[0]
+    return stem[:-len('_filtered')] if stem.endswith('_filtered') else stem
+
+
+def _route(names, players, contains):
+    # Slugs of the configured players (or of every named player when players
+    # is None) that the row's role names match
+    slugs = set()
+    for name in names:
+        if not name:
+            continue
+        if players is None:
+            slugs.add(player_slug(name))
+        elif contains:
+            lowered = name.lower()
+            slugs.update(slug for wanted, slug in players.items() if wanted in lowered)
+        else:
+            slug = players.get(name.lower())
+            if slug is not None:
+                slugs.add(slug)
+    return slugs
+
+
+def _flush(buffers, paths, header, outdir, prefix):
+    # Append each player's buffered rows to their temp output, starting the
+    # file with the header on its first flush
+    for slug, rows in buffers.items():
+        path = paths.get(slug)
+        if path is None:
+            path = paths[slug] = os.path.join(outdir, f'.{prefix}_{slug}.csv.{os.getpid()}.tmp')
+            mode = 'w'
+        else:
+            mode = 'a'
+        with open(path, mode, encoding='utf-8', newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            if mode == 'w':
+                writer.writerow(header)
+            writer.writerows(rows)
+
+
+def partition_players(csv_path, outdir, roles=('passer', 'receiver'), players=None, contains=False,
+                      prefix=None, chunk_rows=DEFAULT_CHUNK_ROWS):
+    # Write PREFIX_SLUG.csv for every player matched in the given roles and
+    # return {slug: path}.
+    if prefix is None:
+        prefix = default_prefix(csv_path)
+    wanted = None
+    if players is not None:
+        wanted = {name.lower(): player_slug(name) for name in players}
+    os.makedirs(outdir, exist_ok=True)
+    paths = {}
+    try:
+        with open(csv_path, encoding='utf-8', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            indexes = [header.index(ROLE_COLUMNS[role]) for role in roles if ROLE_COLUMNS[role] in header]
+            buffers = {}
+            buffered = 0
+            for row in reader:
+                names = [row[i] for i in indexes if i < len(row)]
+                for slug in _route(names, wanted, contains):
+                    buffers.setdefault(slug, []).append(row)
+                buffered += 1
+                if buffered >= chunk_rows:
+                    _flush(buffers, paths, header, outdir, prefix)
+                    buffers = {}
+                    buffered = 0
+            if wanted is not None:
+                # configured players get a file even without plays
+                for slug in wanted.values():
+                    buffers.setdefault(slug, [])
+            _flush(buffers, paths, header, outdir, prefix)
+        written = {}
+        for slug, tmp in sorted(paths.items()):
+            written[slug] = os.path.join(outdir, f'{prefix}_{slug}.csv')
+            os.replace(tmp, written[slug])
+            paths[slug] = None
+        return written
+    finally:
+        for tmp in paths.values():
+            if tmp is not None and os.path.exists(tmp):
+                os.remove(tmp)
+
+
+def main():
+    here = os.path.dirname(os.path.abspath(__file__))
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--csv', default=os.path.join(here, 'play_by_play_2025_filtered.csv'), help='Path to play-by-play CSV')
+    parser.add_argument('--outdir', default=os.path.join(here, 'player_extracts'), help='Output directory for the per-player CSVs')
+    parser.add_argument('--prefix', default=None, help='Output filename prefix (default: input name without _filtered)')
+    parser.add_argument('--role', dest='roles', action='append', choices=sorted(ROLE_COLUMNS), help='Roles to extract by (default: passer and receiver)')
+    parser.add_argument('--player', dest='players', action='append', help='Only extract this player, e.g. J.Hurts (repeatable)')
+    parser.add_argument('--contains', action='store_true', help='Match --player names as case-insensitive substrings')
+    parser.add_argument('--chunk-rows', type=int, default=DEFAULT_CHUNK_ROWS, help='Rows read between writes to the outputs')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.csv):
+        print('CSV not found:', args.csv)
+        return 2
+
+    written = partition_players(args.csv, args.outdir, roles=tuple(args.roles or ROLE_COLUMNS), players=args.players,
+                                contains=args.contains, prefix=args.prefix, chunk_rows=args.chunk_rows)
+    print('Wrote', len(written), 'player files to', os.path.abspath(args.outdir))
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
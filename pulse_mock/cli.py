@@ -0,0 +1,35 @@
+"""
+Command line interface for the Pulse Mock API.
+
+Usage:
+  pulse-mock serve [--host HOST] [--port PORT] [--cassette-dir DIR] [--watch SECONDS] [--no-gzip]
+"""
+
+import argparse
+from typing import List, Optional
+
+from .http_server import DEFAULT_HOST, DEFAULT_PORT, run
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='pulse-mock', description='Pulse Mock API tools')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    serve = commands.add_parser('serve', help='Serve the recorded cassettes over HTTP')
+    serve.add_argument('--host', default=DEFAULT_HOST, help=f'Interface to bind (default: {DEFAULT_HOST})')
+    serve.add_argument('--port', type=int, default=DEFAULT_PORT, help=f'Port to bind (default: {DEFAULT_PORT})')
+    serve.add_argument('--cassette-dir', default=None,
+                       help='Cassette directory, searched recursively (default: the packaged cassettes)')
+    serve.add_argument('--watch', type=float, default=None, metavar='SECONDS',
+                       help='Poll for changed and added cassettes (including in subdirectories) '
+                            'every SECONDS and serve their new contents')
+    serve.add_argument('--no-gzip', dest='gzip', action='store_false', help='Never gzip response bodies')
+
+    args = parser.parse_args(argv)
+    if args.command == 'serve':
+        run(args.host, args.port, args.cassette_dir, args.gzip, args.watch)
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
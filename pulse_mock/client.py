@@ -3,29 +3,118 @@ Main MockAPIClient implementation for handling VCR cassettes.
 """
 
 import os
+import threading
+import time
 import yaml
 import json
-from typing import Dict, List, Any, Optional, Union
-from urllib.parse import urlparse, parse_qs
+from typing import Callable, Dict, Iterator, List, Any, Optional, Tuple, Union
+from urllib.parse import urlencode, urlparse, parse_qs, parse_qsl
 
 from .exceptions import CassetteNotFoundError, RequestNotFoundError, InvalidCassetteError
+from .frozen import freeze, thaw
+from .cassette_cache import CACHE_DIRNAME, CassetteCache, body_text, parse_cassette_file
+from .manifest import CassetteManifest
+from .store import Entry, InteractionStore
+from .entities import DateLike, EntityGraph, LeagueEntities, filter_games_by_date
+from .name_index import NameIndex
+from .games import GAMES_DIRNAME, GameRepository
+from .stats import ClientStats, StatsHook, endpoint_pattern
+from .router import Params, RenderCache, RouteTrie, is_template
+from .interaction import Interaction
 
 
 class MockResponse:
-    """A mock response object that mimics requests.Response."""
+    """
+    A mock response object that mimics requests.Response.
+    
+    The body is kept exactly as the cassette store holds it - for compiled
+    cassettes a zero-copy memoryview into the memory-mapped body store - and is
+    only converted when one of content, content_bytes, text or json() is used.
+    Likewise the headers stay the store's pooled read-only dict until the
+    headers property first hands out a mutable copy.
+    """
     
-    def __init__(self, status_code: int, headers: Dict[str, Any], content: str):
+    def __init__(self, status_code: int, headers: Dict[str, Any], content: Union[str, bytes, memoryview],
+                 decoder: Optional[Callable[[], Any]] = None,
+                 on_decode: Optional[Callable[[float], None]] = None):
+        """
+        Initialize the MockResponse.
+        
+        Args:
+            status_code: HTTP status code
+            headers: Response headers (copied to a mutable dict on first access)
+            content: Response body as text, bytes or a buffer view
+            decoder: Optional callable returning the shared, read-only decoded body.
+                When omitted, json() decodes content on every call.
+            on_decode: Optional callback receiving the seconds spent in each
+                json() decode of content (not called when a decoder is used)
+        """
         self.status_code = status_code
-        self.headers = headers
-        self.content = content
-        self.text = content
+        self._headers = headers
+        self._mutable_headers: Optional[Dict[str, Any]] = None
+        self._body = content
+        self._text: Optional[str] = None
+        self._decoder = decoder
+        self._on_decode = on_decode
+    
+    @property
+    def headers(self) -> Dict[str, Any]:
+        """The response headers as a plain, mutable dict private to this response."""
+        if self._mutable_headers is None:
+            self._mutable_headers = thaw(self._headers)
+        return self._mutable_headers
+    
+    @headers.setter
+    def headers(self, headers: Dict[str, Any]) -> None:
+        self._mutable_headers = headers
+    
+    @property
+    def body(self) -> memoryview:
+        """The response body as a read-only memoryview, without copying when possible."""
+        if isinstance(self._body, str):
+            self._body = self._body.encode('utf-8')
+        return memoryview(self._body).toreadonly()
+    
+    @property
+    def content(self) -> str:
+        """The response body as text, as it always has been (same as text)."""
+        return self.text
+    
+    @property
+    def content_bytes(self) -> bytes:
+        """The response body as bytes."""
+        if isinstance(self._body, bytes):
+            return self._body
+        if isinstance(self._body, str):
+            return self._body.encode('utf-8')
+        return bytes(self._body)
+    
+    @property
+    def text(self) -> str:
+        """The response body decoded as UTF-8 text."""
+        if self._text is None:
+            self._text = body_text(self._body)
+        return self._text
         
-    def json(self) -> Dict[str, Any]:
-        """Parse response content as JSON."""
+    def json(self, copy: bool = False) -> Dict[str, Any]:
+        """
+        Parse response content as JSON.
+        
+        Args:
+            copy: If True, return a private mutable copy instead of the shared
+                read-only body (only relevant for responses with a decoder)
+        """
+        if self._decoder is not None:
+            data = self._decoder()
+            return thaw(data) if copy else data
+        start = time.perf_counter() if self._on_decode is not None else 0.0
         try:
-            return json.loads(self.content)
+            data = json.loads(self.text)
         except json.JSONDecodeError:
             raise ValueError("Response content is not valid JSON")
+        if self._on_decode is not None:
+            self._on_decode(time.perf_counter() - start)
+        return data
 
 
 class MockAPIClient:
@@ -42,25 +131,115 @@ class MockAPIClient:
         print(response.json())
     """
     
-    def __init__(self, cassette_dir: Optional[str] = None, auto_load_all: bool = False):
+    # Base URL of the recorded API, used to resolve requests made by path (e.g. by the HTTP server)
+    base_url = "http://localhost:1339"
+    
+    def __init__(self, cassette_dir: Optional[str] = None, auto_load_all: bool = False,
+                 use_manifest: bool = True, cache_dir: Optional[str] = None,
+                 use_compiled_cache: bool = True, share_decoded_json: bool = False,
+                 store: Optional[InteractionStore] = None, watch_interval: Optional[float] = None,
+                 collect_stats: bool = False, stats_hook: Optional[StatsHook] = None):
         """
         Initialize the MockAPIClient.
         
         Args:
             cassette_dir: Directory containing VCR cassette files. Defaults to cassettes/ subdirectory.
             auto_load_all: If True, automatically load all available cassettes on initialization.
+            use_manifest: If True, keep a URL -> cassette manifest sidecar in cassette_dir so
+                auto-loading reads only the cassette that records a missed URL.
+            cache_dir: Directory for compiled cassettes. Defaults to a .pulse_mock_cache/
+                subdirectory of cassette_dir.
+            use_compiled_cache: If True, load cassettes from their compiled binary form when
+                it is fresh instead of re-parsing the YAML. Response bodies are then served
+                from a memory-mapped body store rather than held as Python strings.
+            share_decoded_json: If False (the default), json() and the NFLMockClient
+                helpers return fresh, mutable dicts and lists on every call. If True, each
+                interaction's JSON body is decoded once and every caller gets the same
+                read-only FrozenDict/FrozenList (call response.json(copy=True) for a
+                mutable copy); mutating it raises TypeError.
+            store: InteractionStore holding loaded interactions. Defaults to a private store
+                for this client. Pass InteractionStore.shared(cassette_dir) to share loaded
+                cassettes with every other client of the directory that does the same;
+                clients sharing a store should be created with the same cache and
+                decoding options, as whichever client loads a cassette first decides them.
+            watch_interval: If set, poll the cassette directory every watch_interval seconds
+                in a background thread and hot-reload cassettes that change on disk
+                (see reload_changed_cassettes).
+            collect_stats: If True, record counters and latency histograms for cassette
+                loads, request matching and JSON decoding (see stats()).
+            stats_hook: Optional callable invoked as stats_hook(event, fields) for every
+                recorded stat; implies collect_stats.
         """
         if cassette_dir is None:
             # Default to cassettes/ subdirectory relative to the pulse_mock package
             current_dir = os.path.dirname(__file__)
             cassette_dir = os.path.join(current_dir, 'cassettes')
         self.cassette_dir = cassette_dir
-        self.interactions: List[Dict[str, Any]] = []
-        self.loaded_cassettes: List[str] = []
+        # Loaded interactions and their (METHOD, normalized URL) index live in the
+        # store, which is updated incrementally by load_cassette and safe to share.
+        self.store = store if store is not None else InteractionStore()
         self._available_cassettes: Optional[List[str]] = None
+        self.use_manifest = use_manifest
+        if cache_dir is None:
+            cache_dir = os.path.join(cassette_dir, CACHE_DIRNAME)
+        self._cassette_cache: Optional[CassetteCache] = CassetteCache(cache_dir) if use_compiled_cache else None
+        self.share_decoded_json = share_decoded_json
+        self.auto_load_all = auto_load_all
+        self._watch_stop: Optional[threading.Event] = None
+        self._stats: Optional[ClientStats] = None
+        # (snapshot version, templated routes, rendered responses)
+        self._router: Optional[Tuple[int, RouteTrie, RenderCache]] = None
+        if collect_stats or stats_hook is not None:
+            self.enable_stats(stats_hook)
         
         if auto_load_all:
             self.load_all_available_cassettes()
+        if watch_interval is not None:
+            self.start_watching(watch_interval)
+    
+    def enable_stats(self, hook: Optional[StatsHook] = None) -> None:
+        """
+        Start collecting instrumentation, discarding anything recorded before.
+        
+        Args:
+            hook: Optional callable invoked as hook(event, fields) for every recorded stat
+        """
+        self._stats = ClientStats(hook)
+    
+    def disable_stats(self) -> None:
+        """Stop collecting instrumentation."""
+        self._stats = None
+    
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return a snapshot of the instrumentation collected by this client.
+        
+        Timings are histograms in milliseconds: 'load' per cassette, 'match' and
+        'decode' per endpoint pattern (e.g. /v1/leagues/{id}/teams/{id}).
+        Counters cover requests and misses per endpoint, decoded-body cache hits
+        and misses, auto-load scans and the cassettes they read, and compiled
+        cassette cache hits and misses. 'bodies' reports response body interning
+        across the loaded interactions (see InteractionStore.body_stats) and is
+        filled in even while instrumentation is disabled.
+        
+        Returns:
+            {'enabled': bool, 'timings': {...}, 'counters': {...}, 'bodies': {...}};
+            timings and counters are empty while instrumentation is disabled
+        """
+        stats = self._stats
+        if stats is None:
+            return {'enabled': False, 'timings': {}, 'counters': {}, 'bodies': self.store.body_stats()}
+        return {'enabled': True, **stats.snapshot(), 'bodies': self.store.body_stats()}
+    
+    @property
+    def interactions(self) -> Tuple[Interaction, ...]:
+        """All loaded interactions, in load order."""
+        return self.store.snapshot.interactions
+    
+    @property
+    def loaded_cassettes(self) -> Tuple[str, ...]:
+        """Names of the loaded cassettes, in load order."""
+        return self.store.snapshot.loaded_cassettes
     
     def discover_available_cassettes(self) -> List[str]:
         """
@@ -89,37 +268,71 @@ class MockAPIClient:
             except (CassetteNotFoundError, InvalidCassetteError) as e:
                 print(f"Warning: Could not load cassette {cassette}: {e}")
     
-    def auto_load_cassette_for_url(self, url: str) -> bool:
+    def get_manifest(self) -> CassetteManifest:
+        """
+        Return the URL -> cassette manifest, refreshing it on first use.
+        
+        The manifest is refreshed against the same directory listing that
+        discover_available_cassettes() caches, so only cassettes that are new or
+        have changed since the sidecar was written are parsed.
+        
+        Returns:
+            The CassetteManifest for this client's cassette directory
+        """
+        def build() -> CassetteManifest:
+            manifest = CassetteManifest(self.cassette_dir)
+            manifest.refresh(self.discover_available_cassettes(), self._read_cassette_routes)
+            return manifest
+        
+        return self.store.get_manifest(build)
+    
+    def _read_cassette_routes(self, cassette_name: str) -> List[Tuple[str, str]]:
+        """Return the (METHOD, normalized URL) pairs recorded in a cassette."""
+        cassette_data = self._read_cassette(cassette_name)
+        routes = []
+        for interaction in cassette_data['interactions']:
+            request = interaction.get('request', {})
+            routes.append((request.get('method', '').upper(), self._normalize_url(request.get('url', ''))))
+        return routes
+    
+    def auto_load_cassette_for_url(self, url: str, method: Optional[str] = None) -> bool:
         """
         Attempt to automatically load a cassette that might contain the requested URL.
         
+        With the manifest enabled only the cassettes recording the URL are read;
+        a URL that no cassette records fails without touching the cassette files.
+        
         Args:
             url: The request URL to match against
+            method: Optional HTTP method used to narrow the manifest lookup
             
         Returns:
             True if a potentially matching cassette was loaded, False otherwise
         """
         # If we already have interactions that might match, don't load more
         normalized_url = self._normalize_url(url)
-        for interaction in self.interactions:
-            request = interaction.get('request', {})
-            interaction_url = self._normalize_url(request.get('url', ''))
-            if interaction_url == normalized_url:
-                return True
+        if self.store.has_url(normalized_url):
+            return True
+        
+        stats = self._stats
+        if stats is not None:
+            stats.count('auto_load_scans', endpoint_pattern(url))
         
         # Try to load cassettes that haven't been loaded yet
-        available = self.discover_available_cassettes()
+        if self.use_manifest:
+            available = self.get_manifest().find(normalized_url, method)
+        else:
+            available = self.discover_available_cassettes()
         unloaded = [c for c in available if c not in self.loaded_cassettes]
         
         for cassette in unloaded:
             try:
                 self.load_cassette(cassette)
+                if stats is not None:
+                    stats.count('auto_load_reads', cassette)
                 # Check if this cassette contains our URL
-                for interaction in self.interactions:
-                    request = interaction.get('request', {})
-                    interaction_url = self._normalize_url(request.get('url', ''))
-                    if interaction_url == normalized_url:
-                        return True
+                if self.store.has_url(normalized_url):
+                    return True
             except (CassetteNotFoundError, InvalidCassetteError):
                 continue
         
@@ -129,6 +342,9 @@ class MockAPIClient:
         """
         Load a VCR cassette file.
         
+        Loading is idempotent and thread-safe: a cassette already in the store is
+        not read again, and concurrent loads of one cassette read it only once.
+        
         Args:
             cassette_name: Name of the cassette file (with or without .yaml extension)
             
@@ -139,14 +355,123 @@ class MockAPIClient:
         if not cassette_name.endswith('.yaml') and not cassette_name.endswith('.yml'):
             cassette_name += '.yaml'
             
+        self.store.load(cassette_name, lambda: self._read_cassette_entries(cassette_name))
+    
+    def _cassette_signature(self, cassette_name: str) -> Optional[Tuple[int, int]]:
+        """Return a cassette file's (mtime_ns, size), or None if it does not exist."""
+        try:
+            st = os.stat(os.path.join(self.cassette_dir, cassette_name))
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
+    def _read_cassette_entries(self, cassette_name: str) -> Tuple[Optional[Tuple[int, int]], List[Entry]]:
+        """Read a cassette and return its file signature and index entries."""
+        # Stat before reading so a write racing the read is picked up by the next reload
+        signature = self._cassette_signature(cassette_name)
+        stats = self._stats
+        if stats is None:
+            return signature, self._index_entries(self._read_cassette(cassette_name)['interactions'], cassette_name)
+        start = time.perf_counter()
+        entries = self._index_entries(self._read_cassette(cassette_name)['interactions'], cassette_name)
+        stats.timing('load', cassette_name, time.perf_counter() - start)
+        return signature, entries
+    
+    def reload_changed_cassettes(self) -> List[str]:
+        """
+        Pick up cassette files that changed on disk since they were loaded.
+        
+        The directory listing and manifest are refreshed, then only the loaded
+        cassettes whose mtime or size changed are re-read, and their interactions
+        are swapped into the store in one atomic update. Deleted cassettes are
+        unloaded. With auto_load_all, cassettes new to the directory are loaded
+        as well; otherwise they are found by auto-loading on first request.
+        
+        A cassette that cannot be parsed, or that changes again while it is being
+        read (e.g. a writer is still rewriting it), keeps serving its previous
+        contents and is retried on the next call.
+        
+        Returns:
+            Names of the cassettes that were reloaded, unloaded or newly loaded
+        """
+        self._available_cassettes = None
+        self.store.reset_manifest()
+        
+        changes: Dict[str, Optional[Tuple[Optional[Tuple[int, int]], List[Entry]]]] = {}
+        for cassette_name in self.loaded_cassettes:
+            signature = self._cassette_signature(cassette_name)
+            if signature == self.store.signature(cassette_name):
+                continue
+            if signature is None:
+                changes[cassette_name] = None
+                continue
+            try:
+                entries = self._read_cassette_entries(cassette_name)
+            except (CassetteNotFoundError, InvalidCassetteError):
+                continue
+            if entries[0] == self._cassette_signature(cassette_name):
+                changes[cassette_name] = entries
+        changed = self.store.replace(changes) if changes else []
+        
+        if self.auto_load_all:
+            for cassette in self.discover_available_cassettes():
+                if cassette not in self.loaded_cassettes:
+                    try:
+                        if self.store.load(cassette, lambda: self._read_cassette_entries(cassette)):
+                            changed.append(cassette)
+                    except (CassetteNotFoundError, InvalidCassetteError):
+                        continue
+        return changed
+    
+    def start_watching(self, interval: float = 1.0) -> None:
+        """
+        Start polling the cassette directory for changes in a daemon thread.
+        
+        Every interval seconds the thread calls reload_changed_cassettes(). Calling
+        this while already watching restarts the poller with the new interval.
+        
+        Args:
+            interval: Seconds between polls
+        """
+        self.stop_watching()
+        stop = self._watch_stop = threading.Event()
+        
+        def poll() -> None:
+            while not stop.wait(interval):
+                try:
+                    self.reload_changed_cassettes()
+                except Exception as e:
+                    print(f"Warning: Could not reload cassettes in {self.cassette_dir}: {e}")
+        
+        threading.Thread(target=poll, name='pulse-mock-watcher', daemon=True).start()
+    
+    def stop_watching(self) -> None:
+        """Stop the background poller started by start_watching(), if any."""
+        if self._watch_stop is not None:
+            self._watch_stop.set()
+            self._watch_stop = None
+    
+    def _read_cassette(self, cassette_name: str) -> Dict[str, Any]:
+        """
+        Read and validate a cassette file without loading it into the client.
+        
+        Args:
+            cassette_name: Name of the cassette file, including its extension
+            
+        Returns:
+            Parsed cassette dictionary containing an 'interactions' list
+            
+        Raises:
+            CassetteNotFoundError: If the cassette file cannot be found
+            InvalidCassetteError: If the cassette file is malformed
+        """
         cassette_path = os.path.join(self.cassette_dir, cassette_name)
         
         if not os.path.exists(cassette_path):
             raise CassetteNotFoundError(f"Cassette file not found: {cassette_path}")
             
         try:
-            with open(cassette_path, 'r', encoding='utf-8') as f:
-                cassette_data = yaml.safe_load(f)
+            cassette_data = self._parse_cassette_path(cassette_path)
         except yaml.YAMLError as e:
             raise InvalidCassetteError(f"Invalid YAML in cassette {cassette_name}: {e}")
         except Exception as e:
@@ -154,9 +479,56 @@ class MockAPIClient:
             
         if not isinstance(cassette_data, dict) or 'interactions' not in cassette_data:
             raise InvalidCassetteError(f"Invalid cassette format in {cassette_name}")
-            
-        self.interactions.extend(cassette_data['interactions'])
-        self.loaded_cassettes.append(cassette_name)
+        
+        return cassette_data
+    
+    def _parse_cassette_path(self, cassette_path: str) -> Any:
+        """Parse a cassette file, going through the compiled cache when enabled."""
+        if self._cassette_cache is None:
+            return parse_cassette_file(cassette_path)
+        stats = self._stats
+        if stats is not None:
+            data = self._cassette_cache.get(cassette_path)
+            if data is not None:
+                stats.count('compiled_cache_hits', os.path.basename(cassette_path))
+                return data
+            stats.count('compiled_cache_misses', os.path.basename(cassette_path))
+        return self._cassette_cache.load(cassette_path)
+    
+    def _index_entries(self, interactions: List[Dict[str, Any]], cassette_name: str) -> List[Entry]:
+        """
+        Convert cassette interactions to Interaction records paired with their lookup keys.
+        
+        Every interaction is keyed by (METHOD, normalized URL). Interactions
+        recorded with a query string are also keyed by the normalized URL plus
+        the canonical query, so recorded pages of a paginated endpoint can be
+        told apart. The store never overwrites an existing key, so the first
+        recorded match wins, as with a linear scan. Bodies are interned in the
+        store's body pool, so identical bodies across cassettes share one buffer,
+        and headers in its header pool.
+        
+        Raises:
+            InvalidCassetteError: If an interaction in the cassette is malformed
+        """
+        entries = []
+        intern_body = self.store.bodies.intern
+        header_pool = self.store.headers
+        for interaction in interactions:
+            try:
+                interaction = Interaction.from_dict(interaction, header_pool)
+            except (AttributeError, TypeError, ValueError) as e:
+                raise InvalidCassetteError(f"Invalid interaction in cassette {cassette_name}: {e}")
+            interaction.body = intern_body(interaction.body)
+            method = interaction.method
+            url = interaction.url
+            normalized_url = self._normalize_url(url)
+            query = self._canonical_query(url)
+            if query:
+                keys = ((method, normalized_url), (method, f"{normalized_url}?{query}"))
+            else:
+                keys = ((method, normalized_url),)
+            entries.append((keys, interaction))
+        return entries
         
     def load_cassettes(self, cassette_names: List[str]) -> None:
         """
@@ -172,6 +544,12 @@ class MockAPIClient:
         """Normalize URL for matching by removing query parameters and fragments."""
         parsed = urlparse(url)
         return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+    
+    def _canonical_query(self, url: str) -> str:
+        """Return the URL's query string with parameters sorted, or '' if it has none."""
+        if '?' not in url:
+            return ''
+        return urlencode(sorted(parse_qsl(urlparse(url).query, keep_blank_values=True)))
         
     def _normalize_headers(self, headers: Optional[Dict[str, Any]]) -> Dict[str, str]:
         """Normalize headers for case-insensitive matching."""
@@ -179,7 +557,20 @@ class MockAPIClient:
             return {}
         return {k.lower(): str(v) for k, v in headers.items()}
         
-    def _match_request(self, method: str, url: str, headers: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def _lookup_interaction(self, method: str, normalized_url: str, query: str = '') -> Optional[Interaction]:
+        """
+        Return the loaded interaction for an upper-cased method and normalized URL, if any.
+        
+        An interaction recorded with exactly the same (canonical) query string is
+        preferred; otherwise the query is ignored.
+        """
+        if query:
+            interaction = self.store.lookup((method, f"{normalized_url}?{query}"))
+            if interaction is not None:
+                return interaction
+        return self.store.lookup((method, normalized_url))
+        
+    def _match_request(self, method: str, url: str, headers: Optional[Dict[str, Any]] = None) -> Interaction:
         """
         Find a matching interaction for the given request.
         
@@ -189,63 +580,189 @@ class MockAPIClient:
             headers: Request headers
             
         Returns:
-            Matching interaction dictionary
+            Matching Interaction
             
         Raises:
             RequestNotFoundError: If no matching interaction is found
         """
         normalized_url = self._normalize_url(url)
+        query = self._canonical_query(url)
         normalized_headers = self._normalize_headers(headers)
         method = method.upper()
         
         # First try: match against already loaded interactions
-        for interaction in self.interactions:
-            request = interaction.get('request', {})
-            
-            # Match method
-            if request.get('method', '').upper() != method:
-                continue
-                
-            # Match URL (normalized)
-            interaction_url = self._normalize_url(request.get('url', ''))
-            if interaction_url != normalized_url:
-                continue
-                
-            # If we get here, we have a match
+        interaction = self._lookup_interaction(method, normalized_url, query)
+        if interaction is not None:
             return interaction
         
         # Second try: attempt to auto-load cassettes for this URL
-        if self.auto_load_cassette_for_url(url):
+        if self.auto_load_cassette_for_url(url, method):
             # Try matching again after loading new cassettes
-            for interaction in self.interactions:
-                request = interaction.get('request', {})
-                
-                # Match method
-                if request.get('method', '').upper() != method:
-                    continue
-                    
-                # Match URL (normalized)
-                interaction_url = self._normalize_url(request.get('url', ''))
-                if interaction_url != normalized_url:
-                    continue
-                    
-                # If we get here, we have a match
+            interaction = self._lookup_interaction(method, normalized_url, query)
+            if interaction is not None:
                 return interaction
+        
+        # Third try: templated routes, loading the cassettes that declare them if needed
+        interaction = self._match_route(method, normalized_url)
+        if interaction is None and self._load_route_cassettes():
+            interaction = self._match_route(method, normalized_url)
+        if interaction is not None:
+            return interaction
             
         raise RequestNotFoundError(
             f"No matching interaction found for {method} {url}. "
             f"Loaded {len(self.interactions)} interactions from cassettes: {', '.join(self.loaded_cassettes)}"
         )
         
-    def _create_response(self, interaction: Dict[str, Any]) -> MockResponse:
+    def _route_table(self) -> Tuple[int, RouteTrie, RenderCache]:
+        """Return the templated routes of the loaded cassettes, recompiled when the store changes."""
+        snapshot = self.store.snapshot
+        router = self._router
+        if router is None or router[0] != snapshot.version:
+            routes = []
+            for interaction in snapshot.interactions:
+                if is_template(interaction.url):
+                    routes.append((interaction.method, urlparse(interaction.url).path, interaction))
+            router = self._router = (snapshot.version, RouteTrie(routes),
+                                     RenderCache(on_evict=self.store.forget_decoded))
+        return router
+    
+    def _load_route_cassettes(self) -> bool:
+        """Load the not yet loaded cassettes that declare templated routes; True if any were loaded."""
+        if self.use_manifest:
+            candidates = self.get_manifest().templated()
+        else:
+            candidates = self.discover_available_cassettes()
+        # the snapshot's cassette dict is keyed by the loaded cassette names
+        already_loaded = self.store.snapshot.cassettes
+        loaded = False
+        for cassette in [c for c in candidates if c not in already_loaded]:
+            try:
+                self.load_cassette(cassette)
+                loaded = True
+            except (CassetteNotFoundError, InvalidCassetteError):
+                continue
+        return loaded
+    
+    def has_route(self, method: str, url: str) -> bool:
+        """
+        Return True if a templated route of the loaded cassettes matches the request.
+        
+        Only the compiled route table is consulted; nothing is loaded or rendered.
+        """
+        _, trie, _ = self._route_table()
+        return bool(trie.size) and trie.match(method.upper(), urlparse(url).path) is not None
+    
+    def match_route(self, method: str, url: str) -> Optional[Interaction]:
+        """
+        Render the templated route of the loaded cassettes that matches a request.
+        
+        Rendering can load cassettes and build the entity graph, so this may
+        block for a while; the HTTP server calls it from an executor.
+        
+        Returns:
+            The rendered interaction, or None if no templated route matches
+        """
+        return self._match_route(method.upper(), self._normalize_url(url))
+    
+    def _match_route(self, method: str, normalized_url: str) -> Optional[Interaction]:
+        """
+        Match a request against the templated routes and render its interaction.
+        
+        Rendered interactions are cached per request until the store changes, so
+        repeated requests share one interaction (and its decoded body).
+        
+        Returns:
+            An interaction whose request URL is the concrete URL, or None if no
+            template matches or it cannot be rendered for the captured parameters
+        """
+        _, trie, rendered = self._route_table()
+        if not trie.size:
+            return None
+        key = (method, normalized_url)
+        interaction = rendered.get(key)
+        if interaction is not None:
+            return interaction
+        match = trie.match(method, urlparse(normalized_url).path)
+        if match is None:
+            return None
+        template, params = match
+        body = self._render_route(template, params)
+        if body is None:
+            return None
+        interaction = Interaction(template.method, normalized_url, template.status_code, template.headers,
+                                  body.encode('utf-8'), headers_view=template.headers_dict())
+        rendered.put(key, interaction)
+        return interaction
+    
+    def _render_route(self, template: Interaction, params: Params) -> Optional[str]:
+        """
+        Render the response body of a templated interaction.
+        
+        Each {name} in the recorded body is replaced by the captured parameter,
+        JSON-string escaped, so templates can be written as JSON.
+        
+        Returns:
+            The body text, or None if the template cannot be rendered
+        """
+        if template.render is not None:
+            return None
+        body = body_text(template.body)
+        for name, value in params.items():
+            body = body.replace(f"{{{name}}}", json.dumps(value)[1:-1])
+        return body
+    
+    def _create_response(self, interaction: Interaction) -> MockResponse:
         """Create a MockResponse from an interaction."""
-        response_data = interaction.get('response', {})
+        decoder = None
+        on_decode = None
+        if self.share_decoded_json:
+            decoder = lambda: self._decode_body(interaction)
+        elif self._stats is not None:
+            on_decode = lambda secs: self._record_decode(interaction, secs)
+        return MockResponse(interaction.status_code, interaction.headers_dict(), interaction.body,
+                            decoder, on_decode)
+    
+    def _record_decode(self, interaction: Interaction, secs: float) -> None:
+        """Record a json() decode of an unshared response body; each one is a miss."""
+        stats = self._stats
+        if stats is not None:
+            pattern = endpoint_pattern(interaction.url)
+            stats.timing('decode', pattern, secs)
+            stats.count('decode_misses', pattern)
+    
+    def _decode_body(self, interaction: Interaction) -> Any:
+        """
+        Return the decoded JSON body of an interaction, decoding it at most once.
+        
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        stats = self._stats
+        if stats is None:
+            return self.store.get_decoded(interaction, self._decode_interaction)
         
-        status_code = response_data.get('code', 200)
-        headers = response_data.get('headers', {})
-        body = response_data.get('body', '')
+        pattern = endpoint_pattern(interaction.url)
+        decoded = False
         
-        return MockResponse(status_code, headers, body)
+        def decode(interaction: Interaction) -> Any:
+            nonlocal decoded
+            start = time.perf_counter()
+            data = self._decode_interaction(interaction)
+            stats.timing('decode', pattern, time.perf_counter() - start)
+            decoded = True
+            return data
+        
+        data = self.store.get_decoded(interaction, decode)
+        stats.count('decode_misses' if decoded else 'decode_hits', pattern)
+        return data
+    
+    @staticmethod
+    def _decode_interaction(interaction: Interaction) -> Any:
+        try:
+            return freeze(json.loads(body_text(interaction.body)))
+        except json.JSONDecodeError:
+            raise ValueError("Response content is not valid JSON")
         
     def request(self, method: str, url: str, headers: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
         """
@@ -260,8 +777,54 @@ class MockAPIClient:
         Returns:
             MockResponse object
         """
-        interaction = self._match_request(method, url, headers)
+        if self._stats is None:
+            interaction = self._match_request(method, url, headers)
+        else:
+            interaction = self._timed_match_request(method, url, headers)
+        return self._create_response(interaction)
+    
+    def try_request(self, method: str, url: str, headers: Optional[Dict[str, Any]] = None) -> Optional[MockResponse]:
+        """
+        Answer a request from the already loaded interactions only.
+        
+        Never reads cassettes or renders templated routes, so it does not block;
+        async front-ends call it on the event loop and fall back to request()
+        in an executor when it returns None.
+        
+        Args:
+            method: HTTP method
+            url: Request URL
+            headers: Request headers
+            
+        Returns:
+            MockResponse object, or None if answering needs more than a lookup
+        """
+        stats = self._stats
+        start = time.perf_counter() if stats is not None else 0.0
+        interaction = self._lookup_interaction(method.upper(), self._normalize_url(url), self._canonical_query(url))
+        if interaction is None:
+            return None
+        if stats is not None:
+            pattern = endpoint_pattern(url)
+            stats.count('requests', pattern)
+            stats.timing('match', pattern, time.perf_counter() - start)
         return self._create_response(interaction)
+    
+    def _timed_match_request(self, method: str, url: str, headers: Optional[Dict[str, Any]] = None) -> Interaction:
+        """_match_request, recording match time and request/miss counts."""
+        stats = self._stats
+        if stats is None:
+            return self._match_request(method, url, headers)
+        pattern = endpoint_pattern(url)
+        stats.count('requests', pattern)
+        start = time.perf_counter()
+        try:
+            return self._match_request(method, url, headers)
+        except RequestNotFoundError:
+            stats.count('request_misses', pattern)
+            raise
+        finally:
+            stats.timing('match', pattern, time.perf_counter() - start)
         
     def get(self, url: str, headers: Optional[Dict[str, Any]] = None, **kwargs) -> MockResponse:
         """Make a GET request."""
@@ -283,15 +846,23 @@ class MockAPIClient:
         """Make a PATCH request."""
         return self.request('PATCH', url, headers, **kwargs)
         
+    def _export(self, data: Any) -> Any:
+        """Return data decoded from the shared cache as is, or as a mutable copy unless sharing."""
+        return data if self.share_decoded_json else thaw(data)
+    
     def clear_cassettes(self) -> None:
-        """Clear all loaded cassettes and interactions."""
-        self.interactions.clear()
-        self.loaded_cassettes.clear()
+        """
+        Clear all loaded cassettes and interactions.
+        
+        This clears the client's store; clients that were given the same store
+        (e.g. InteractionStore.shared) are cleared too.
+        """
+        self.store.clear()
         
     def list_interactions(self) -> List[str]:
         """Return a list of all loaded interactions as human-readable strings."""
         return [
-            f"{interaction['request']['method']} {interaction['request']['url']}"
+            f"{interaction.method} {interaction.url}"
             for interaction in self.interactions
         ]
 
@@ -333,46 +904,147 @@ class NFLMockClient(MockAPIClient):
         all_players = client.get_all_players()
     """
     
-    def __init__(self, cassette_dir: Optional[str] = None, auto_load_all: bool = True):
+    def __init__(self, cassette_dir: Optional[str] = None, auto_load_all: bool = True, **kwargs):
         """
         Initialize the NFLMockClient.
         
         Args:
             cassette_dir: Directory containing VCR cassette files
             auto_load_all: Whether to automatically load all available cassettes on initialization
+            **kwargs: Additional MockAPIClient options (use_manifest, cache_dir, ...)
         """
-        super().__init__(cassette_dir, auto_load_all=auto_load_all)
+        super().__init__(cassette_dir, auto_load_all=auto_load_all, **kwargs)
+        self.game_repository = GameRepository(os.path.join(self.cassette_dir, GAMES_DIRNAME),
+                                              self._parse_cassette_path, share=self.share_decoded_json)
         self.base_url = "http://localhost:1339"
+        self._entity_graph: Optional[EntityGraph] = None
+    
+    def get_entities(self, league: str = "NFL") -> Optional[LeagueEntities]:
+        """
+        Get the indexed teams, players and games of a league.
+        
+        The entity graph is built from the loaded league endpoints the first time
+        it is needed and rebuilt only after more cassettes are loaded.
+        
+        Args:
+            league: League identifier (default: "NFL")
+            
+        Returns:
+            LeagueEntities for the league, or None if nothing was recorded for it
+        """
+        snapshot = self.store.snapshot
+        graph = self._entity_graph
+        if graph is None or graph.version != snapshot.version:
+            prefix = f"{self.base_url}/v1/leagues/"
+            bodies = [
+                (url[len(prefix):].split('/'), lambda interaction=interaction: self._decode_body(interaction))
+                for (method, url), interaction in snapshot.index.items()
+                if method == 'GET' and url.startswith(prefix) and '?' not in url and '{' not in url
+            ]
+            graph = EntityGraph.build(bodies, snapshot.version)
+            self._entity_graph = graph
+        return graph.league(league)
 
+    def _render_route(self, template: Interaction, params: Params) -> Optional[str]:
+        """
+        Render a templated interaction, from entity data when it declares a source.
+        
+        A templated response may set `render` instead of a body. The source is
+        looked up in the entity graph of the captured {league} (default NFL):
+        teams, team ({teamId}), team_players ({teamId}), team_games ({teamId}),
+        players, player ({playerId}), games or game ({gameId}). Unknown ids do
+        not match, so the request fails like an unrecorded URL. Every available
+        cassette is loaded first, so the entity graph is complete.
+        """
+        source = template.render
+        if source is None:
+            return super()._render_route(template, params)
+        if not set(self.discover_available_cassettes()).issubset(self.loaded_cassettes):
+            self.load_all_available_cassettes()
+        entities = self.get_entities(params.get('league', 'NFL'))
+        if entities is None:
+            return None
+        data = self._ROUTE_SOURCES.get(source, lambda entities, params: None)(entities, params)
+        return json.dumps(data) if data is not None else None
+    
+    _ROUTE_SOURCES: Dict[str, Callable[[LeagueEntities, Params], Any]] = {
+        'teams': lambda entities, params: entities.teams,
+        'team': lambda entities, params: entities.teams_by_id.get(params.get('teamId')),
+        'team_players': lambda entities, params: entities.players_by_team.get(
+            params.get('teamId'), [] if params.get('teamId') in entities.teams_by_id else None),
+        'team_games': lambda entities, params: entities.games_by_team.get(
+            params.get('teamId'), [] if params.get('teamId') in entities.teams_by_id else None),
+        'players': lambda entities, params: (
+            {'players': entities.players} if entities.players is not None else None),
+        'player': lambda entities, params: entities.players_by_id.get(params.get('playerId')),
+        'games': lambda entities, params: entities.games,
+        'game': lambda entities, params: entities.games_by_id.get(params.get('gameId')),
+    }
+    
     def get_game_data(self) -> List[Dict[str, Any]]:
         """
         Load all Jalen Hurts game YAML files from cassettes/jhurts_games, extract play-by-play JSON, and return as list of games.
-        Each returned dict has keys: 'game_name', 'plays' (list of dicts)
-        """
-        import glob
-        jhurts_games_dir = os.path.join(self.cassette_dir, 'jhurts_games')
-        if not os.path.exists(jhurts_games_dir):
-            return []
-        game_files = glob.glob(os.path.join(jhurts_games_dir, '*.yaml'))
-        games = []
-        for game_file in game_files:
-            with open(game_file, 'r', encoding='utf-8') as f:
-                cassette = yaml.safe_load(f)
-            # Find the first interaction with a response body
-            for interaction in cassette.get('interactions', []):
-                response = interaction.get('response', {})
-                body = response.get('body', None)
-                if body:
-                    try:
-                        plays = json.loads(body)
-                    except Exception:
-                        plays = []
-                    games.append({
-                        'game_name': os.path.basename(game_file),
-                        'plays': plays
-                    })
-                    break
-        return games
+        Each returned dict has keys: 'game_name', 'plays' (list of dicts), plus 'game_id', 'season' and 'week'.
+        
+        Games are sorted by season and week. Cassettes are parsed on first use and
+        cached until they change on disk, so repeated calls are cheap. Each call
+        returns mutable copies unless the client was created with share_decoded_json=True.
+        """
+        return self.game_repository.load_all()
+    
+    def iter_game_data(self) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily iterate over the games returned by get_game_data(), in season/week order.
+        
+        Each game cassette is only read when the iteration reaches it.
+        """
+        return self.game_repository.iter_game_data()
+    
+    def get_game_plays(self, game_id: str) -> List[Dict[str, Any]]:
+        """
+        Get the play-by-play of one game by its id, reading only that game's cassette.
+        
+        Args:
+            game_id: nflverse game id, e.g. "2025_03_LA_PHI"
+            
+        Returns:
+            List of play dictionaries
+            
+        Raises:
+            KeyError: If there is no cassette for the game
+        """
+        return self.game_repository.get_game_plays(game_id)
+    
+    def get_game_columns(self, game_id: str):
+        """
+        Get the play-by-play of one game as columns (requires NumPy).
+        
+        Returns a pulse_mock.play_store.PlayColumns with one float64 array per numeric
+        KEY_ORDER column and categorical-coded string columns, built once per game.
+        
+        Args:
+            game_id: nflverse game id, e.g. "2025_03_LA_PHI"
+            
+        Raises:
+            KeyError: If there is no cassette for the game
+        """
+        return self.game_repository.get_game_columns(game_id)
+    
+    def iter_game_plays(self, game_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the play-by-play of one game, one play at a time.
+        
+        Cassettes generated by generate_cassettes_from_csv.py are read line by line,
+        so the first plays are available immediately and only one play is held in
+        memory at a time. Plays are not cached; use get_game_plays() for repeated access.
+        
+        Args:
+            game_id: nflverse game id, e.g. "2025_03_LA_PHI"
+            
+        Raises:
+            KeyError: If there is no cassette for the game
+        """
+        return self.game_repository.iter_game_plays(game_id)
     
     def get_leagues(self) -> List[Dict[str, Any]]:
         """
@@ -488,6 +1160,30 @@ class NFLMockClient(MockAPIClient):
         response = self.get(url)
         return response.json()
     
+    def get_games(self, from_date: Optional[DateLike] = None, to_date: Optional[DateLike] = None,
+                  team_id: Optional[str] = None, league: str = "NFL") -> List[Dict[str, Any]]:
+        """
+        Get games scheduled within a date range, sorted by scheduled_at.
+        
+        Range queries are answered by bisecting a date-sorted index of the league's
+        games, so only the requested slice is returned.
+        
+        Args:
+            from_date: First day to include (YYYY-MM-DD string, date or datetime)
+            to_date: Last day to include (YYYY-MM-DD string, date or datetime)
+            team_id: Optional team identifier to filter by
+            league: League identifier (default: "NFL")
+            
+        Returns:
+            List of game dictionaries; both bounds are inclusive and compared in UTC
+        """
+        entities = self.get_entities(league)
+        if entities is not None and (entities.games is not None or team_id in entities.team_games):
+            return self._export(entities.games_between(from_date, to_date, team_id))
+        
+        games = self.get_team_games(team_id, league) if team_id else self.get_all_games(league)
+        return filter_games_by_date(games, from_date, to_date)
+    
     def get_all_players(self, league: str = "NFL") -> List[Dict[str, Any]]:
         """
         Get all players in a league.
@@ -504,6 +1200,46 @@ class NFLMockClient(MockAPIClient):
         # The response contains {"players": [array_of_players]}, so extract just the players array
         return data.get("players", [])
     
+    def iter_players(self, per_page: int = 100, league: str = "NFL") -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over all players in a league, one page at a time.
+        
+        Pages are requested lazily with the API's cursor and per_page parameters,
+        so a caller that stops early never requests later pages. A recorded
+        response holding more than per_page players is yielded in per_page
+        slices. Iteration stops when a page has no further cursor, or when a
+        cursor request is answered by a page that was already served (the
+        recording has only one page).
+        
+        Args:
+            per_page: Number of players to request per page (1-2500)
+            league: League identifier (default: "NFL")
+            
+        Yields:
+            Player dictionaries
+        """
+        url = f"{self.base_url}/v1/leagues/{league}/players"
+        cursor = None
+        seen_cursors = set()
+        served = []
+        while True:
+            params = {'per_page': per_page}
+            if cursor:
+                params['cursor'] = cursor
+            response = self.get(f"{url}?{urlencode(params)}")
+            # Recorded bodies are interned, so a repeated page has the same body object
+            if any(response._body is page for page in served):
+                return
+            served.append(response._body)
+            data = response.json()
+            players = data.get("players", [])
+            for start in range(0, len(players), per_page):
+                yield from players[start:start + per_page]
+            cursor = data.get("cursor")
+            if not data.get("has_more") or not cursor or cursor in seen_cursors:
+                return
+            seen_cursors.add(cursor)
+    
     # Convenience methods for filtering and searching
     
     def find_team_by_name(self, team_name: str, league: str = "NFL") -> Optional[Dict[str, Any]]:
@@ -517,6 +1253,10 @@ class NFLMockClient(MockAPIClient):
         Returns:
             Team dictionary if found, None otherwise
         """
+        entities = self.get_entities(league)
+        if entities is not None and entities.teams is not None:
+            return self._export(entities.find_team(team_name))
+        
         teams = self.get_teams(league)
         team_name_lower = team_name.lower()
         
@@ -527,18 +1267,25 @@ class NFLMockClient(MockAPIClient):
                 return team
         return None
     
-    def find_player_by_name(self, player_name: str, league: str = "NFL") -> List[Dict[str, Any]]:
+    def find_player_by_name(self, player_name: str, league: str = "NFL",
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Find players by name (supports partial matching).
         
         Args:
             player_name: Player name to search for
             league: League identifier (default: "NFL")
+            limit: Optional maximum number of matches; the search stops as soon
+                as it is reached
             
         Returns:
             List of matching player dictionaries
         """
-        players = self.get_all_players(league)
+        entities = self.get_entities(league)
+        if entities is not None and entities.players is not None:
+            return self._export(entities.find_players(player_name, limit))
+        
+        players = self.iter_players(league=league)
         player_name_lower = player_name.lower()
         
         matching_players = []
@@ -551,9 +1298,65 @@ class NFLMockClient(MockAPIClient):
                 player_name_lower in last_name or
                 player_name_lower in full_name):
                 matching_players.append(player)
+                if limit is not None and len(matching_players) >= limit:
+                    break
         
         return matching_players
     
+    def search_teams(self, query: str, league: str = "NFL", limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """
+        Search teams by name, market or abbreviation, best matches first.
+        
+        Matches the same teams as find_team_by_name, ranked exact match first,
+        then name/market prefix matches, then other partial matches.
+        
+        Args:
+            query: Search text (case-insensitive)
+            league: League identifier (default: "NFL")
+            limit: Maximum number of teams to return (None for all)
+            
+        Returns:
+            List of team dictionaries
+        """
+        entities = self.get_entities(league)
+        if entities is not None and entities.teams is not None:
+            index = entities.team_names
+        else:
+            index = NameIndex(
+                ((team.get('name', '').lower(), team.get('market', '').lower()),
+                 (team.get('abbreviation', '').lower(),), team)
+                for team in self.get_teams(league)
+            )
+        return self._export([team for _, team in index.search(query, limit)])
+    
+    def search_players(self, query: str, league: str = "NFL", limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """
+        Search players by name, best matches first (e.g. for search-as-you-type).
+        
+        Matches the same players as find_player_by_name, ranked exact name
+        first, then first/last/full name prefix matches, then other partial
+        matches.
+        
+        Args:
+            query: Search text (case-insensitive)
+            league: League identifier (default: "NFL")
+            limit: Maximum number of players to return (None for all)
+            
+        Returns:
+            List of player dictionaries
+        """
+        entities = self.get_entities(league)
+        if entities is not None and entities.players is not None:
+            index = entities.player_names
+        else:
+            entries = []
+            for player in self.get_all_players(league):
+                first_name = player.get('first_name', '').lower()
+                last_name = player.get('last_name', '').lower()
+                entries.append(((first_name, last_name, f"{first_name} {last_name}".strip()), (), player))
+            index = NameIndex(entries)
+        return self._export([player for _, player in index.search(query, limit)])
+    
     def get_games_between_teams(self, team1_id: str, team2_id: str, league: str = "NFL") -> List[Dict[str, Any]]:
         """
         Get all games between two specific teams.
@@ -566,6 +1369,10 @@ class NFLMockClient(MockAPIClient):
         Returns:
             List of game dictionaries
         """
+        entities = self.get_entities(league)
+        if entities is not None and team1_id in entities.team_games:
+            return self._export(list(entities.games_by_team_pair.get((team1_id, team2_id), [])))
+        
         # Get games for team1 and filter for games against team2
         team1_games = self.get_team_games(team1_id, league)
         
@@ -592,12 +1399,19 @@ class NFLMockClient(MockAPIClient):
         Returns:
             List of player dictionaries
         """
+        position_upper = position.upper()
+        entities = self.get_entities(league)
+        if entities is not None:
+            if team_id and team_id in entities.team_players_by_position:
+                return self._export(list(entities.team_players_by_position[team_id].get(position_upper, [])))
+            if not team_id and entities.players is not None:
+                return self._export(list(entities.players_by_position.get(position_upper, [])))
+        
         if team_id:
             players = self.get_team_players(team_id, league)
         else:
             players = self.get_all_players(league)
         
-        position_upper = position.upper()
         return [p for p in players if p.get('position', '').upper() == position_upper]
     
     def get_team_statistics(self, team_id: str, league: str = "NFL") -> Dict[str, Any]:
@@ -611,10 +1425,20 @@ class NFLMockClient(MockAPIClient):
         Returns:
             Dictionary with team stats including player count, games count, etc.
         """
+        entities = self.get_entities(league)
+        stats = entities.team_statistics(team_id) if entities is not None else None
+        if stats is not None:
+            return self._export(stats)
+        
         team = self.get_team(team_id, league)
         players = self.get_team_players(team_id, league)
         games = self.get_team_games(team_id, league)
-        
+        return self._summarize_team(team, players, games)
+    
+    @staticmethod
+    def _summarize_team(team: Dict[str, Any], players: List[Dict[str, Any]],
+                        games: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the get_team_statistics() result from a team, its players and its games."""
         # Count players by position
         position_counts = {}
         for player in players:
@@ -633,4 +1457,4 @@ class NFLMockClient(MockAPIClient):
             'total_games': len(games),
             'players_by_position': position_counts,
             'games_by_status': game_status_counts
-        }
+        }
\ No newline at end of file
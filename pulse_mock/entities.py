@@ -0,0 +1,333 @@
+"""
+In-memory NFL entity graph for the Pulse Mock API Client.
+
+The graph is built once from the recorded league endpoints (teams, players,
+games and the per-team lists) and holds normalized entities plus secondary
+indexes, so NFLMockClient's search and filter helpers are index lookups
+instead of re-fetching and re-scanning whole lists on every call.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .name_index import NameIndex
+
+DateLike = Union[str, date, datetime]
+
+
+def _team_id(entity: Any, field: str) -> Optional[str]:
+    team = entity.get(field) if isinstance(entity, dict) else None
+    return team.get('id') if isinstance(team, dict) else None
+
+
+def _utc_key(value: Any) -> Optional[str]:
+    """
+    Return a sortable UTC ISO-8601 key for a game's scheduled_at, or None.
+
+    Keys sort chronologically as plain strings, and a YYYY-MM-DD date string
+    sorts before every key on that day.
+    """
+    if isinstance(value, datetime):
+        parsed = value
+    elif isinstance(value, str) and value:
+        try:
+            parsed = datetime.fromisoformat(value[:-1] + '+00:00' if value.endswith('Z') else value)
+        except ValueError:
+            return None
+    else:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat()
+
+
+def _date_bound(value: Optional[DateLike]) -> Optional[str]:
+    """Return the YYYY-MM-DD form of a from_date/to_date argument."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)[:10]
+
+
+def filter_games_by_date(games: Iterable[Dict[str, Any]], from_date: Optional[DateLike] = None,
+                         to_date: Optional[DateLike] = None) -> List[Dict[str, Any]]:
+    """
+    Return games scheduled within [from_date, to_date], sorted by scheduled_at.
+
+    Both bounds are inclusive calendar days compared in UTC. Without bounds
+    every game is returned, with unscheduled games last; with a bound, games
+    without a parseable scheduled_at are dropped.
+    """
+    return SortedGames(games).between(from_date, to_date)
+
+
+class SortedGames:
+    """Games sorted by scheduled_at, supporting bisect-based date range queries."""
+
+    __slots__ = ('keys', 'games', 'unscheduled')
+
+    def __init__(self, games: Iterable[Dict[str, Any]]):
+        keyed = []
+        self.unscheduled: List[Dict[str, Any]] = []
+        for game in games:
+            key = _utc_key(game.get('scheduled_at'))
+            if key is None:
+                self.unscheduled.append(game)
+            else:
+                keyed.append((key, len(keyed), game))
+        keyed.sort(key=lambda item: item[:2])
+        self.keys = [key for key, _, _ in keyed]
+        self.games = [game for _, _, game in keyed]
+
+    def between(self, from_date: Optional[DateLike] = None, to_date: Optional[DateLike] = None) -> List[Dict[str, Any]]:
+        """Return the games scheduled on or after from_date and on or before to_date."""
+        lower, upper = _date_bound(from_date), _date_bound(to_date)
+        if lower is None and upper is None:
+            return self.games + self.unscheduled
+        start = bisect_left(self.keys, lower) if lower is not None else 0
+        end = bisect_right(self.keys, upper + '\uffff') if upper is not None else len(self.keys)
+        return self.games[start:end]
+
+
+class LeagueEntities:
+    """
+    Teams, players and games of one league, with secondary indexes.
+
+    The per-endpoint lists (teams, players, games, team_players, team_games)
+    keep the exact objects and order of the recorded responses, so results
+    derived from them match what filtering the endpoint response would give.
+    An attribute is None (or a key is missing) when the endpoint it comes from
+    was not recorded.
+    """
+
+    def __init__(self, league: str):
+        self.league = league
+        # Recorded endpoint payloads
+        self.teams: Optional[List[Dict[str, Any]]] = None
+        self.players: Optional[List[Dict[str, Any]]] = None
+        self.games: Optional[List[Dict[str, Any]]] = None
+        self.team_details: Dict[str, Dict[str, Any]] = {}
+        self.player_details: Dict[str, Dict[str, Any]] = {}
+        self.game_details: Dict[str, Dict[str, Any]] = {}
+        self.team_players: Dict[str, List[Dict[str, Any]]] = {}
+        self.team_games: Dict[str, List[Dict[str, Any]]] = {}
+
+        # Normalized entities, merged across endpoints
+        self.teams_by_id: Dict[str, Dict[str, Any]] = {}
+        self.players_by_id: Dict[str, Dict[str, Any]] = {}
+        self.games_by_id: Dict[str, Dict[str, Any]] = {}
+
+        # Secondary indexes
+        self.teams_by_abbreviation: Dict[str, Dict[str, Any]] = {}
+        self.teams_by_market: Dict[str, Dict[str, Any]] = {}
+        self.teams_by_name: Dict[str, Dict[str, Any]] = {}
+        self.players_by_team: Dict[str, List[Dict[str, Any]]] = {}
+        self.players_by_position: Dict[str, List[Dict[str, Any]]] = {}
+        self.team_players_by_position: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+        self.games_by_team: Dict[str, List[Dict[str, Any]]] = {}
+        self.games_by_status: Dict[str, List[Dict[str, Any]]] = {}
+        self.games_by_team_pair: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.team_position_counts: Dict[str, Dict[str, int]] = {}
+        self.team_status_counts: Dict[str, Dict[str, int]] = {}
+        self.games_by_date = SortedGames(())
+        self.team_games_by_date: Dict[str, SortedGames] = {}
+        self.team_names = NameIndex(())
+        self.player_names = NameIndex(())
+
+    def _build_indexes(self) -> None:
+        """Normalize the recorded payloads and build the secondary indexes."""
+        for team in (self.teams or []):
+            self.teams_by_id.setdefault(team.get('id'), team)
+        for team_id, team in self.team_details.items():
+            self.teams_by_id[team_id] = team
+        team_names = []
+        for team in self.teams or self.teams_by_id.values():
+            abbreviation = team.get('abbreviation', '').lower()
+            self.teams_by_abbreviation.setdefault(abbreviation, team)
+            self.teams_by_market.setdefault(team.get('market', '').lower(), team)
+            self.teams_by_name.setdefault(team.get('name', '').lower(), team)
+            team_names.append(((team.get('name', '').lower(), team.get('market', '').lower()),
+                               (abbreviation,), team))
+        self.team_names = NameIndex(team_names)
+
+        player_names = []
+        for player in (self.players or []):
+            self.players_by_id.setdefault(player.get('id'), player)
+            self.players_by_position.setdefault(player.get('position', '').upper(), []).append(player)
+            first_name = player.get('first_name', '').lower()
+            last_name = player.get('last_name', '').lower()
+            player_names.append(((first_name, last_name, f"{first_name} {last_name}".strip()), (), player))
+        self.player_names = NameIndex(player_names)
+        for player_id, player in self.player_details.items():
+            self.players_by_id.setdefault(player_id, player)
+        for team_id, players in self.team_players.items():
+            by_position: Dict[str, List[Dict[str, Any]]] = {}
+            position_counts: Dict[str, int] = {}
+            for player in players:
+                self.players_by_id.setdefault(player.get('id'), player)
+                by_position.setdefault(player.get('position', '').upper(), []).append(player)
+                pos = player.get('position', 'Unknown')
+                position_counts[pos] = position_counts.get(pos, 0) + 1
+            self.team_players_by_position[team_id] = by_position
+            self.team_position_counts[team_id] = position_counts
+        for player in self.players_by_id.values():
+            team_id = _team_id(player, 'team')
+            if team_id is not None:
+                self.players_by_team.setdefault(team_id, []).append(player)
+        for team_id, players in self.team_players.items():
+            # A team's own roster endpoint is authoritative for its players
+            self.players_by_team[team_id] = list(players)
+
+        for game in (self.games or []):
+            self.games_by_id.setdefault(game.get('id'), game)
+        for game_id, game in self.game_details.items():
+            self.games_by_id.setdefault(game_id, game)
+        for team_id, games in self.team_games.items():
+            status_counts: Dict[str, int] = {}
+            for game in games:
+                self.games_by_id.setdefault(game.get('id'), game)
+                status = game.get('status', 'Unknown')
+                status_counts[status] = status_counts.get(status, 0) + 1
+                home_id, away_id = _team_id(game, 'home_team'), _team_id(game, 'away_team')
+                if team_id in (home_id, away_id):
+                    opponent_id = away_id if home_id == team_id else home_id
+                    self.games_by_team_pair.setdefault((team_id, opponent_id), []).append(game)
+            self.team_status_counts[team_id] = status_counts
+        for game in (self.games or self.games_by_id.values()):
+            self.games_by_status.setdefault(game.get('status', 'Unknown'), []).append(game)
+        for game in self.games_by_id.values():
+            for field in ('home_team', 'away_team'):
+                team_id = _team_id(game, field)
+                if team_id is not None:
+                    self.games_by_team.setdefault(team_id, []).append(game)
+        self.games_by_date = SortedGames(self.games_by_id.values())
+        self.team_games_by_date = {team_id: SortedGames(games) for team_id, games in self.games_by_team.items()}
+
+    def find_team(self, team_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Find the first team whose name or market contains team_name, or whose
+        abbreviation equals it (case-insensitive).
+
+        Returns:
+            Team dictionary if found, None otherwise
+        """
+        matches = self.team_names.find(team_name, limit=1)
+        return matches[0] if matches else None
+
+    def find_players(self, player_name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return players whose first, last or full name contains player_name (case-insensitive).
+
+        Args:
+            player_name: Name fragment to search for
+            limit: Optional maximum number of matches to return
+        """
+        return self.player_names.find(player_name, limit)
+
+    def games_between(self, from_date: Optional[DateLike] = None, to_date: Optional[DateLike] = None,
+                      team_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Return known games in a date range, optionally for one team, sorted by scheduled_at.
+
+        Args:
+            from_date: First day to include (YYYY-MM-DD string, date or datetime)
+            to_date: Last day to include (YYYY-MM-DD string, date or datetime)
+            team_id: Optional team identifier; only games it plays in are returned
+        """
+        if team_id is None:
+            return self.games_by_date.between(from_date, to_date)
+        games = self.team_games_by_date.get(team_id)
+        return games.between(from_date, to_date) if games is not None else []
+
+    def team_statistics(self, team_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return get_team_statistics()-style counts for a team.
+
+        Returns:
+            The statistics dictionary, or None if the team, its players or its
+            games were not recorded
+        """
+        team = self.team_details.get(team_id)
+        players = self.team_players.get(team_id)
+        games = self.team_games.get(team_id)
+        if team is None or players is None or games is None:
+            return None
+        return {
+            'team_info': team,
+            'total_players': len(players),
+            'total_games': len(games),
+            'players_by_position': dict(self.team_position_counts[team_id]),
+            'games_by_status': dict(self.team_status_counts[team_id])
+        }
+
+
+class EntityGraph:
+    """Per-league entity stores built from one snapshot of loaded interactions."""
+
+    def __init__(self, version: int):
+        self.version = version
+        self.leagues: Dict[str, LeagueEntities] = {}
+
+    def league(self, league: str) -> Optional[LeagueEntities]:
+        """Return the entities of a league, or None if nothing was recorded for it."""
+        return self.leagues.get(league)
+
+    @classmethod
+    def build(cls, bodies: Iterable[Tuple[List[str], Callable[[], Any]]], version: int) -> 'EntityGraph':
+        """
+        Build the graph from recorded league endpoints.
+
+        Args:
+            bodies: (path segments after /v1/leagues/, body loader) pairs for
+                recorded GET interactions. Loaders may raise ValueError for
+                non-JSON bodies, which are skipped.
+            version: Store snapshot version the graph reflects
+
+        Returns:
+            A populated EntityGraph
+        """
+        graph = cls(version)
+        for segments, load in bodies:
+            if not segments or len(segments) > 4:
+                continue
+            try:
+                body = load()
+            except ValueError:
+                continue
+            entities = graph.leagues.get(segments[0])
+            if entities is None:
+                entities = graph.leagues[segments[0]] = LeagueEntities(segments[0])
+            graph._add(entities, segments[1:], body)
+        for entities in graph.leagues.values():
+            entities._build_indexes()
+        return graph
+
+    @staticmethod
+    def _add(entities: LeagueEntities, segments: List[str], body: Any) -> None:
+        if not segments:
+            return
+        kind, rest = segments[0], segments[1:]
+        if kind == 'teams':
+            if not rest and isinstance(body, list):
+                entities.teams = body
+            elif len(rest) == 1 and isinstance(body, dict):
+                entities.team_details[rest[0]] = body
+            elif len(rest) == 2 and isinstance(body, list):
+                if rest[1] == 'players':
+                    entities.team_players[rest[0]] = body
+                elif rest[1] == 'games':
+                    entities.team_games[rest[0]] = body
+        elif kind == 'players':
+            if not rest and isinstance(body, dict):
+                entities.players = body.get('players', [])
+            elif len(rest) == 1 and isinstance(body, dict):
+                entities.player_details[rest[0]] = body
+        elif kind == 'games':
+            if not rest and isinstance(body, list):
+                entities.games = body
+            elif len(rest) == 1 and isinstance(body, dict):
+                entities.game_details[rest[0]] = body
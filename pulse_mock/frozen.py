@@ -0,0 +1,107 @@
+"""
+Read-only JSON containers for the Pulse Mock API Client.
+
+Decoded response bodies are cached and shared between every response served
+from the same interaction. To keep one caller from corrupting the data seen by
+the next, shared bodies are handed out as FrozenDict / FrozenList, which behave
+like (and are instances of) dict and list but reject mutation. Use thaw() to
+get an independent, mutable copy.
+"""
+
+from typing import Any
+
+
+def _readonly(self, *args, **kwargs):
+    raise TypeError(f"'{type(self).__name__}' object is read-only; use thaw() for a mutable copy")
+
+
+class FrozenDict(dict):
+    """A dict that cannot be modified after construction."""
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __ior__ = _readonly
+    clear = _readonly
+    pop = _readonly
+    popitem = _readonly
+    setdefault = _readonly
+    update = _readonly
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+    def __copy__(self) -> dict:
+        return dict(self)
+
+    def __deepcopy__(self, memo) -> Any:
+        return thaw(self)
+
+    def __repr__(self) -> str:
+        return f"FrozenDict({dict.__repr__(self)})"
+
+
+class FrozenList(list):
+    """A list that cannot be modified after construction."""
+
+    __slots__ = ()
+
+    __setitem__ = _readonly
+    __delitem__ = _readonly
+    __iadd__ = _readonly
+    __imul__ = _readonly
+    append = _readonly
+    clear = _readonly
+    extend = _readonly
+    insert = _readonly
+    pop = _readonly
+    remove = _readonly
+    reverse = _readonly
+    sort = _readonly
+
+    def __reduce__(self):
+        return (FrozenList, (list(self),))
+
+    def __copy__(self) -> list:
+        return list(self)
+
+    def __deepcopy__(self, memo) -> Any:
+        return thaw(self)
+
+    def __repr__(self) -> str:
+        return f"FrozenList({list.__repr__(self)})"
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert decoded JSON into read-only containers.
+
+    Args:
+        value: Result of json.loads
+
+    Returns:
+        The same data with every dict and list replaced by its frozen counterpart
+    """
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Recursively copy (possibly frozen) JSON data into plain, mutable containers.
+
+    Args:
+        value: JSON-compatible data
+
+    Returns:
+        An independent copy built from plain dicts and lists
+    """
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
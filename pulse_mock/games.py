@@ -0,0 +1,308 @@
+"""
+Play-by-play game repository for the Pulse Mock API Client.
+
+Game cassettes (one file per game, named after its nflverse game id such as
+2025_03_LA_PHI.yaml) are parsed once and cached until the file changes on
+disk. Games can be looked up by id or iterated lazily, always in season/week
+order. Parsing is pure Python and holds the GIL, so games are read one after
+another; a thread pool only added overhead.
+
+Cassettes written by generate_cassettes_from_csv.make_yaml_for_game hold one
+JSON play per line inside the response's literal block. Those are read
+line by line straight from the file, without building the body string or the
+YAML document; any other layout falls back to a full YAML parse.
+"""
+
+import json
+import os
+import re
+import threading
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from .cassette_cache import body_text, parse_cassette_file
+from .frozen import freeze, thaw
+
+GAMES_DIRNAME = 'jhurts_games'
+
+_GAME_ID = re.compile(r'^(\d{4})_(\d{2})_')
+
+Signature = Tuple[int, int]
+
+# Layout written by make_yaml_for_game
+_GENERATED_HEADER = ('---', 'version: 1', 'interactions:', '  - request:')
+_GENERATED_BODY_START = ('      body: |', '        [')
+_GENERATED_BODY_END = '        ]'
+_PLAY_INDENT = '          '
+_MAX_REQUEST_LINES = 32
+
+
+class _NotGenerated(Exception):
+    """The cassette does not follow the one-play-per-line layout."""
+
+
+def _read_generated_header(f) -> bool:
+    """
+    Consume a generated cassette's lines up to the opening '[' of its body.
+
+    Returns:
+        True if the file starts with the generated layout, False otherwise
+    """
+    for expected in _GENERATED_HEADER:
+        if f.readline().rstrip('\r\n') != expected:
+            return False
+    for _ in range(_MAX_REQUEST_LINES):
+        line = f.readline().rstrip('\r\n')
+        if line == '    response:':
+            break
+        if not line.startswith('      '):
+            return False
+    else:
+        return False
+    return all(f.readline().rstrip('\r\n') == expected for expected in _GENERATED_BODY_START)
+
+
+def _iter_generated_plays(f) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the plays of a generated cassette positioned after its header.
+
+    Raises:
+        _NotGenerated: On a line that is not a single JSON play, or if the
+            body ends without its closing ']'
+    """
+    for line in f:
+        line = line.rstrip('\r\n')
+        if line == _GENERATED_BODY_END:
+            return
+        if not line.startswith(_PLAY_INDENT + '{'):
+            raise _NotGenerated
+        text = line[len(_PLAY_INDENT):]
+        if text.endswith('},'):
+            text = text[:-1]
+        try:
+            yield json.loads(text)
+        except ValueError:
+            raise _NotGenerated
+    raise _NotGenerated
+
+
+def _document_plays(cassette: Any) -> Tuple[bool, Any]:
+    """
+    Decode the first non-empty response body of a parsed cassette.
+
+    Returns:
+        (found, plays); found is False when no interaction has a body, and
+        plays is [] when the body is not valid JSON
+    """
+    for interaction in cassette.get('interactions', []):
+        body = interaction.get('response', {}).get('body', None)
+        if body:
+            try:
+                return True, json.loads(body_text(body))
+            except Exception:
+                return True, []
+    return False, []
+
+
+def iter_plays(path: str, parse: Callable[[str], Any] = parse_cassette_file) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the plays of a game cassette one at a time.
+
+    Generated cassettes are streamed line by line, so the first play is
+    available as soon as it is read and only one play is held at a time. Any
+    other cassette is parsed in full with parse and its first non-empty
+    response body is decoded as a JSON array.
+
+    Args:
+        path: Path to the game cassette
+        parse: Function parsing a cassette file, used for other layouts
+
+    Yields:
+        Play dictionaries
+    """
+    yielded = 0
+    with open(path, 'r', encoding='utf-8') as f:
+        if _read_generated_header(f):
+            try:
+                for play in _iter_generated_plays(f):
+                    yield play
+                    yielded += 1
+                return
+            except _NotGenerated:
+                pass
+    # Not (entirely) in the generated layout: continue after the plays already yielded
+    _, plays = _document_plays(parse(path))
+    if isinstance(plays, list):
+        yield from plays[yielded:]
+
+
+def game_sort_key(game_id: str) -> Tuple[int, int, str]:
+    """Return the (season, week, game_id) sort key of an nflverse game id; unknown ids sort last."""
+    match = _GAME_ID.match(game_id)
+    if match is None:
+        return (9999, 99, game_id)
+    return (int(match.group(1)), int(match.group(2)), game_id)
+
+
+class GameRepository:
+    """
+    Cached, keyed access to per-game play-by-play cassettes.
+
+    Example:
+        games = GameRepository('/path/to/cassettes/jhurts_games', parse_cassette_file)
+        plays = games.get_game_plays('2025_03_LA_PHI')
+        for game in games.iter_game_data():
+            print(game['game_id'], len(game['plays']))
+    """
+
+    def __init__(self, games_dir: str, parse: Callable[[str], Any], share: bool = False):
+        """
+        Initialize the repository. Nothing is read until a game is requested.
+
+        Args:
+            games_dir: Directory holding one cassette per game
+            parse: Function parsing a cassette file into its YAML document
+            share: If False (the default), each call returns a private mutable
+                copy; if True, every caller gets the same cached read-only
+                (FrozenDict/FrozenList) plays
+        """
+        self.games_dir = games_dir
+        self.parse = parse
+        self.share = share
+        self._lock = threading.Lock()
+        # game_id -> (file signature, game dict or None if the cassette has no plays body)
+        self._games: Dict[str, Tuple[Signature, Optional[Dict[str, Any]]]] = {}
+        # game_id -> (cached game the columns were built from, PlayColumns)
+        self._columns: Dict[str, Tuple[Dict[str, Any], Any]] = {}
+
+    def game_ids(self) -> List[str]:
+        """Return the ids of the available games, sorted by season and week."""
+        try:
+            filenames = os.listdir(self.games_dir)
+        except OSError:
+            return []
+        ids = [name[:-len('.yaml')] for name in filenames if name.endswith('.yaml')]
+        return sorted(ids, key=game_sort_key)
+
+    def _path(self, game_id: str) -> str:
+        return os.path.join(self.games_dir, f"{game_id}.yaml")
+
+    def _signature(self, game_id: str) -> Optional[Signature]:
+        try:
+            st = os.stat(self._path(game_id))
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def _read_game(self, game_id: str, signature: Signature) -> Optional[Dict[str, Any]]:
+        """Read a game cassette and decode the plays of its first non-empty response."""
+        path = self._path(game_id)
+        found, plays = False, None
+        with open(path, 'r', encoding='utf-8') as f:
+            if _read_generated_header(f):
+                try:
+                    found, plays = True, list(_iter_generated_plays(f))
+                except _NotGenerated:
+                    pass
+        if not found:
+            found, plays = _document_plays(self.parse(path))
+        game = None
+        if found:
+            season, week, _ = game_sort_key(game_id)
+            game = freeze({
+                'game_id': game_id,
+                'game_name': f"{game_id}.yaml",
+                'season': season,
+                'week': week,
+                'plays': plays,
+            })
+        with self._lock:
+            self._games[game_id] = (signature, game)
+        return game
+
+    def _cached(self, game_id: str) -> Tuple[Optional[Signature], Optional[Tuple[Signature, Any]]]:
+        """Return the game's current signature and its cache entry if still fresh."""
+        signature = self._signature(game_id)
+        cached = self._games.get(game_id)
+        if signature is None or cached is None or cached[0] != signature:
+            cached = None
+        return signature, cached
+
+    def _get(self, game_id: str) -> Optional[Dict[str, Any]]:
+        signature, cached = self._cached(game_id)
+        if cached is not None:
+            return cached[1]
+        if signature is None:
+            return None
+        return self._read_game(game_id, signature)
+
+    def _export(self, game: Dict[str, Any]) -> Dict[str, Any]:
+        return game if self.share else thaw(game)
+
+    def get_game(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Return one game by id.
+
+        Returns:
+            Dict with 'game_id', 'game_name', 'season', 'week' and 'plays', or
+            None if there is no cassette for the game
+        """
+        game = self._get(game_id)
+        return self._export(game) if game is not None else None
+
+    def get_game_plays(self, game_id: str) -> List[Dict[str, Any]]:
+        """
+        Return the plays of one game, reading only that game's cassette.
+
+        Raises:
+            KeyError: If there is no cassette for the game
+        """
+        game = self.get_game(game_id)
+        if game is None:
+            raise KeyError(game_id)
+        return game['plays']
+
+    def get_game_columns(self, game_id: str) -> Any:
+        """
+        Return the plays of one game as a columnar PlayColumns (requires NumPy).
+
+        The columns are built once per version of the game's cassette and shared
+        by every caller; their arrays are read-only.
+
+        Raises:
+            KeyError: If there is no cassette for the game
+        """
+        from .play_store import PlayColumns
+
+        game = self._get(game_id)
+        if game is None:
+            raise KeyError(game_id)
+        cached = self._columns.get(game_id)
+        if cached is not None and cached[0] is game:
+            return cached[1]
+        columns = PlayColumns.from_plays(game['plays'])
+        with self._lock:
+            self._columns[game_id] = (game, columns)
+        return columns
+
+    def iter_game_plays(self, game_id: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream the plays of one game straight from its cassette, without caching.
+
+        Raises:
+            KeyError: If there is no cassette for the game
+        """
+        path = self._path(game_id)
+        if not os.path.exists(path):
+            raise KeyError(game_id)
+        return iter_plays(path, self.parse)
+
+    def iter_game_data(self) -> Iterator[Dict[str, Any]]:
+        """Yield every game in season/week order, reading each cassette only when reached."""
+        for game_id in self.game_ids():
+            game = self._get(game_id)
+            if game is not None:
+                yield self._export(game)
+
+    def load_all(self) -> List[Dict[str, Any]]:
+        """Return every game in season/week order, parsing only stale or unread cassettes."""
+        return list(self.iter_game_data())
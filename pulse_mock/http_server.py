@@ -0,0 +1,454 @@
+"""
+HTTP server for the Pulse Mock API.
+
+Serves every interaction recorded in a cassette directory over HTTP/1.1, so
+non-Python consumers can use the same mock API as NFLMockClient
+(http://localhost:1339 by default). Responses are encoded once when the
+cassettes are loaded - status line, headers, body, a gzip variant and the
+304 response - so serving a request is a dictionary lookup and a socket
+write. The server is a single asyncio Protocol with keep-alive and
+pipelining; uvloop is used when it is installed. Templated routes are
+rendered on first request in an executor, since rendering can load cassettes
+and build the entity graph; later requests for the same path are served from
+the prepared response. With a watch interval, every poll also rescans the
+cassette directory (including subdirectories), so cassettes added after
+startup, e.g. newly generated game files, are served as well.
+"""
+
+import asyncio
+import functools
+import gzip
+import hashlib
+import json
+import os
+from http import HTTPStatus
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from .client import MockAPIClient, NFLMockClient
+from .exceptions import CassetteNotFoundError, InvalidCassetteError
+from .interaction import Headers, Interaction, header_items
+from .router import RenderCache
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 1339
+
+# Bodies smaller than this are never gzipped
+GZIP_MIN_SIZE = 256
+MAX_HEADER_SIZE = 64 * 1024
+
+# Recorded headers that the server computes itself
+_HOP_HEADERS = frozenset((
+    'connection', 'content-length', 'content-encoding', 'date', 'etag', 'keep-alive',
+    'transfer-encoding', 'vary',
+))
+_CORS_HEADERS = (
+    b'Access-Control-Allow-Origin: *\r\n'
+    b'Access-Control-Allow-Methods: GET, POST, PUT, PATCH, DELETE, HEAD, OPTIONS\r\n'
+    b'Access-Control-Allow-Headers: *\r\n'
+    b'Access-Control-Expose-Headers: ETag\r\n'
+)
+
+
+_JSON_HEADERS = header_items({'Content-Type': ['application/json']})
+
+
+def _status_line(code: int) -> bytes:
+    try:
+        reason = HTTPStatus(code).phrase
+    except ValueError:
+        reason = ''
+    return f"HTTP/1.1 {code} {reason}\r\n".encode('latin-1')
+
+
+def _encode_headers(headers: Headers) -> bytes:
+    """Encode recorded response headers, whose values may be lists."""
+    lines = []
+    for name, values in headers:
+        if name.lower() in _HOP_HEADERS:
+            continue
+        for value in (values if isinstance(values, tuple) else (values,)):
+            lines.append(f"{name}: {value}\r\n")
+    return ''.join(lines).encode('latin-1', 'replace')
+
+
+def _response(head: bytes, body: bytes, keep_alive: bool) -> bytes:
+    connection = b'Connection: keep-alive\r\n' if keep_alive else b'Connection: close\r\n'
+    return head + b'Content-Length: ' + str(len(body)).encode('ascii') + b'\r\n' + connection + b'\r\n' + body
+
+
+class PreparedResponse:
+    """Every wire form of one recorded response, encoded ahead of time."""
+
+    __slots__ = ('etag', 'identity', 'gzipped', 'not_modified', '_heads')
+
+    def __init__(self, interaction: Interaction, use_gzip: bool = True):
+        """
+        Encode a recorded interaction's response.
+
+        Args:
+            interaction: Loaded cassette interaction
+            use_gzip: If True, also prepare a gzip-encoded variant of large bodies
+        """
+        body = bytes(interaction.body)
+        self.etag = f'"{hashlib.sha1(body).hexdigest()[:20]}"'
+
+        compressed = gzip.compress(body, compresslevel=6, mtime=0) if use_gzip and len(body) >= GZIP_MIN_SIZE else None
+        if compressed is not None and len(compressed) >= len(body):
+            compressed = None
+
+        head = (_status_line(interaction.status_code) + _encode_headers(interaction.headers)
+                + f"ETag: {self.etag}\r\n".encode('ascii') + _CORS_HEADERS)
+        if compressed is not None:
+            head += b'Vary: Accept-Encoding\r\n'
+        gzip_head = head + b'Content-Encoding: gzip\r\n'
+        not_modified_head = _status_line(304) + f"ETag: {self.etag}\r\n".encode('ascii') + _CORS_HEADERS
+        self._heads = (head, gzip_head, not_modified_head)
+
+        # Keep-alive forms are served as-is; Connection: close forms are built on demand
+        self.identity = (_response(head, body, True), body)
+        self.gzipped = (_response(gzip_head, compressed, True), compressed) if compressed is not None else None
+        self.not_modified = _response(not_modified_head, b'', True)
+
+    def render(self, accept_gzip: bool, if_none_match: Optional[bytes], keep_alive: bool,
+               head_only: bool = False) -> bytes:
+        """Return the bytes to send for a request with the given properties."""
+        if if_none_match is not None and self._matches(if_none_match):
+            return self.not_modified if keep_alive else _response(self._heads[2], b'', False)
+        use_gzip = accept_gzip and self.gzipped is not None
+        encoded, body = self.gzipped if use_gzip else self.identity
+        if keep_alive and not head_only:
+            return encoded
+        head = self._heads[1] if use_gzip else self._heads[0]
+        wire = _response(head, body, keep_alive)
+        return wire[:len(wire) - len(body)] if head_only else wire
+
+    def _matches(self, if_none_match: bytes) -> bool:
+        etag = self.etag.encode('ascii')
+        for candidate in if_none_match.split(b','):
+            candidate = candidate.strip()
+            if candidate == b'*' or candidate == etag or candidate == b'W/' + etag:
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def _not_found(method: str) -> PreparedResponse:
+    """The 404 response for a method, prepared once (methods are client-supplied, so the cache is bounded)."""
+    body = json.dumps({'error': f"No recorded interaction for this {method} request"}).encode('utf-8')
+    return PreparedResponse(Interaction(method, '', 404, _JSON_HEADERS, body), use_gzip=False)
+
+
+def _accepts_gzip(accept_encoding: Optional[bytes]) -> bool:
+    if not accept_encoding:
+        return False
+    for coding in accept_encoding.lower().split(b','):
+        name, _, params = coding.partition(b';')
+        if name.strip() not in (b'gzip', b'*'):
+            continue
+        params = params.replace(b' ', b'')
+        if params.startswith(b'q='):
+            try:
+                return float(params[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def _canonical_target(target: str) -> Tuple[str, str]:
+    """Split a request target into its path and canonical (sorted) query string."""
+    if not target.startswith('/'):
+        target = urlsplit(target)._replace(scheme='', netloc='').geturl() or '/'
+    path, _, query = target.partition('?')
+    path = path.partition('#')[0]
+    if query:
+        query = urlencode(sorted(parse_qsl(query.partition('#')[0], keep_blank_values=True)))
+    return path, query
+
+
+class RouteTable:
+    """
+    Prepared responses of a client's loaded interactions, keyed by (METHOD, path[?query]).
+
+    Paths are resolved against the client's base_url.
+    """
+
+    def __init__(self, client: MockAPIClient, use_gzip: bool = True):
+        self.client = client
+        self.use_gzip = use_gzip
+        self.version = -1
+        self.routes: Dict[Tuple[str, str], PreparedResponse] = {}
+        # id(interaction) -> (interaction, response), reused across refreshes
+        self._prepared: Dict[int, Tuple[Interaction, PreparedResponse]] = {}
+        # (METHOD, path) -> (rendered interaction, response) for templated routes
+        self._templated = RenderCache()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Rebuild the table if the client's store has changed since the last build."""
+        snapshot = self.client.store.snapshot
+        if snapshot.version == self.version:
+            return
+        prepared: Dict[int, Tuple[Interaction, PreparedResponse]] = {}
+        routes: Dict[Tuple[str, str], PreparedResponse] = {}
+        for (method, url), interaction in snapshot.index.items():
+            parts = urlsplit(url)
+            key = (method, f"{parts.path}?{parts.query}" if parts.query else parts.path)
+            if key in routes:
+                continue
+            entry = prepared.get(id(interaction)) or self._prepared.get(id(interaction))
+            if entry is None or entry[0] is not interaction:
+                entry = (interaction, PreparedResponse(interaction, self.use_gzip))
+            prepared[id(interaction)] = entry
+            routes[key] = entry[1]
+        self.routes = routes
+        self._prepared = prepared
+        self._templated = RenderCache()
+        self.version = snapshot.version
+
+    def lookup(self, method: str, path: str, query: str) -> Optional[PreparedResponse]:
+        """
+        Return the response for a request, preferring an exact query match and
+        falling back to the already rendered templated routes. Never blocks.
+        """
+        if self.client.store.snapshot.version != self.version:
+            self.refresh()
+        routes = self.routes
+        if query:
+            response = routes.get((method, f"{path}?{query}"))
+            if response is not None:
+                return response
+        response = routes.get((method, path))
+        if response is not None:
+            return response
+        cached = self._templated.get((method, path))
+        return cached[1] if cached is not None else None
+
+    def has_template(self, method: str, path: str) -> bool:
+        """Return True if a templated route matches the request, without rendering it."""
+        return self.client.has_route(method, self.client.base_url + path)
+
+    def render(self, method: str, path: str) -> Optional[PreparedResponse]:
+        """
+        Render and prepare the templated route matching a request, or return None.
+
+        This can block (see MockAPIClient.match_route); call it from an executor.
+        """
+        interaction = self.client.match_route(method, self.client.base_url + path)
+        if interaction is None:
+            return None
+        cached = self._templated.get((method, path))
+        if cached is None or cached[0] is not interaction:
+            cached = (interaction, PreparedResponse(interaction, self.use_gzip))
+            self._templated.put((method, path), cached)
+        return cached[1]
+
+
+class MockHTTPProtocol(asyncio.Protocol):
+    """One HTTP/1.x connection serving prepared responses."""
+
+    def __init__(self, routes: RouteTable):
+        self.routes = routes
+        self.transport: Optional[asyncio.Transport] = None
+        self.buffer = b''
+        # True while a templated route is rendered in an executor; requests
+        # pipelined behind it wait in the buffer so responses stay in order
+        self.rendering = False
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        self.transport = transport  # type: ignore[assignment]
+
+    def data_received(self, data: bytes) -> None:
+        self.buffer += data
+        if not self.rendering:
+            self._process()
+
+    def _process(self) -> None:
+        out: List[bytes] = []
+        keep_alive = True
+        while keep_alive:
+            end = self.buffer.find(b'\r\n\r\n')
+            if end < 0:
+                if len(self.buffer) > MAX_HEADER_SIZE:
+                    out.append(_response(_status_line(431), b'', False))
+                    keep_alive = False
+                break
+            wire, consumed, keep_alive = self._handle(self.buffer[:end], end + 4)
+            if wire is None:
+                # Request body not fully received yet
+                break
+            self.buffer = self.buffer[consumed:]
+            if callable(wire):
+                self.rendering = True
+                asyncio.ensure_future(self._render(wire, keep_alive))
+                break
+            out.append(wire)
+        if out:
+            self.transport.write(b''.join(out) if len(out) > 1 else out[0])
+        if not keep_alive and not self.rendering:
+            self.transport.close()
+
+    async def _render(self, respond: Callable[[], bytes], keep_alive: bool) -> None:
+        """Send the response of a request that needs rendering, then resume with the buffered requests."""
+        try:
+            wire = await asyncio.get_running_loop().run_in_executor(None, respond)
+        except Exception as e:
+            print(f"Warning: Could not render a templated route: {e}")
+            wire, keep_alive = _response(_status_line(500), b'', False), False
+        self.rendering = False
+        if self.transport.is_closing():
+            return
+        self.transport.write(wire)
+        if not keep_alive:
+            self.transport.close()
+        elif self.buffer:
+            self._process()
+
+    def _handle(self, head: bytes, head_size: int) -> Tuple[Union[bytes, Callable[[], bytes], None], int, bool]:
+        """
+        Answer one request; returns (response, bytes consumed, keep the connection open).
+
+        The response is None while the request body is incomplete, and a blocking
+        callable producing the response bytes when a templated route must be rendered.
+        """
+        lines = head.split(b'\r\n')
+        try:
+            method, target, version = lines[0].decode('latin-1').split(' ')
+        except ValueError:
+            return _response(_status_line(400), b'', False), head_size, False
+        headers: Dict[bytes, bytes] = {}
+        for line in lines[1:]:
+            name, _, value = line.partition(b':')
+            headers[name.strip().lower()] = value.strip()
+
+        if b'chunked' in headers.get(b'transfer-encoding', b'').lower():
+            return _response(_status_line(501), b'', False), head_size, False
+        try:
+            body_size = int(headers.get(b'content-length', b'0'))
+        except ValueError:
+            return _response(_status_line(400), b'', False), head_size, False
+        if len(self.buffer) < head_size + body_size:
+            return None, 0, True
+
+        connection = headers.get(b'connection', b'').lower()
+        if version == 'HTTP/1.1':
+            keep_alive = b'close' not in connection
+        else:
+            keep_alive = b'keep-alive' in connection
+
+        method = method.upper()
+        if method == 'OPTIONS':
+            return _response(_status_line(204) + _CORS_HEADERS, b'', keep_alive), head_size + body_size, keep_alive
+        path, query = _canonical_target(target)
+        route_method = 'GET' if method == 'HEAD' else method
+        accept_gzip = _accepts_gzip(headers.get(b'accept-encoding'))
+        if_none_match = headers.get(b'if-none-match')
+
+        def respond(response: Optional[PreparedResponse]) -> bytes:
+            if response is None:
+                response = _not_found(method)
+            return response.render(accept_gzip, if_none_match, keep_alive, head_only=method == 'HEAD')
+
+        response = self.routes.lookup(route_method, path, query)
+        if response is None and self.routes.has_template(route_method, path):
+            return lambda: respond(self.routes.render(route_method, path)), head_size + body_size, keep_alive
+        return respond(response), head_size + body_size, keep_alive
+
+
+def _cassette_names(cassette_dir: str) -> List[str]:
+    """Return every cassette under cassette_dir as a path relative to it, skipping hidden directories."""
+    names = []
+    for root, dirs, files in os.walk(cassette_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith('.') and d != '__pycache__')
+        for filename in sorted(files):
+            if filename.endswith(('.yaml', '.yml')):
+                names.append(os.path.relpath(os.path.join(root, filename), cassette_dir))
+    return names
+
+
+def _load_new_cassettes(client: MockAPIClient, warn: bool = False) -> List[str]:
+    """
+    Load the cassettes under the client's cassette_dir that are not loaded yet.
+
+    Args:
+        client: Client to load the cassettes into
+        warn: If True, print a warning for each cassette that cannot be loaded
+
+    Returns:
+        Names of the cassettes that were loaded
+    """
+    loaded = []
+    for name in _cassette_names(client.cassette_dir):
+        if name in client.loaded_cassettes:
+            continue
+        try:
+            client.load_cassette(name)
+            loaded.append(name)
+        except (CassetteNotFoundError, InvalidCassetteError) as e:
+            if warn:
+                print(f"Warning: Could not load cassette {name}: {e}")
+    return loaded
+
+
+class ServerClient(NFLMockClient):
+    """
+    NFLMockClient for the HTTP server: reloading also loads every cassette that
+    was added under cassette_dir, including in subdirectories.
+    """
+
+    def reload_changed_cassettes(self) -> List[str]:
+        changed = super().reload_changed_cassettes()
+        # cassettes that cannot be parsed yet are retried on the next call
+        changed.extend(_load_new_cassettes(self))
+        return changed
+
+
+def load_client(cassette_dir: Optional[str] = None, watch_interval: Optional[float] = None) -> MockAPIClient:
+    """
+    Create a client with every cassette under cassette_dir (including subdirectories) loaded.
+
+    Args:
+        cassette_dir: Cassette directory (defaults to the packaged cassettes)
+        watch_interval: If set, every watch_interval seconds hot-reload changed cassettes
+            and load the ones added under cassette_dir since the last poll
+    """
+    client = ServerClient(cassette_dir, auto_load_all=False, watch_interval=watch_interval)
+    _load_new_cassettes(client, warn=True)
+    return client
+
+
+async def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, cassette_dir: Optional[str] = None,
+                use_gzip: bool = True, watch_interval: Optional[float] = None) -> None:
+    """
+    Serve the cassettes in cassette_dir until cancelled.
+
+    Args:
+        host: Interface to bind
+        port: TCP port to bind
+        cassette_dir: Cassette directory (defaults to the packaged cassettes)
+        use_gzip: If True, serve gzip-encoded bodies to clients that accept them
+        watch_interval: If set, poll for changed and added cassettes every
+            watch_interval seconds and serve their new contents
+    """
+    loop = asyncio.get_running_loop()
+    client = await loop.run_in_executor(None, load_client, cassette_dir, watch_interval)
+    routes = RouteTable(client, use_gzip)
+    server = await loop.create_server(lambda: MockHTTPProtocol(routes), host, port, reuse_address=True)
+    print(f"Serving {len(routes.routes)} recorded routes from {client.cassette_dir} on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def run(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, cassette_dir: Optional[str] = None,
+        use_gzip: bool = True, watch_interval: Optional[float] = None) -> None:
+    """Run serve() on a new event loop (uvloop when available) until interrupted."""
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    try:
+        asyncio.run(serve(host, port, cassette_dir, use_gzip, watch_interval))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,183 @@
+"""
+Compact interaction records for the Pulse Mock API Client.
+
+Cassettes are parsed into nested dicts holding request headers, form data,
+status strings and more, most of which matching and serving never read.
+Loaded interactions are converted into Interaction records that keep only
+the method, recorded URL, status code, headers and body. Header sets are
+interned in a HeaderPool owned by the interaction store, so the many
+interactions recorded with identical headers share a single tuple and
+read-only dict, and bodies are bytes (or a zero-copy view into a compiled
+cassette's memory-mapped body store).
+"""
+
+import sys
+import threading
+from typing import Any, Dict, Iterable, Optional, Tuple, Union
+
+from .frozen import FrozenDict, FrozenList
+
+Body = Union[bytes, memoryview]
+# ((name, value), ...); a header recorded as a list has a tuple value
+Headers = Tuple[Tuple[str, Union[str, Tuple[str, ...]]], ...]
+
+
+def header_items(headers: Any) -> Headers:
+    """
+    Return the tuple form of recorded response headers.
+
+    Args:
+        headers: Header mapping from a cassette; values may be strings or lists
+    """
+    if not isinstance(headers, dict):
+        return ()
+    return tuple(
+        (sys.intern(str(name)),
+         tuple(str(v) for v in value) if isinstance(value, list) else str(value))
+        for name, value in headers.items()
+    )
+
+
+def headers_dict(headers: Headers) -> FrozenDict:
+    """Return headers in their recorded shape, as a read-only dict."""
+    return FrozenDict((name, FrozenList(value) if isinstance(value, tuple) else value) for name, value in headers)
+
+
+class HeaderPool:
+    """
+    Pool of the distinct header sets of the loaded interactions.
+
+    intern() returns the pooled tuple and read-only dict for any header set
+    seen before. The pool belongs to one interaction store and is trimmed to
+    the live interactions when cassettes are reloaded or cleared, so it never
+    outgrows what is loaded.
+    """
+
+    def __init__(self):
+        self._headers: Dict[Headers, Tuple[Headers, FrozenDict]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._headers)
+
+    def intern(self, headers: Headers) -> Tuple[Headers, FrozenDict]:
+        """Return the pooled (tuple, dict) forms of headers, adding them if they are new."""
+        pooled = self._headers.get(headers)
+        if pooled is not None:
+            return pooled
+        with self._lock:
+            return self._headers.setdefault(headers, (headers, headers_dict(headers)))
+
+    def retain(self, headers: Iterable[Headers]) -> None:
+        """Drop every pooled header set that is not among headers."""
+        live = set(headers)
+        with self._lock:
+            self._headers = {key: value for key, value in self._headers.items() if key in live}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._headers = {}
+
+
+class Interaction:
+    """
+    One loaded request/response pair.
+
+    The record supports the read-only parts of the cassette dict form for
+    existing callers: interaction['request']['url'] and
+    interaction.get('response') build the equivalent dicts on demand.
+    """
+
+    __slots__ = ('method', 'url', 'status_code', 'headers', 'body', 'render', '_headers_dict')
+
+    def __init__(self, method: str, url: str, status_code: int = 200, headers: Headers = (),
+                 body: Body = b'', render: Optional[str] = None, headers_view: Optional[FrozenDict] = None):
+        """
+        Initialize the record.
+
+        Args:
+            method: Upper-case HTTP method
+            url: URL as recorded, including any query string
+            status_code: HTTP status code
+            headers: Response headers (see header_items)
+            body: Response body
+            render: Entity source of a templated route, if any
+            headers_view: The read-only dict form of headers, if already built
+                (e.g. by a HeaderPool)
+        """
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.body = body
+        self.render = render
+        self._headers_dict = headers_view
+
+    @classmethod
+    def from_dict(cls, interaction: Dict[str, Any], header_pool: Optional[HeaderPool] = None) -> 'Interaction':
+        """
+        Convert a cassette interaction dict, dropping everything matching does not use.
+
+        Args:
+            interaction: Interaction dict as parsed from a cassette
+            header_pool: Pool to intern the response headers in, if any
+
+        Raises:
+            ValueError: If the recorded status code is not an integer
+        """
+        request = interaction.get('request') or {}
+        response = interaction.get('response') or {}
+        body = response.get('body')
+        if body is None:
+            body = b''
+        elif isinstance(body, str):
+            body = body.encode('utf-8')
+        elif not isinstance(body, (bytes, memoryview)):
+            body = str(body).encode('utf-8')
+        code = response.get('code', 200)
+        try:
+            status_code = int(code)
+        except (TypeError, ValueError):
+            raise ValueError(f"invalid status code {code!r} for {request.get('url', '')}") from None
+        headers = header_items(response.get('headers'))
+        headers_view = None
+        if header_pool is not None:
+            headers, headers_view = header_pool.intern(headers)
+        return cls(
+            sys.intern(str(request.get('method', '')).upper()),
+            str(request.get('url', '')),
+            status_code,
+            headers,
+            body,
+            response.get('render'),
+            headers_view,
+        )
+
+    def headers_dict(self) -> FrozenDict:
+        """The response headers as a read-only dict in their recorded shape."""
+        if self._headers_dict is None:
+            self._headers_dict = headers_dict(self.headers)
+        return self._headers_dict
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the cassette dict form of the interaction."""
+        return {'request': self['request'], 'response': self['response']}
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        if key == 'request':
+            return {'method': self.method, 'url': self.url}
+        if key == 'response':
+            response = {'code': self.status_code, 'headers': self.headers_dict(), 'body': self.body}
+            if self.render is not None:
+                response['render'] = self.render
+            return response
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __repr__(self) -> str:
+        return f"Interaction({self.method} {self.url} -> {self.status_code})"
@@ -0,0 +1,141 @@
+"""
+Persistent URL -> cassette manifest for the Pulse Mock API Client.
+
+The manifest is a JSON sidecar stored next to the cassettes. It records, for
+every cassette file, the (method, normalized URL) pairs it contains together
+with the file's mtime and size, so a request miss can be resolved to the one
+cassette that serves it without parsing the rest of the directory.
+"""
+
+import json
+import os
+import tempfile
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+MANIFEST_FILENAME = '.pulse_mock_manifest.json'
+MANIFEST_VERSION = 1
+
+Route = Tuple[str, str]
+
+
+class CassetteManifest:
+    """
+    Maps recorded (method, normalized URL) pairs to the cassettes that contain them.
+
+    Entries are keyed by cassette filename and invalidated whenever the file's
+    mtime or size changes; only stale or new cassettes are re-read on refresh.
+    """
+
+    def __init__(self, cassette_dir: str, filename: str = MANIFEST_FILENAME):
+        """
+        Initialize the manifest.
+
+        Args:
+            cassette_dir: Directory containing the cassette files
+            filename: Name of the sidecar file inside cassette_dir
+        """
+        self.cassette_dir = cassette_dir
+        self.path = os.path.join(cassette_dir, filename)
+        self._entries: Dict[str, Dict] = {}
+        self._routes: Dict[str, Dict[str, List[str]]] = {}
+        self._templated: Tuple[str, ...] = ()
+        self._load()
+
+    def _load(self) -> None:
+        """Read the sidecar file, ignoring it if missing, unreadable or outdated."""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get('version') == MANIFEST_VERSION:
+            self._entries = data.get('cassettes', {})
+
+    def _save(self) -> None:
+        """Atomically write the sidecar file. Read-only directories are tolerated."""
+        data = {'version': MANIFEST_VERSION, 'cassettes': self._entries}
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix='.manifest-', suffix='.tmp', dir=self.cassette_dir)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, sort_keys=True)
+            os.replace(tmp_path, self.path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+    def refresh(self, cassettes: Iterable[str], read_routes: Callable[[str], List[Route]]) -> None:
+        """
+        Bring the manifest up to date with the cassette directory.
+
+        Args:
+            cassettes: Cassette filenames currently available in the directory
+            read_routes: Callable returning the (METHOD, normalized URL) pairs of a
+                cassette; only called for cassettes that are new or have changed.
+                It may raise any exception for unreadable cassettes, which are then
+                recorded with no routes until they change again.
+        """
+        changed = False
+        entries: Dict[str, Dict] = {}
+        for cassette in cassettes:
+            try:
+                st = os.stat(os.path.join(self.cassette_dir, cassette))
+            except OSError:
+                continue
+            entry = self._entries.get(cassette)
+            if entry is None or entry.get('mtime_ns') != st.st_mtime_ns or entry.get('size') != st.st_size:
+                try:
+                    routes = [list(route) for route in read_routes(cassette)]
+                except Exception:
+                    routes = []
+                entry = {'mtime_ns': st.st_mtime_ns, 'size': st.st_size, 'routes': routes}
+                changed = True
+            entries[cassette] = entry
+
+        if changed or entries.keys() != self._entries.keys():
+            self._entries = entries
+            self._save()
+        self._build_lookup()
+
+    def _build_lookup(self) -> None:
+        """
+        Rebuild the in-memory URL -> method -> cassettes lookup from the entries,
+        along with the list of cassettes that declare templated routes.
+        """
+        routes: Dict[str, Dict[str, List[str]]] = {}
+        templated = []
+        for cassette in sorted(self._entries):
+            for method, url in self._entries[cassette]['routes']:
+                cassettes = routes.setdefault(url, {}).setdefault(method, [])
+                if cassette not in cassettes:
+                    cassettes.append(cassette)
+                if '{' in url and (not templated or templated[-1] != cassette):
+                    templated.append(cassette)
+        self._routes = routes
+        self._templated = tuple(templated)
+
+    def templated(self) -> Tuple[str, ...]:
+        """Return the cassettes that declare templated ({parameter}) routes, in sorted order."""
+        return self._templated
+
+    def find(self, normalized_url: str, method: Optional[str] = None) -> List[str]:
+        """
+        Return the cassettes that record a normalized URL, in sorted order.
+
+        Args:
+            normalized_url: URL as produced by MockAPIClient._normalize_url
+            method: Optional HTTP method; if omitted any method matches
+
+        Returns:
+            List of cassette filenames (empty if no cassette records the URL)
+        """
+        by_method = self._routes.get(normalized_url)
+        if not by_method:
+            return []
+        if method is not None:
+            return list(by_method.get(method.upper(), []))
+        return sorted({c for cassettes in by_method.values() for c in cassettes})
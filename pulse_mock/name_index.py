@@ -0,0 +1,147 @@
+"""
+Name search index for the Pulse Mock API Client.
+
+NameIndex answers case-insensitive substring queries over a fixed set of
+names without scanning every entry. Each entry's names are split into
+n-grams of up to three characters with a posting list per gram; a query is
+answered from the postings of its grams and only those candidates are
+checked with a real substring test, so results match a linear scan exactly.
+A sorted word list (searched with bisect) acts as the prefix trie used to
+rank prefix matches above plain substring matches.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+GRAM_SIZE = 3
+
+# Ranks returned by NameIndex.search, best first
+EXACT, PREFIX, SUBSTRING = 0, 1, 2
+
+
+def _grams(text: str, size: int) -> Set[str]:
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class NameIndex:
+    """
+    Substring and prefix index over entity names.
+
+    Example:
+        index = NameIndex([(("jalen", "hurts", "jalen hurts"), (), player), ...])
+        index.find("hurt")           # every match, in entry order
+        index.search("ja", limit=5)  # best matches first
+    """
+
+    def __init__(self, entries: Iterable[Tuple[Sequence[str], Sequence[str], Any]]):
+        """
+        Build the index.
+
+        Args:
+            entries: (names, exact_names, item) triples. A query matches an item
+                when it is a substring of one of its names or equals one of its
+                exact_names. All names must already be lowercase.
+        """
+        self._names: List[Tuple[str, ...]] = []
+        self._items: List[Any] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._exact: Dict[str, List[int]] = {}
+        words: List[Tuple[str, int]] = []
+        for doc, (names, exact_names, item) in enumerate(entries):
+            names = tuple(names)
+            self._names.append(names)
+            self._items.append(item)
+            grams: Set[str] = set()
+            for name in names:
+                for size in range(1, GRAM_SIZE + 1):
+                    grams |= _grams(name, size)
+                words.extend((word, doc) for word in {name, *name.split()} if word)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(doc)
+            for name in set(exact_names):
+                self._exact.setdefault(name, []).append(doc)
+                words.append((name, doc))
+        words.sort()
+        self._words = words
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def _substring_docs(self, query: str) -> List[int]:
+        """Return the ids of entries with a name containing query, in entry order."""
+        if not query:
+            return list(range(len(self._items)))
+        if len(query) <= GRAM_SIZE:
+            return self._postings.get(query, [])
+        postings = []
+        for gram in _grams(query, GRAM_SIZE):
+            posting = self._postings.get(gram)
+            if posting is None:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        return [doc for doc in sorted(candidates) if any(query in name for name in self._names[doc])]
+
+    def _matching_docs(self, query: str) -> List[int]:
+        docs = self._substring_docs(query)
+        exact = self._exact.get(query)
+        if exact:
+            docs = sorted(set(docs).union(exact))
+        return docs
+
+    def _prefix_docs(self, query: str) -> Set[int]:
+        """Return the ids of entries with a name or word starting with query."""
+        docs = set()
+        for i in range(bisect_left(self._words, (query,)), len(self._words)):
+            word, doc = self._words[i]
+            if not word.startswith(query):
+                break
+            docs.add(doc)
+        return docs
+
+    def find(self, query: str, limit: Optional[int] = None) -> List[Any]:
+        """
+        Return matching items in the order they were indexed.
+
+        Args:
+            query: Name fragment (case-insensitive)
+            limit: Optional maximum number of items to return
+        """
+        docs = self._matching_docs(query.lower())
+        if limit is not None:
+            docs = docs[:limit]
+        return [self._items[doc] for doc in docs]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Tuple[int, Any]]:
+        """
+        Return matching items ranked best first.
+
+        Items whose name equals the query rank first (EXACT), then items with a
+        name or word starting with it (PREFIX), then other substring matches
+        (SUBSTRING). Ties keep the order the items were indexed in.
+
+        Args:
+            query: Name fragment (case-insensitive)
+            limit: Optional maximum number of results
+
+        Returns:
+            (rank, item) pairs
+        """
+        query = query.lower()
+        docs = self._matching_docs(query)
+        prefixed = self._prefix_docs(query) if query else set()
+        exact = set(self._exact.get(query, ()))
+        ranked = []
+        for doc in docs:
+            if doc in exact or query in self._names[doc]:
+                rank = EXACT
+            elif doc in prefixed:
+                rank = PREFIX
+            else:
+                rank = SUBSTRING
+            ranked.append((rank, doc))
+        ranked.sort()
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(rank, self._items[doc]) for rank, doc in ranked]
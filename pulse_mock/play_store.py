@@ -0,0 +1,168 @@
+"""
+Columnar play-by-play store for the Pulse Mock API Client.
+
+PlayColumns holds a game's plays as one contiguous float64 array per numeric
+column of schema.KEY_ORDER (NaN where a value is missing) and categorical-coded
+string columns (int32 codes into a tuple of categories, -1 where missing). It
+is built once per game; after that, series extraction, chronological ordering
+and diffs are NumPy array operations instead of per-play dict lookups.
+
+Requires NumPy.
+"""
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .schema import KEY_ORDER
+
+# Length of a regulation game, used to turn game_seconds_remaining into elapsed time
+GAME_SECONDS = 3600
+
+
+def _readonly(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class PlayColumns:
+    """
+    Column-oriented, read-only view of one game's plays.
+
+    Example:
+        columns = PlayColumns.from_plays(client.get_game_plays("2025_03_LA_PHI"))
+        order = columns.chronological_order()
+        qb_epa = columns.series('qb_epa', order)
+        diff = columns.diff('wpa', 'qb_epa', order)
+    """
+
+    def __init__(self, numeric: Dict[str, np.ndarray],
+                 categorical: Dict[str, Tuple[np.ndarray, Tuple[str, ...]]], size: int):
+        """
+        Initialize from already built columns; use from_plays() to build from play dicts.
+
+        Args:
+            numeric: Column name -> float64 array of length size
+            categorical: Column name -> (int32 codes of length size, categories)
+            size: Number of plays
+        """
+        self.numeric = numeric
+        self.categorical = categorical
+        self.size = size
+
+    @classmethod
+    def from_plays(cls, plays: Iterable[Dict[str, Any]],
+                   columns: Optional[Sequence[str]] = None) -> 'PlayColumns':
+        """
+        Build the columns of a game from its play dictionaries.
+
+        A column whose non-missing values are all numbers is stored as float64;
+        any other column is categorical-coded.
+
+        Args:
+            plays: Play dictionaries, e.g. from NFLMockClient.get_game_plays()
+            columns: Columns to build (default: KEY_ORDER)
+
+        Returns:
+            A new PlayColumns
+        """
+        plays = list(plays)
+        size = len(plays)
+        numeric: Dict[str, np.ndarray] = {}
+        categorical: Dict[str, Tuple[np.ndarray, Tuple[str, ...]]] = {}
+        for name in (KEY_ORDER if columns is None else columns):
+            values = [play.get(name) for play in plays]
+            if all(value is None or _is_number(value) for value in values):
+                numeric[name] = _readonly(np.fromiter(
+                    (math.nan if value is None else value for value in values), dtype=np.float64, count=size))
+                continue
+            codes_by_value: Dict[str, int] = {}
+            codes = np.fromiter(
+                (-1 if value is None else codes_by_value.setdefault(str(value), len(codes_by_value))
+                 for value in values), dtype=np.int32, count=size)
+            categorical[name] = (_readonly(codes), tuple(codes_by_value))
+        return cls(numeric, categorical, size)
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def columns(self) -> List[str]:
+        """Names of all stored columns."""
+        return list(self.numeric) + list(self.categorical)
+
+    def column(self, name: str) -> np.ndarray:
+        """
+        Return a numeric column as a read-only float64 array (NaN where missing).
+
+        Raises:
+            KeyError: If the column is missing or categorical
+        """
+        return self.numeric[name]
+
+    def codes(self, name: str) -> Tuple[np.ndarray, Tuple[str, ...]]:
+        """
+        Return a categorical column as (int32 codes, categories); code -1 means missing.
+
+        Raises:
+            KeyError: If the column is missing or numeric
+        """
+        return self.categorical[name]
+
+    def strings(self, name: str) -> np.ndarray:
+        """Return a categorical column decoded to an object array (None where missing)."""
+        codes, categories = self.categorical[name]
+        lookup = np.array(categories + (None,), dtype=object)
+        return lookup[codes]
+
+    def elapsed(self) -> np.ndarray:
+        """Seconds elapsed since kickoff for each play (GAME_SECONDS - game_seconds_remaining)."""
+        return GAME_SECONDS - self.column('game_seconds_remaining')
+
+    def chronological_order(self) -> np.ndarray:
+        """Indices that sort the plays by elapsed time; plays at the same time keep their order."""
+        return np.argsort(self.elapsed(), kind='stable')
+
+    def series(self, name: str, order: Optional[np.ndarray] = None, fill: float = 0.0) -> np.ndarray:
+        """
+        Return a numeric column with missing values replaced by fill, optionally reordered.
+
+        'elapsed' is accepted as a column name. A column not stored at all is
+        treated as entirely missing.
+
+        Args:
+            name: Column name
+            order: Optional index array, e.g. from chronological_order()
+            fill: Value substituted for missing entries
+
+        Raises:
+            ValueError: If the column is categorical
+        """
+        if name in self.categorical:
+            raise ValueError(f"Column {name!r} is categorical, not numeric")
+        if name == 'elapsed':
+            values = self.elapsed()
+        elif name in self.numeric:
+            values = self.numeric[name]
+        else:
+            values = np.full(self.size, math.nan)
+        if order is not None:
+            values = values[order]
+        return np.where(np.isnan(values), fill, values)
+
+    def diff(self, minuend: str, subtrahend: str, order: Optional[np.ndarray] = None,
+             fill: float = 0.0) -> np.ndarray:
+        """Return series(minuend) - series(subtrahend), with missing values taken as fill."""
+        return self.series(minuend, order, fill) - self.series(subtrahend, order, fill)
+
+    def take(self, indices: np.ndarray) -> 'PlayColumns':
+        """Return a new PlayColumns holding only the given plays, in the given order."""
+        numeric = {name: _readonly(values[indices]) for name, values in self.numeric.items()}
+        categorical = {name: (_readonly(codes[indices]), categories)
+                       for name, (codes, categories) in self.categorical.items()}
+        return PlayColumns(numeric, categorical, len(indices))
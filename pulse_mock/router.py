@@ -0,0 +1,147 @@
+"""
+Templated route matching for the Pulse Mock API Client.
+
+Besides exact recordings, a cassette interaction may declare a templated URL
+such as http://localhost:1339/v1/leagues/{league}/teams/{teamId}/players.
+Templates are compiled into a trie over path segments - static segments are
+dict lookups, and each node has at most one parameter child - so matching a
+request costs time proportional to its path depth, independent of how many
+templates or recordings are loaded. Static segments win over parameters at
+every level, and a parameter branch is only tried when the static one fails.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+Params = Dict[str, str]
+
+
+def is_template(url: str) -> bool:
+    """Return True if a recorded URL declares {parameter} segments."""
+    return '{' in urlparse(url).path
+
+
+def _segments(path: str) -> List[str]:
+    return [segment for segment in path.split('/') if segment]
+
+
+class _Node:
+    __slots__ = ('static', 'param', 'routes')
+
+    def __init__(self):
+        self.static: Dict[str, '_Node'] = {}
+        self.param: Optional['_Node'] = None
+        # METHOD -> (parameter names in path order, route value)
+        self.routes: Dict[str, Tuple[Tuple[str, ...], Any]] = {}
+
+
+class RouteTrie:
+    """
+    Segment trie mapping templated paths to values.
+
+    Example:
+        trie = RouteTrie()
+        trie.add('GET', '/v1/leagues/{league}/teams/{teamId}', 'team')
+        trie.match('GET', '/v1/leagues/NFL/teams/T1')
+        -> ('team', {'league': 'NFL', 'teamId': 'T1'})
+    """
+
+    def __init__(self, routes: Iterable[Tuple[str, str, Any]] = ()):
+        """
+        Build the trie.
+
+        Args:
+            routes: (METHOD, path template, value) triples; for duplicate
+                method/template pairs the first one wins
+        """
+        self._root = _Node()
+        self.size = 0
+        for method, template, value in routes:
+            self.add(method, template, value)
+
+    def add(self, method: str, template: str, value: Any) -> None:
+        """Add a route; a {name} segment matches any single path segment."""
+        node = self._root
+        names = []
+        for segment in _segments(template):
+            if segment.startswith('{') and segment.endswith('}'):
+                names.append(segment[1:-1])
+                if node.param is None:
+                    node.param = _Node()
+                node = node.param
+            else:
+                node = node.static.setdefault(segment, _Node())
+        method = method.upper()
+        if method not in node.routes:
+            node.routes[method] = (tuple(names), value)
+            self.size += 1
+
+    def match(self, method: str, path: str) -> Optional[Tuple[Any, Params]]:
+        """
+        Return the value and captured parameters of the route matching a path.
+
+        Args:
+            method: HTTP method
+            path: Request path (without query string)
+
+        Returns:
+            (value, {parameter name: decoded segment}), or None if no route matches
+        """
+        segments = _segments(path)
+        found = self._match(self._root, segments, 0, [], method.upper())
+        if found is None:
+            return None
+        (names, value), captured = found
+        return value, {name: unquote(segment) for name, segment in zip(names, captured)}
+
+    def _match(self, node: _Node, segments: List[str], depth: int, captured: List[str],
+               method: str) -> Optional[Tuple[Tuple[Tuple[str, ...], Any], List[str]]]:
+        if depth == len(segments):
+            route = node.routes.get(method)
+            return (route, captured) if route is not None else None
+        segment = segments[depth]
+        child = node.static.get(segment)
+        if child is not None:
+            found = self._match(child, segments, depth + 1, captured, method)
+            if found is not None:
+                return found
+        if node.param is not None:
+            return self._match(node.param, segments, depth + 1, captured + [segment], method)
+        return None
+
+
+class RenderCache:
+    """Small LRU cache of rendered responses, keyed by request."""
+
+    def __init__(self, maxsize: int = 4096, on_evict: Optional[Callable[[Any], None]] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+            on_evict: Optional callable invoked with each evicted value
+        """
+        self.maxsize = maxsize
+        self.on_evict = on_evict
+        self._items: 'OrderedDict[Any, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key: Any, value: Any) -> None:
+        evicted = []
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                evicted.append(self._items.popitem(last=False)[1])
+        if self.on_evict is not None:
+            for value in evicted:
+                self.on_evict(value)
@@ -0,0 +1,26 @@
+"""
+Play-by-play schema shared by the package and the cassette scripts.
+
+KEY_ORDER lists the play fields kept from the nflverse play-by-play CSV, in
+the order they are written to game cassettes.
+"""
+
+KEY_ORDER = [
+    "home_team",
+    "game_seconds_remaining",
+    "yards_gained",
+    "passer_player_name",
+    "comp_air_epa",
+    "air_epa",
+    "qb_epa",
+    "receiver_player_name",
+    "comp_yac_epa",
+    "yac_epa",
+    "xyac_epa",
+    "wp",
+    "wpa",
+    "air_wpa",
+    "comp_air_wpa",
+    "yac_wpa",
+    "comp_yac_wpa"
+]
@@ -59,7 +59,7 @@ except Exception:
 # --- Sample plays data ---
 def get_data(player: str = None):
     client = NFLMockClient()
-    ppi, tpi = analysis.compute_ppi_tpi_from_plays(client.get_game_data()[2]['plays'])
+    ppi, tpi = analysis.compute_ppi_tpi_from_plays(client.get_game_plays("2025_03_LA_PHI"))
     ppi_dict = {}
     for player_entry in ppi:
         for player_name, arr in player_entry.items():
@@ -0,0 +1,142 @@
+"""
+Request instrumentation for the Pulse Mock API Client.
+
+A ClientStats instance collects counters and latency histograms keyed by
+endpoint pattern (e.g. /v1/leagues/{id}/teams/{id}) or cassette name, and
+optionally forwards every event to a hook callback. Clients only create one
+when instrumentation is enabled; when it is disabled the request path pays a
+single `is None` check.
+"""
+
+import threading
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+# Upper bounds of the histogram buckets, in milliseconds; the last bucket is open
+BUCKET_BOUNDS_MS: Tuple[float, ...] = (0.01, 0.05, 0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+
+# Path segments whose following segment is an identifier
+ID_COLLECTIONS = frozenset(('leagues', 'teams', 'players', 'games'))
+
+StatsHook = Callable[[str, Dict[str, Any]], None]
+
+
+def endpoint_pattern(url: str) -> str:
+    """
+    Return the endpoint pattern of a URL, with identifiers replaced by {id}.
+
+    Example:
+        endpoint_pattern('http://localhost:1339/v1/leagues/NFL/teams/T1/players')
+        -> '/v1/leagues/{id}/teams/{id}/players'
+    """
+    segments = urlparse(url).path.split('/')
+    for i in range(1, len(segments)):
+        if segments[i - 1] in ID_COLLECTIONS and segments[i]:
+            segments[i] = '{id}'
+    return '/'.join(segments)
+
+
+class Histogram:
+    """Latency histogram with fixed millisecond buckets."""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = float('inf')
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+
+    def add(self, ms: float) -> None:
+        self.count += 1
+        self.total += ms
+        if ms < self.min:
+            self.min = ms
+        if ms > self.max:
+            self.max = ms
+        self.buckets[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the histogram as plain data."""
+        return {
+            'count': self.count,
+            'total_ms': self.total,
+            'mean_ms': self.total / self.count if self.count else 0.0,
+            'min_ms': self.min if self.count else 0.0,
+            'max_ms': self.max,
+            'buckets': [[bound, n] for bound, n in zip(BUCKET_BOUNDS_MS + (None,), self.buckets)],
+        }
+
+
+class ClientStats:
+    """
+    Thread-safe counters and latency histograms for one client.
+
+    Timings recorded by MockAPIClient:
+        load    per cassette: reading, parsing and indexing a cassette
+        match   per endpoint: resolving a request to an interaction
+        decode  per endpoint: decoding a JSON body (every json() call by default,
+                cache misses only with share_decoded_json)
+
+    Counters recorded by MockAPIClient:
+        requests, request_misses, decode_hits, decode_misses, auto_load_scans
+                per endpoint
+        auto_load_reads, compiled_cache_hits, compiled_cache_misses
+                per cassette
+    """
+
+    def __init__(self, hook: Optional[StatsHook] = None):
+        """
+        Initialize the collector.
+
+        Args:
+            hook: Optional callable invoked as hook(event, fields) for every
+                recorded timing and counter, e.g. to forward to a metrics system.
+                Timings pass {'key', 'ms'}, counters {'key', 'count'}.
+        """
+        self.hook = hook
+        self._lock = threading.Lock()
+        self._timings: Dict[str, Dict[str, Histogram]] = {}
+        self._counters: Dict[str, Dict[str, int]] = {}
+
+    def timing(self, metric: str, key: str, seconds: float) -> None:
+        """Record a duration for metric under key."""
+        ms = seconds * 1000.0
+        with self._lock:
+            by_key = self._timings.setdefault(metric, {})
+            histogram = by_key.get(key)
+            if histogram is None:
+                histogram = by_key[key] = Histogram()
+            histogram.add(ms)
+        if self.hook is not None:
+            self.hook(metric, {'key': key, 'ms': ms})
+
+    def count(self, counter: str, key: str, n: int = 1) -> None:
+        """Increment counter under key by n."""
+        with self._lock:
+            by_key = self._counters.setdefault(counter, {})
+            by_key[key] = by_key.get(key, 0) + n
+        if self.hook is not None:
+            self.hook(counter, {'key': key, 'count': n})
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return a consistent copy of everything recorded so far.
+
+        Returns:
+            {'timings': {metric: {key: histogram}}, 'counters': {counter: {key: n}}}
+        """
+        with self._lock:
+            return {
+                'timings': {metric: {key: histogram.snapshot() for key, histogram in by_key.items()}
+                            for metric, by_key in self._timings.items()},
+                'counters': {counter: dict(by_key) for counter, by_key in self._counters.items()},
+            }
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._timings = {}
+            self._counters = {}
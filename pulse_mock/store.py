@@ -0,0 +1,370 @@
+"""
+Process-wide interaction store for the Pulse Mock API Client.
+
+Loaded interactions and their lookup index live in an InteractionStore that
+any number of clients and threads can share. Readers never lock: they read the
+current StoreSnapshot, which is never mutated once published. Writers build a
+new snapshot (copy-on-write) and publish it with a single attribute
+assignment. Each cassette is loaded exactly once even when many threads miss
+on it at the same time (single-flight), and a changed cassette can later be
+swapped for its re-read contents without touching the other cassettes.
+
+Response bodies are interned by content: every interaction recorded with an
+identical body - the same league list, team object or error payload in many
+cassettes - references one shared buffer, and its decoded JSON is cached once
+per unique body rather than once per recording. Header sets are pooled the
+same way, per store.
+"""
+
+import os
+import threading
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .interaction import Body, HeaderPool, Interaction
+
+Key = Tuple[str, str]
+# Lookup keys of one interaction; the first is its (METHOD, normalized URL) key
+Entry = Tuple[Tuple[Key, ...], Interaction]
+# Cassette file state recorded at load time, e.g. (mtime_ns, size); None if unknown
+Signature = Any
+
+
+class StoreSnapshot:
+    """An immutable view of the loaded cassettes and their index."""
+
+    __slots__ = ('interactions', 'loaded_cassettes', 'index', 'urls', 'version', 'cassettes')
+
+    def __init__(self, interactions: Tuple[Interaction, ...], loaded_cassettes: Tuple[str, ...],
+                 index: Dict[Key, Interaction], urls: FrozenSet[str], version: int,
+                 cassettes: Dict[str, Tuple[Signature, Tuple[Entry, ...]]]):
+        self.interactions = interactions
+        self.loaded_cassettes = loaded_cassettes
+        # Never mutated after the snapshot is published
+        self.index = index
+        self.urls = urls
+        self.version = version
+        # cassette name -> (signature, entries), for reloading single cassettes
+        self.cassettes = cassettes
+
+
+_EMPTY_SNAPSHOT = StoreSnapshot((), (), {}, frozenset(), 0, {})
+
+
+def _build_snapshot(loaded_cassettes: Tuple[str, ...],
+                    cassettes: Dict[str, Tuple[Signature, Tuple[Entry, ...]]], version: int) -> StoreSnapshot:
+    """Index the given cassettes' entries in load order."""
+    index: Dict[Key, Interaction] = {}
+    urls = set()
+    interactions = []
+    for cassette_name in loaded_cassettes:
+        for keys, interaction in cassettes[cassette_name][1]:
+            for key in keys:
+                index.setdefault(key, interaction)
+            urls.add(keys[0][1])
+            interactions.append(interaction)
+    return StoreSnapshot(tuple(interactions), loaded_cassettes, index, frozenset(urls), version, cassettes)
+
+
+class BodyPool:
+    """
+    Content-addressed pool of response bodies.
+
+    Bodies are keyed by their content (hash plus byte-wise equality, so two
+    different bodies can never be merged), and intern() returns the pooled
+    buffer for any body seen before. Bytes and memory-mapped memoryviews with
+    the same content intern to the same object.
+    """
+
+    def __init__(self):
+        self._bodies: Dict[Body, Body] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._bodies)
+
+    def intern(self, body: Body) -> Body:
+        """Return the pooled buffer with the same content as body, adding body if it is new."""
+        try:
+            pooled = self._bodies.get(body)
+        except TypeError:
+            # A writable memoryview is unhashable; serve it as is
+            return body
+        if pooled is not None:
+            return pooled
+        with self._lock:
+            return self._bodies.setdefault(body, body)
+
+    def retain(self, bodies: Iterable[Body]) -> None:
+        """Drop every pooled body that is not among bodies (by identity)."""
+        live = {id(body) for body in bodies}
+        with self._lock:
+            self._bodies = {key: body for key, body in self._bodies.items() if id(body) in live}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bodies = {}
+
+
+class _Flight:
+    """A cassette load in progress, awaited by concurrent requesters."""
+
+    __slots__ = ('done', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.error: Optional[BaseException] = None
+
+
+class InteractionStore:
+    """
+    Thread-safe, read-mostly store of loaded interactions.
+
+    Example:
+        store = InteractionStore.shared('/path/to/cassettes')
+        client_a = MockAPIClient('/path/to/cassettes', store=store)
+        client_b = MockAPIClient('/path/to/cassettes', store=store)
+    """
+
+    _registry: Dict[str, 'InteractionStore'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self):
+        self._snapshot = _EMPTY_SNAPSHOT
+        self._write_lock = threading.Lock()
+        self._flights: Dict[str, _Flight] = {}
+        self.bodies = BodyPool()
+        self.headers = HeaderPool()
+        # id(body) -> (body, decoded body); bodies are interned, so identical
+        # bodies share one entry. The body is kept so a recycled id can never
+        # return another body's decode.
+        self._decoded: Dict[int, Tuple[Body, Any]] = {}
+        self._manifest: Any = None
+        self._manifest_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, cassette_dir: str) -> 'InteractionStore':
+        """
+        Return the process-wide store for a cassette directory, creating it on first use.
+
+        Args:
+            cassette_dir: Directory containing the cassette files
+
+        Returns:
+            The InteractionStore shared by every client of that directory
+            created with store=InteractionStore.shared(cassette_dir)
+        """
+        key = os.path.realpath(cassette_dir)
+        with cls._registry_lock:
+            store = cls._registry.get(key)
+            if store is None:
+                store = cls._registry[key] = cls()
+            return store
+
+    @property
+    def snapshot(self) -> StoreSnapshot:
+        """The current snapshot; safe to read from any thread without locking."""
+        return self._snapshot
+
+    def lookup(self, key: Key) -> Optional[Interaction]:
+        """Return the first recorded interaction for a (METHOD, normalized URL) key."""
+        return self._snapshot.index.get(key)
+
+    def has_url(self, normalized_url: str) -> bool:
+        """Return True if any loaded interaction records the normalized URL."""
+        return normalized_url in self._snapshot.urls
+
+    def is_loaded(self, cassette_name: str) -> bool:
+        """Return True if the cassette has been loaded into the store."""
+        return cassette_name in self._snapshot.loaded_cassettes
+
+    def signature(self, cassette_name: str) -> Signature:
+        """Return the signature a loaded cassette was read with, or None."""
+        loaded = self._snapshot.cassettes.get(cassette_name)
+        return loaded[0] if loaded is not None else None
+
+    def load(self, cassette_name: str, read_entries: Callable[[], Tuple[Signature, List[Entry]]]) -> bool:
+        """
+        Load a cassette once, publishing its interactions in a new snapshot.
+
+        Concurrent calls for the same cassette wait for the first caller's load
+        instead of reading the file again. Keys already in the index keep their
+        interaction, so the first recorded match wins.
+
+        Args:
+            cassette_name: Cassette filename, used to track what has been loaded
+            read_entries: Callable returning the cassette's signature and its
+                (keys, interaction) pairs, where keys[0] is the (METHOD, normalized
+                URL) key; called at most once per successful load
+
+        Returns:
+            True if this call loaded the cassette, False if it was already loaded
+
+        Raises:
+            Whatever read_entries raises, in the loading thread and in every
+            thread that was waiting on it
+        """
+        with self._write_lock:
+            if cassette_name in self._snapshot.loaded_cassettes:
+                return False
+            flight = self._flights.get(cassette_name)
+            leader = flight is None
+            if leader:
+                flight = self._flights[cassette_name] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return False
+
+        try:
+            signature, entries = read_entries()
+            with self._write_lock:
+                self._publish(cassette_name, signature, entries)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._write_lock:
+                self._flights.pop(cassette_name, None)
+            flight.done.set()
+        return True
+
+    def _publish(self, cassette_name: str, signature: Signature, entries: Iterable[Entry]) -> None:
+        """Publish a snapshot extended with a cassette's entries. Caller holds the write lock."""
+        current = self._snapshot
+        entries = tuple(entries)
+        index = dict(current.index)
+        urls = set(current.urls)
+        interactions = list(current.interactions)
+        for keys, interaction in entries:
+            for key in keys:
+                index.setdefault(key, interaction)
+            urls.add(keys[0][1])
+            interactions.append(interaction)
+        cassettes = dict(current.cassettes)
+        cassettes[cassette_name] = (signature, entries)
+        self._snapshot = StoreSnapshot(
+            tuple(interactions),
+            current.loaded_cassettes + (cassette_name,),
+            index,
+            frozenset(urls),
+            current.version + 1,
+            cassettes,
+        )
+
+    def replace(self, changes: Dict[str, Optional[Tuple[Signature, List[Entry]]]]) -> List[str]:
+        """
+        Atomically swap the contents of loaded cassettes.
+
+        All changes are published in one new snapshot: readers see either every
+        old cassette or every new one. A reloaded cassette keeps its place in the
+        load order, so "first recorded match wins" is unaffected by the reload.
+
+        Args:
+            changes: cassette name -> (signature, entries) re-read from disk, or
+                None to unload a cassette that was deleted. Cassettes that are
+                not loaded, or already carry the given signature (another client
+                reloaded them first), are skipped.
+
+        Returns:
+            Names of the cassettes that were replaced or unloaded
+        """
+        with self._write_lock:
+            current = self._snapshot
+            cassettes = dict(current.cassettes)
+            applied = []
+            for cassette_name, change in changes.items():
+                loaded = cassettes.get(cassette_name)
+                if loaded is None or (change is not None and change[0] == loaded[0]):
+                    continue
+                if change is None:
+                    del cassettes[cassette_name]
+                else:
+                    cassettes[cassette_name] = (change[0], tuple(change[1]))
+                applied.append(cassette_name)
+            if not applied:
+                return []
+            loaded_cassettes = tuple(name for name in current.loaded_cassettes if name in cassettes)
+            self._snapshot = _build_snapshot(loaded_cassettes, cassettes, current.version + 1)
+            live = [interaction.body for interaction in self._snapshot.interactions]
+            self.bodies.retain(live)
+            self.headers.retain(interaction.headers for interaction in self._snapshot.interactions)
+            live_ids = {id(body) for body in live}
+            self._decoded = {key: value for key, value in self._decoded.items() if key in live_ids}
+        return applied
+
+    def clear(self) -> None:
+        """Drop every loaded cassette, interaction and cached decoded body."""
+        with self._write_lock:
+            self._snapshot = StoreSnapshot((), (), {}, frozenset(), self._snapshot.version + 1, {})
+            self.bodies.clear()
+            self.headers.clear()
+            self._decoded = {}
+
+    def get_decoded(self, interaction: Interaction, decode: Callable[[Interaction], Any]) -> Any:
+        """
+        Return the decoded body of an interaction, decoding it on first use.
+
+        The decode is cached per body, so interactions sharing an interned body
+        share its decode. Two threads may race to decode the same body; both results are
+        equivalent and the last one stored wins.
+
+        Args:
+            interaction: A loaded interaction
+            decode: Callable producing the decoded body from the interaction
+        """
+        body = interaction.body
+        cached = self._decoded.get(id(body))
+        if cached is not None and cached[0] is body:
+            return cached[1]
+        data = decode(interaction)
+        self._decoded[id(body)] = (body, data)
+        return data
+
+    def forget_decoded(self, interaction: Interaction) -> None:
+        """Drop the cached decoded body of an interaction that is no longer served."""
+        body = interaction.body
+        cached = self._decoded.get(id(body))
+        if cached is not None and cached[0] is body:
+            self._decoded.pop(id(body), None)
+
+    def body_stats(self) -> Dict[str, int]:
+        """
+        Report how much body memory interning saves across the loaded interactions.
+
+        Returns:
+            Dict with 'bodies' (recorded bodies), 'unique_bodies', 'total_bytes'
+            (what holding every recording separately would take), 'unique_bytes'
+            and 'bytes_saved'
+        """
+        total_bytes = 0
+        unique: Dict[int, int] = {}
+        interactions = self._snapshot.interactions
+        for interaction in interactions:
+            size = len(interaction.body)
+            total_bytes += size
+            unique[id(interaction.body)] = size
+        unique_bytes = sum(unique.values())
+        return {
+            'bodies': len(interactions),
+            'unique_bodies': len(unique),
+            'total_bytes': total_bytes,
+            'unique_bytes': unique_bytes,
+            'bytes_saved': total_bytes - unique_bytes,
+        }
+
+    def get_manifest(self, factory: Callable[[], Any]) -> Any:
+        """Return the store's cassette manifest, creating it once with factory()."""
+        manifest = self._manifest
+        if manifest is None:
+            with self._manifest_lock:
+                if self._manifest is None:
+                    self._manifest = factory()
+                manifest = self._manifest
+        return manifest
+
+    def reset_manifest(self) -> None:
+        """Forget the cassette manifest so the next get_manifest() refreshes it."""
+        with self._manifest_lock:
+            self._manifest = None
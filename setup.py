@@ -45,6 +45,11 @@ setup(
             "mypy>=0.812",
         ],
     },
+    entry_points={
+        "console_scripts": [
+            "pulse-mock=pulse_mock.cli:main",
+        ],
+    },
     keywords="mock api testing vcr cassettes development",
     project_urls={
         "Bug Reports": "https://github.com/yourusername/pulse-mock/issues",
@@ -0,0 +1,123 @@
+"""
+Shared fixtures: a small cassette directory written fresh for every test.
+"""
+import asyncio
+import json
+import os
+import sys
+
+import pytest
+import yaml
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from pulse_mock.cassettes.generate_cassettes_from_csv import make_yaml_for_game  # noqa: E402
+from pulse_mock.http_server import MockHTTPProtocol  # noqa: E402
+
+BASE_URL = 'http://localhost:1339'
+
+TEAMS = [
+    {'id': 'T_PHI', 'name': 'Eagles', 'market': 'Philadelphia', 'abbreviation': 'PHI'},
+    {'id': 'T_DAL', 'name': 'Cowboys', 'market': 'Dallas', 'abbreviation': 'DAL'},
+]
+
+PLAYERS = [
+    {'id': 'P1', 'first_name': 'Jalen', 'last_name': 'Hurts', 'position': 'QB', 'team': TEAMS[0]},
+    {'id': 'P2', 'first_name': 'A.J.', 'last_name': 'Brown', 'position': 'WR', 'team': TEAMS[0]},
+    {'id': 'P3', 'first_name': 'Dak', 'last_name': 'Prescott', 'position': 'QB', 'team': TEAMS[1]},
+]
+
+GAMES = [
+    {'id': 'G1', 'scheduled_at': '2025-09-05T00:20:00Z', 'status': 'closed',
+     'home_team': TEAMS[0], 'away_team': TEAMS[1]},
+]
+
+PLAYS = [
+    {'home_team': 'PHI', 'game_seconds_remaining': 3600.0, 'yards_gained': 5.0,
+     'passer_player_name': 'J.Hurts', 'qb_epa': 0.5, 'wpa': 0.01},
+    {'home_team': 'PHI', 'game_seconds_remaining': 3550.0, 'yards_gained': None,
+     'passer_player_name': None, 'qb_epa': -0.25, 'wpa': -0.02},
+]
+
+
+def interaction(url, body, method='GET', code=200):
+    """Return a cassette interaction recording body (JSON-encoded unless a str)."""
+    return {
+        'request': {'body': '', 'form': {}, 'headers': {}, 'method': method, 'url': BASE_URL + url},
+        'response': {
+            'body': body if isinstance(body, str) else json.dumps(body),
+            'code': code,
+            'headers': {'Content-Type': ['application/json']},
+            'status': f'{code} OK',
+        },
+    }
+
+
+def write_cassette(path, interactions):
+    with open(path, 'w', encoding='utf-8') as f:
+        yaml.safe_dump({'version': 1, 'interactions': interactions}, f)
+
+
+def bump_mtime(path):
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def http_request(path, method='GET', headers=None, close=False):
+    lines = [f'{method} {path} HTTP/1.1', 'Host: localhost']
+    lines += [f'{name}: {value}' for name, value in (headers or {}).items()]
+    if close:
+        lines.append('Connection: close')
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1')
+
+
+def parse_responses(data, requests):
+    """Split pipelined responses into (status, headers, body) tuples."""
+    responses = []
+    for sent in requests:
+        head, _, data = data.partition(b'\r\n\r\n')
+        status_line, *header_lines = head.decode('latin-1').split('\r\n')
+        headers = dict(line.split(': ', 1) for line in header_lines)
+        size = 0 if sent.startswith(b'HEAD ') else int(headers.get('Content-Length', 0))
+        body, data = data[:size], data[size:]
+        responses.append((int(status_line.split(' ')[1]), headers, body))
+    assert data == b''
+    return responses
+
+
+def exchange(routes, *requests):
+    """Send pipelined requests (the last one closing the connection) and return the parsed responses."""
+    async def run():
+        loop = asyncio.get_running_loop()
+        server = await loop.create_server(lambda: MockHTTPProtocol(routes), '127.0.0.1', 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(b''.join(requests))
+            data = await asyncio.wait_for(reader.read(), 10)
+            writer.close()
+            return data
+    return parse_responses(asyncio.run(run()), requests)
+
+
+@pytest.fixture
+def cassette_dir(tmp_path):
+    """A cassette directory with leagues, teams, players, games and one game's plays."""
+    write_cassette(tmp_path / 'leagues.yaml', [interaction('/v1/leagues', [{'id': 'NFL'}])])
+    write_cassette(tmp_path / 'teams.yaml', [interaction('/v1/leagues/NFL/teams', TEAMS)] + [
+        interaction(f"/v1/leagues/NFL/teams/{team['id']}", team) for team in TEAMS
+    ])
+    write_cassette(tmp_path / 'players.yaml', [interaction('/v1/leagues/NFL/players', {'players': PLAYERS})] + [
+        interaction(f"/v1/leagues/NFL/players/{player['id']}", player) for player in PLAYERS
+    ] + [
+        interaction(f"/v1/leagues/NFL/teams/{team['id']}/players",
+                    [player for player in PLAYERS if player['team']['id'] == team['id']])
+        for team in TEAMS
+    ])
+    write_cassette(tmp_path / 'games.yaml', [interaction('/v1/leagues/NFL/games', GAMES)] + [
+        interaction(f"/v1/leagues/NFL/games/{game['id']}", game) for game in GAMES
+    ])
+    games_dir = tmp_path / 'jhurts_games'
+    games_dir.mkdir()
+    (games_dir / '2025_01_DAL_PHI.yaml').write_text(make_yaml_for_game('2025_01_DAL_PHI', PLAYS), encoding='utf-8')
+    return str(tmp_path)
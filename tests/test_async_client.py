@@ -0,0 +1,51 @@
+import asyncio
+import threading
+
+from pulse_mock import AsyncNFLMockClient, MockAPIClient, NFLMockClient
+
+from conftest import BASE_URL
+
+LEAGUES = f'{BASE_URL}/v1/leagues'
+
+
+class RecordingNFLMockClient(NFLMockClient):
+    def __init__(self, *args, **kwargs):
+        self.created_on_loop_thread = threading.current_thread() is threading.main_thread()
+        super().__init__(*args, **kwargs)
+
+
+class RecordingAsyncNFLMockClient(AsyncNFLMockClient):
+    _client_class = RecordingNFLMockClient
+
+
+def test_create_builds_the_client_in_the_executor(cassette_dir):
+    async def run():
+        client = await RecordingAsyncNFLMockClient.create(cassette_dir=cassette_dir)
+        return client, await client.get_leagues()
+
+    client, leagues = asyncio.run(run())
+    assert isinstance(client.client, RecordingNFLMockClient)
+    assert not client.client.created_on_loop_thread
+    assert 'leagues.yaml' in client.client.loaded_cassettes
+    assert leagues == [{'id': 'NFL'}]
+
+
+def test_try_request_answers_only_from_loaded_interactions(cassette_dir):
+    client = MockAPIClient(cassette_dir, collect_stats=True)
+    assert client.try_request('GET', LEAGUES) is None
+    assert client.loaded_cassettes == ()
+    assert client.get(LEAGUES).json() == [{'id': 'NFL'}]
+    assert client.try_request('get', LEAGUES).json() == [{'id': 'NFL'}]
+    assert client.stats()['counters']['requests'] == {'/v1/leagues': 2}
+
+
+def test_async_requests_fall_back_to_the_executor(cassette_dir):
+    async def run(client):
+        first = await client.get_json(LEAGUES)
+        second = await client.get_json(LEAGUES)
+        return first, second
+
+    sync_client = NFLMockClient(cassette_dir, auto_load_all=False, collect_stats=True)
+    client = AsyncNFLMockClient(sync_client)
+    assert asyncio.run(run(client)) == ([{'id': 'NFL'}], [{'id': 'NFL'}])
+    assert sync_client.stats()['counters']['requests'] == {'/v1/leagues': 2}
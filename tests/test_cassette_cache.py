@@ -0,0 +1,56 @@
+import functools
+
+from pulse_mock import MockAPIClient
+from pulse_mock.cassette_cache import CassetteCache, parse_cassette_file
+
+from conftest import BASE_URL, bump_mtime, interaction, write_cassette
+
+URL = f'{BASE_URL}/v1/value'
+
+
+def write_value(path, value):
+    write_cassette(path, [interaction('/v1/value', {'v': value})])
+
+
+def rewriting_parse(path, value):
+    """Parse a cassette, then rewrite it as a writer racing the parse would."""
+    data = parse_cassette_file(path)
+    write_value(path, value)
+    bump_mtime(path)
+    return data
+
+
+def test_changed_source_invalidates_entry(tmp_path):
+    path = str(tmp_path / 'value.yaml')
+    write_value(path, 1)
+    cache = CassetteCache(str(tmp_path / 'cache'))
+    cache.load(path)
+    assert cache.get(path) is not None
+
+    write_value(path, 22)
+    bump_mtime(path)
+    assert cache.get(path) is None
+    assert cache.load(path)['interactions'][0]['response']['body'].tobytes() == b'{"v": 22}'
+
+
+def test_source_rewritten_during_parse_is_not_cached_under_new_key(tmp_path):
+    path = str(tmp_path / 'value.yaml')
+    write_value(path, 1)
+    cache = CassetteCache(str(tmp_path / 'cache'))
+    data = cache.load(path, parse=functools.partial(rewriting_parse, value=22))
+    assert data['interactions'][0]['response']['body'] == '{"v": 1}'
+    # The entry was stored under the pre-parse state, so it is already stale
+    assert cache.get(path) is None
+
+
+def test_client_serves_rewritten_cassette_after_race(tmp_path):
+    write_value(str(tmp_path / 'value.yaml'), 1)
+    client = MockAPIClient(str(tmp_path), use_manifest=False)
+    load = client._cassette_cache.load
+    client._cassette_cache.load = functools.partial(load, parse=functools.partial(rewriting_parse, value=22))
+    assert client.get(URL).json() == {'v': 1}
+    client._cassette_cache.load = load
+
+    assert client.reload_changed_cassettes() == ['value.yaml']
+    assert client.get(URL).json() == {'v': 22}
+    assert MockAPIClient(str(tmp_path), use_manifest=False).get(URL).json() == {'v': 22}
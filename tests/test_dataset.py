@@ -0,0 +1,59 @@
+import csv
+import json
+
+import pytest
+
+from pulse_mock.cassettes.generate_cassettes_from_csv import (
+    KEY_ORDER, NO_PASSER_PARTITION, UNKNOWN_SEASON_PARTITION, iter_game_rows, write_dataset,
+)
+
+pd = pytest.importorskip('pandas')
+pytest.importorskip('pyarrow')
+
+ROWS = [
+    {'game_id': '2025_01_DAL_PHI', 'home_team': 'PHI', 'game_seconds_remaining': '3600',
+     'passer_player_name': 'J.Hurts', 'receiver_player_name': 'A.Brown', 'qb_epa': '0.5', 'wpa': '0.01'},
+    {'game_id': '2025_01_DAL_PHI', 'home_team': 'PHI', 'game_seconds_remaining': '3550',
+     'passer_player_name': '', 'receiver_player_name': '', 'qb_epa': '-0.25', 'wpa': ''},
+    {'game_id': '2025_02_PHI_KC', 'home_team': 'KC', 'game_seconds_remaining': '1200',
+     'passer_player_name': 'P.Mahomes', 'receiver_player_name': '', 'qb_epa': '1.5', 'wpa': '0.2'},
+    {'game_id': 'preseason_DAL_PHI', 'home_team': 'PHI', 'game_seconds_remaining': '60',
+     'passer_player_name': '', 'receiver_player_name': '', 'qb_epa': '', 'wpa': '-0.1'},
+]
+
+
+def column_values(df, column):
+    return [None if pd.isna(v) else v for v in df[column]]
+
+
+def test_whole_dataset_reads_back_with_read_parquet(tmp_path):
+    csv_path = tmp_path / 'plays.csv'
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=['game_id'] + KEY_ORDER)
+        writer.writeheader()
+        writer.writerows(ROWS)
+    dataset_dir = tmp_path / 'dataset'
+    written = write_dataset(iter_game_rows(str(csv_path)), str(dataset_dir))
+    assert f'season=2025/game_id=2025_01_DAL_PHI/passer_player_name={NO_PASSER_PARTITION}/part-0.parquet' in written
+    assert all('__HIVE_DEFAULT_PARTITION__' not in path for path in written)
+
+    df = pd.read_parquet(dataset_dir)
+    assert len(df) == len(ROWS)
+    df['passer_player_name'] = df['passer_player_name'].astype(str)
+    df['game_id'] = df['game_id'].astype(str)
+    df = df.sort_values(['game_id', 'play_index']).reset_index(drop=True)
+
+    expected = sorted(ROWS, key=lambda row: row['game_id'])
+    assert list(df['game_id']) == [row['game_id'] for row in expected]
+    assert list(df['passer_player_name']) == [row['passer_player_name'] or NO_PASSER_PARTITION for row in expected]
+    assert [int(s) for s in df['season']] == [2025, 2025, 2025, UNKNOWN_SEASON_PARTITION]
+    assert list(df['play_index']) == [0, 1, 0, 0]
+    for column in ('qb_epa', 'wpa', 'game_seconds_remaining'):
+        assert column_values(df, column) == [float(row[column]) if row[column] else None for row in expected]
+    assert column_values(df, 'receiver_player_name') == [row['receiver_player_name'] or None for row in expected]
+
+    stats = json.loads((dataset_dir / '_stats.json').read_text(encoding='utf-8'))
+    assert sum(entry['rows'] for entry in stats['files']) == len(ROWS)
+
+    hurts = pd.read_parquet(dataset_dir, columns=['wpa'], filters=[('passer_player_name', '==', 'J.Hurts')])
+    assert list(hurts['wpa']) == [0.01]
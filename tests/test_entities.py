@@ -0,0 +1,150 @@
+from datetime import date, datetime, timezone
+
+import pytest
+
+from pulse_mock import NFLMockClient
+from pulse_mock.entities import SortedGames
+
+from conftest import interaction, write_cassette
+
+TEAMS = [
+    {'id': 'T_PHI', 'name': 'Eagles', 'market': 'Philadelphia', 'abbreviation': 'PHI'},
+    {'id': 'T_DAL', 'name': 'Cowboys', 'market': 'Dallas', 'abbreviation': 'DAL'},
+    {'id': 'T_NYG', 'name': 'Giants', 'market': 'New York', 'abbreviation': 'NYG'},
+    {'id': 'T_NYJ', 'name': 'Jets', 'market': 'New York', 'abbreviation': 'NYJ'},
+]
+
+PLAYERS = [
+    {'id': 'P1', 'first_name': 'Jalen', 'last_name': 'Hurts', 'position': 'QB', 'team': TEAMS[0]},
+    {'id': 'P2', 'first_name': 'A.J.', 'last_name': 'Brown', 'position': 'WR', 'team': TEAMS[0]},
+    {'id': 'P3', 'first_name': 'Dak', 'last_name': 'Prescott', 'position': 'qb', 'team': TEAMS[1]},
+    {'id': 'P4', 'first_name': 'CeeDee', 'last_name': 'Lamb', 'position': 'WR', 'team': TEAMS[1]},
+    {'id': 'P5', 'first_name': 'Saquon', 'last_name': 'Barkley', 'position': 'RB', 'team': TEAMS[0]},
+    {'id': 'P6', 'first_name': 'Malik', 'last_name': 'Nabers', 'team': TEAMS[2]},
+    {'id': 'P7', 'first_name': 'Jalen', 'last_name': 'Carter', 'position': 'DT', 'team': TEAMS[0]},
+]
+
+GAMES = [
+    {'id': 'G1', 'scheduled_at': '2025-09-05T00:20:00Z', 'status': 'closed', 'home_team': TEAMS[0], 'away_team': TEAMS[1]},
+    {'id': 'G2', 'scheduled_at': '2025-09-14T20:25:00Z', 'status': 'closed', 'home_team': TEAMS[2], 'away_team': TEAMS[1]},
+    {'id': 'G3', 'scheduled_at': '2025-10-09T23:15:00Z', 'status': 'scheduled', 'home_team': TEAMS[2], 'away_team': TEAMS[0]},
+    {'id': 'G4', 'scheduled_at': '2025-11-23T21:25:00Z', 'status': 'scheduled', 'home_team': TEAMS[1], 'away_team': TEAMS[0]},
+    {'id': 'G5', 'scheduled_at': '2025-12-28T18:00:00Z', 'status': 'postponed', 'home_team': TEAMS[3], 'away_team': TEAMS[2]},
+]
+
+
+def team_games(team_id):
+    return [game for game in GAMES if team_id in (game['home_team']['id'], game['away_team']['id'])]
+
+
+@pytest.fixture
+def league_dir(tmp_path):
+    write_cassette(tmp_path / 'teams.yaml', [interaction('/v1/leagues/NFL/teams', TEAMS)] + [
+        interaction(f"/v1/leagues/NFL/teams/{team['id']}", team) for team in TEAMS
+    ] + [
+        interaction(f"/v1/leagues/NFL/teams/{team['id']}/players",
+                    [player for player in PLAYERS if player['team']['id'] == team['id']])
+        for team in TEAMS
+    ] + [
+        interaction(f"/v1/leagues/NFL/teams/{team['id']}/games", team_games(team['id'])) for team in TEAMS
+    ])
+    write_cassette(tmp_path / 'players.yaml', [interaction('/v1/leagues/NFL/players', {'players': PLAYERS})])
+    write_cassette(tmp_path / 'games.yaml', [interaction('/v1/leagues/NFL/games', GAMES)])
+    return str(tmp_path)
+
+
+@pytest.fixture
+def clients(league_dir):
+    """An NFLMockClient answering from the entity graph and one that always scans the endpoint lists."""
+    indexed = NFLMockClient(league_dir)
+    linear = NFLMockClient(league_dir)
+    linear.get_entities = lambda league='NFL': None
+    assert indexed.get_entities() is not None
+    return indexed, linear
+
+
+@pytest.mark.parametrize('name', ['Eagles', 'eag', 'new york', 'NYJ', 'ny', 'DAL', 'da', 'x', ''])
+def test_find_team_by_name_matches_the_linear_scan(clients, name):
+    indexed, linear = clients
+    assert indexed.find_team_by_name(name) == linear.find_team_by_name(name)
+
+
+@pytest.mark.parametrize('name', ['jalen', 'JALEN H', 'a.j', 'b', 'n h', 'dee', 'lamb', 'zz', ''])
+def test_find_player_by_name_matches_the_linear_scan(clients, name):
+    indexed, linear = clients
+    assert indexed.find_player_by_name(name) == linear.find_player_by_name(name)
+    assert indexed.find_player_by_name(name, limit=1) == linear.find_player_by_name(name, limit=1)
+
+
+def test_filters_and_statistics_match_the_linear_scans(clients):
+    indexed, linear = clients
+    for position in ('QB', 'wr', 'RB', 'K', ''):
+        for team_id in (None, 'T_PHI', 'T_DAL', 'T_NYG'):
+            assert indexed.get_players_by_position(position, team_id) == linear.get_players_by_position(position, team_id)
+    for team1 in ('T_PHI', 'T_DAL', 'T_NYG', 'T_NYJ'):
+        for team2 in ('T_PHI', 'T_DAL', 'T_NYG', 'T_NYJ', 'T_NONE'):
+            assert indexed.get_games_between_teams(team1, team2) == linear.get_games_between_teams(team1, team2)
+        assert indexed.get_team_statistics(team1) == linear.get_team_statistics(team1)
+
+
+EDGE_GAMES = [
+    {'id': 'E1', 'scheduled_at': '2025-09-07T23:59:59Z'},
+    {'id': 'E2', 'scheduled_at': '2025-09-07T00:00:00Z'},
+    {'id': 'E3', 'scheduled_at': '2025-09-08T01:00:00+02:00'},
+    {'id': 'E4', 'scheduled_at': '2025-09-07T20:00:00-05:00'},
+    {'id': 'E5', 'scheduled_at': '2025-09-06T23:59:59Z'},
+    {'id': 'E6', 'scheduled_at': '2025-09-07T12:00:00'},
+    {'id': 'E7', 'scheduled_at': None},
+    {'id': 'E8', 'scheduled_at': 'TBD'},
+    {'id': 'E9', 'scheduled_at': '2025-09-07T12:00:00Z'},
+]
+
+
+def utc_time(game):
+    try:
+        parsed = datetime.fromisoformat(game['scheduled_at'].replace('Z', '+00:00'))
+    except (AttributeError, ValueError):
+        return None
+    return parsed.astimezone(timezone.utc).replace(tzinfo=None) if parsed.tzinfo else parsed
+
+
+def linear_between(games, from_date, to_date):
+    """Scan every game: keep those whose UTC day lies in [from_date, to_date], sorted by time."""
+    scheduled = sorted((game for game in games if utc_time(game) is not None), key=utc_time)
+    if from_date is None and to_date is None:
+        return scheduled + [game for game in games if utc_time(game) is None]
+    return [game for game in scheduled
+            if (from_date is None or utc_time(game).date() >= from_date)
+            and (to_date is None or utc_time(game).date() <= to_date)]
+
+
+DAYS = [None, date(2025, 9, 6), date(2025, 9, 7), date(2025, 9, 8), date(2025, 9, 9)]
+
+
+@pytest.mark.parametrize('from_date', DAYS)
+@pytest.mark.parametrize('to_date', DAYS)
+def test_date_bounds_are_inclusive_utc_days(from_date, to_date):
+    games = SortedGames(EDGE_GAMES)
+    expected = [game['id'] for game in linear_between(EDGE_GAMES, from_date, to_date)]
+    for bounds in ((from_date, to_date),
+                   (from_date and from_date.isoformat(), to_date and to_date.isoformat()),
+                   (from_date and datetime.combine(from_date, datetime.max.time()),
+                    to_date and datetime.combine(to_date, datetime.min.time()))):
+        assert [game['id'] for game in games.between(*bounds)] == expected
+
+
+def test_single_day_range_keeps_only_that_utc_day():
+    games = SortedGames(EDGE_GAMES)
+    assert [game['id'] for game in games.between('2025-09-07', '2025-09-07')] == ['E2', 'E6', 'E9', 'E3', 'E1']
+    assert games.between('2025-09-08', '2025-09-07') == []
+
+
+def test_get_games_matches_the_linear_filter(clients):
+    indexed, linear = clients
+    for bounds in ((None, None), ('2025-09-05', None), (None, '2025-10-09'), ('2025-09-06', '2025-11-23'),
+                   (date(2025, 10, 10), date(2025, 12, 31))):
+        for team_id in (None, 'T_PHI', 'T_NYJ'):
+            expected = linear_between(team_games(team_id) if team_id else GAMES,
+                                      *(date.fromisoformat(b) if isinstance(b, str) else b for b in bounds))
+            assert indexed.get_games(*bounds, team_id=team_id) == expected
+            assert linear.get_games(*bounds, team_id=team_id) == expected
@@ -0,0 +1,70 @@
+import pytest
+
+from pulse_mock import MockAPIClient, NFLMockClient
+
+from conftest import BASE_URL
+
+LEAGUES = f'{BASE_URL}/v1/leagues'
+
+
+def test_json_is_mutable_by_default(cassette_dir):
+    client = MockAPIClient(cassette_dir)
+    leagues = client.get(LEAGUES).json()
+    leagues[0]['id'] = 'XFL'
+    assert client.get(LEAGUES).json() == [{'id': 'NFL'}]
+
+
+def test_shared_json_is_read_only(cassette_dir):
+    client = MockAPIClient(cassette_dir, share_decoded_json=True)
+    leagues = client.get(LEAGUES).json()
+    assert client.get(LEAGUES).json() is leagues
+    with pytest.raises(TypeError):
+        leagues[0]['id'] = 'XFL'
+    with pytest.raises(TypeError):
+        leagues.append({'id': 'XFL'})
+
+    copy = client.get(LEAGUES).json(copy=True)
+    copy[0]['id'] = 'XFL'
+    assert client.get(LEAGUES).json() == [{'id': 'NFL'}]
+
+
+def test_entity_helpers_return_mutable_copies_by_default(cassette_dir):
+    client = NFLMockClient(cassette_dir)
+    team = client.find_team_by_name('Eagles')
+    team['name'] = 'Birds'
+    assert client.find_team_by_name('Eagles')['name'] == 'Eagles'
+
+    qbs = client.get_players_by_position('QB')
+    qbs[0]['team']['id'] = None
+    qbs.clear()
+    assert [p['id'] for p in client.get_players_by_position('QB')] == ['P1', 'P3']
+    assert client.get_players_by_position('QB')[0]['team']['id'] == 'T_PHI'
+
+
+def test_entity_helpers_share_frozen_objects_when_asked(cassette_dir):
+    client = NFLMockClient(cassette_dir, share_decoded_json=True)
+    team = client.find_team_by_name('Eagles')
+    assert client.find_team_by_name('Eagles') is team
+    with pytest.raises(TypeError):
+        team['name'] = 'Birds'
+
+
+def test_game_data_is_mutable_by_default(cassette_dir):
+    client = NFLMockClient(cassette_dir)
+    game, = client.get_game_data()
+    assert game['game_id'] == '2025_01_DAL_PHI'
+    game['plays'][0]['yards_gained'] = 99.0
+    game['plays'].clear()
+    fresh, = client.get_game_data()
+    assert len(fresh['plays']) == 2
+    assert fresh['plays'][0]['yards_gained'] == 5.0
+
+
+def test_shared_game_data_is_read_only(cassette_dir):
+    client = NFLMockClient(cassette_dir, share_decoded_json=True)
+    game, = client.get_game_data()
+    assert client.get_game_data()[0] is game
+    with pytest.raises(TypeError):
+        game['plays'][0]['yards_gained'] = 99.0
+    with pytest.raises(TypeError):
+        game['plays'].clear()
@@ -0,0 +1,75 @@
+import json
+from pathlib import Path
+
+import pytest
+import yaml
+
+from pulse_mock import NFLMockClient
+from pulse_mock.cassettes.generate_cassettes_from_csv import make_yaml_for_game
+from pulse_mock.games import iter_plays
+
+from conftest import PLAYS
+
+MORE_PLAYS = PLAYS + [
+    {'home_team': 'PHI', 'game_seconds_remaining': 12.0, 'passer_player_name': 'Señor "Q" Back\\\\',
+     'receiver_player_name': 'Ja\'Marr', 'wp': 1e-07, 'wpa': -0.0, 'air_epa': 123456789.125},
+    {},
+]
+
+
+def full_parse(path):
+    """The baseline read: parse the whole YAML document and decode the first non-empty body."""
+    with open(path, encoding='utf-8') as f:
+        cassette = yaml.safe_load(f)
+    for interaction in cassette['interactions']:
+        body = interaction['response'].get('body')
+        if body:
+            return json.loads(body)
+    return None
+
+
+def no_parse(path):
+    raise AssertionError(f'{path} was parsed in full')
+
+
+@pytest.fixture
+def game_path(tmp_path):
+    (tmp_path / 'src').mkdir()
+    path = tmp_path / 'src' / '2025_05_NYG_PHI.yaml'
+    path.write_text(make_yaml_for_game('2025_05_NYG_PHI', MORE_PLAYS), encoding='utf-8')
+    return str(path)
+
+
+def test_generated_cassette_streams_the_full_parse_plays(game_path):
+    plays = list(iter_plays(game_path, no_parse))
+    assert plays == full_parse(game_path)
+    assert len(plays) == len(MORE_PLAYS) and plays[-1] == dict.fromkeys(plays[0])
+
+
+def test_other_layouts_fall_back_to_the_full_parse(game_path, tmp_path):
+    dumped = tmp_path / 'dumped.yaml'
+    with open(game_path, encoding='utf-8') as f, open(dumped, 'w', encoding='utf-8') as out:
+        yaml.safe_dump(yaml.safe_load(f), out)
+    assert list(iter_plays(str(dumped))) == full_parse(dumped)
+
+    # A play split over two lines stops the stream midway; the rest comes from the full parse
+    with open(game_path, encoding='utf-8') as f:
+        lines = f.read().split('\n')
+    play_lines = [i for i, line in enumerate(lines) if line.startswith('          {')]
+    lines[play_lines[2]] = lines[play_lines[2]].replace(', ', ',\n          ', 1)
+    split = tmp_path / 'split.yaml'
+    split.write_text('\n'.join(lines), encoding='utf-8')
+    assert list(iter_plays(str(split))) == full_parse(split) == full_parse(game_path)
+
+
+def test_client_game_plays_match_the_full_parse(cassette_dir, game_path):
+    games_dir = Path(cassette_dir) / 'jhurts_games'
+    (games_dir / '2025_05_NYG_PHI.yaml').write_text(Path(game_path).read_text(encoding='utf-8'), encoding='utf-8')
+    client = NFLMockClient(cassette_dir)
+    for game_id in ('2025_01_DAL_PHI', '2025_05_NYG_PHI'):
+        expected = full_parse(games_dir / f'{game_id}.yaml')
+        assert client.get_game_plays(game_id) == expected
+        assert list(client.iter_game_plays(game_id)) == expected
+    assert {game['game_name']: game['plays'] for game in client.get_game_data()} == {
+        path.name: full_parse(path) for path in games_dir.glob('*.yaml')
+    }
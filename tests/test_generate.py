@@ -0,0 +1,155 @@
+import csv
+import os
+
+import pytest
+
+from pulse_mock.cassettes import generate_cassettes_from_csv as generate
+
+HEADER = ['game_id'] + generate.KEY_ORDER
+GAMES = ['2025_01_DAL_PHI', '2025_02_PHI_KC', '2025_03_LA_PHI']
+
+
+def rows(order):
+    """One CSV row per play; order lists the game of each row."""
+    result = []
+    for i, game_id in enumerate(order):
+        row = dict.fromkeys(HEADER, '')
+        row.update(game_id=game_id, home_team='PHI', game_seconds_remaining=str(3600 - i), wpa=f'0.{i}')
+        result.append(row)
+    return result
+
+
+def write_csv(path, data):
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=HEADER)
+        writer.writeheader()
+        writer.writerows(data)
+
+
+def read_dir(path):
+    return {name: (path / name).read_bytes() for name in sorted(os.listdir(path)) if not name.startswith('.')}
+
+
+@pytest.mark.parametrize('order', [
+    [GAMES[0]] * 3 + [GAMES[1]] * 2 + [GAMES[2]] * 2,
+    [GAMES[0], GAMES[1], GAMES[0], GAMES[2], GAMES[1], GAMES[2], GAMES[0]],
+    [GAMES[0]] * 3 + [GAMES[1]] * 2 + [GAMES[2]] * 2 + [GAMES[0]],
+])
+@pytest.mark.parametrize('max_buffered_rows', [2, 1000])
+def test_stream_matches_default_output_in_one_pass(tmp_path, monkeypatch, order, max_buffered_rows):
+    csv_path = tmp_path / 'plays.csv'
+    write_csv(csv_path, rows(order))
+    expected = tmp_path / 'expected'
+    generate.write_cassettes(generate.group_rows_by_game(str(csv_path), typed=False), str(expected), jobs=1)
+
+    passes = []
+    iter_game_rows = generate.iter_game_rows
+    monkeypatch.setattr(generate, 'iter_game_rows', lambda path: passes.append(path) or iter_game_rows(path))
+    streamed = tmp_path / 'streamed'
+    written = generate.stream_cassettes(str(csv_path), str(streamed), max_buffered_rows=max_buffered_rows)
+    assert len(passes) == 1
+    assert len(written) == len(GAMES)
+    assert read_dir(streamed) == read_dir(expected)
+    assert sorted(os.listdir(streamed)) == ['.generate_manifest.json'] + [f'{game}.yaml' for game in GAMES]
+
+    assert generate.stream_cassettes(str(csv_path), str(streamed), max_buffered_rows=max_buffered_rows) == []
+    assert read_dir(streamed) == read_dir(expected)
+
+
+
+def plays_by_game(order):
+    return {game_id: [generate.row_to_play(row) for row in rows(order) if row['game_id'] == game_id]
+            for game_id in dict.fromkeys(order)}
+
+
+def backups(path):
+    return sorted(name for name in os.listdir(path) if '.bak.' in name)
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_only_changed_games_are_rewritten_and_backed_up_once(tmp_path, jobs):
+    groups = plays_by_game([GAMES[0]] * 2 + [GAMES[1]] * 3 + [GAMES[2]])
+    outdir = tmp_path / 'out'
+    written = generate.write_cassettes(groups, str(outdir), jobs=jobs)
+    assert sorted(written) == [str(outdir / f'{game}.yaml') for game in GAMES]
+    # Every file is what writing each game in full gives
+    assert read_dir(outdir) == {f'{game}.yaml': generate.make_yaml_for_game(game, plays).encode('utf-8')
+                                for game, plays in groups.items()}
+    mtimes = {name: os.stat(outdir / name).st_mtime_ns for name in read_dir(outdir)}
+
+    assert generate.write_cassettes(groups, str(outdir), jobs=jobs) == []
+    assert {name: os.stat(outdir / name).st_mtime_ns for name in read_dir(outdir)} == mtimes
+
+    original = (outdir / f'{GAMES[1]}.yaml').read_bytes()
+    changed = dict(groups, **{GAMES[1]: groups[GAMES[1]][:1]})
+    assert generate.write_cassettes(changed, str(outdir), jobs=jobs) == [str(outdir / f'{GAMES[1]}.yaml')]
+    assert [(outdir / name).read_bytes() for name in backups(outdir)] == [original]
+    assert backups(outdir)[0].startswith(f'{GAMES[1]}.yaml.bak.')
+
+    # Back to the original content (a second backup, even within the same second), then the
+    # change again, whose backup already exists
+    shortened = (outdir / f'{GAMES[1]}.yaml').read_bytes()
+    generate.write_cassettes(groups, str(outdir), jobs=jobs)
+    generate.write_cassettes(changed, str(outdir), jobs=jobs)
+    assert sorted((outdir / name).read_bytes() for name in backups(outdir)) == sorted([original, shortened])
+
+    # A file edited by hand is noticed even though the manifest still has the old hash
+    (outdir / f'{GAMES[0]}.yaml').write_text('edited', encoding='utf-8')
+    assert generate.write_cassettes(changed, str(outdir), jobs=jobs) == [str(outdir / f'{GAMES[0]}.yaml')]
+
+    rewritten = generate.write_cassettes(changed, str(outdir), jobs=jobs, force=True)
+    assert len(rewritten) == len(GAMES) and len(backups(outdir)) == 3
+
+
+@pytest.mark.parametrize('cell', ['nan', 'NaN', ' -nan ', '"nan"'])
+def test_typed_read_keeps_nan_cells_as_parse_value_does(tmp_path, cell):
+    pytest.importorskip('pandas')
+    csv_path = tmp_path / 'plays.csv'
+    data = rows([GAMES[0]] * 3)
+    data[1]['wpa'] = 'WPA'
+    write_csv(csv_path, data)
+    csv_path.write_text(csv_path.read_text(encoding='utf-8').replace('WPA', cell), encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        generate.read_plays_typed(csv_path)
+    grouped = generate.group_rows_by_game(csv_path, typed=True)
+    plays = grouped[GAMES[0]]
+    assert repr(plays) == repr([play for _, play in generate.iter_game_rows(csv_path)])
+    assert repr(plays[1]['wpa']) == 'nan'
+    assert plays[1]['air_epa'] is None
+
+
+def test_typed_read_matches_parse_value(tmp_path):
+    pytest.importorskip('pandas')
+    csv_path = tmp_path / 'plays.csv'
+    data = rows([GAMES[0], GAMES[1], GAMES[0]])
+    data[0].update(wpa='inf', qb_epa=' 1.5', passer_player_name='J.Hurts', receiver_player_name='12')
+    data[2].update(wpa='-1e-3', air_epa='0.1000000000000000055511151231257827')
+    write_csv(csv_path, data)
+
+    game_ids, plays = generate.read_plays_typed(csv_path)
+    expected = list(generate.iter_game_rows(csv_path))
+    assert game_ids == [game_id for game_id, _ in expected]
+    assert plays == [play for _, play in expected]
+    assert plays[1]['wpa'] == 0.1 and plays[1]['air_epa'] is None
+
+
+def test_typed_grouping_matches_the_row_parse_with_partial_columns(tmp_path):
+    pytest.importorskip('pandas')
+    header = ['play_id', 'game_id', 'wpa', 'passer_player_name', 'desc', 'home_team']
+    csv_path = tmp_path / 'plays.csv'
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerow(['1', GAMES[0], '0.25', 'J.Hurts', 'pass, short', 'PHI'])
+        writer.writerow(['2', '', '0.5', 'J.Hurts', 'no game', 'PHI'])
+        writer.writerow(['3', GAMES[1], '', '', 'Señor "deep"', ''])
+        writer.writerow(['4', GAMES[0], '-1.5e-3', '00', '', 'PHI'])
+
+    game_ids, plays = generate.read_plays_typed(str(csv_path))  # no fallback to the row parse
+    assert game_ids == [GAMES[0], GAMES[1], GAMES[0]]
+    typed = generate.group_rows_by_game(str(csv_path), typed=True)
+    assert typed == generate.group_rows_by_game(str(csv_path), typed=False)
+    assert list(typed) == GAMES[:2]
+    assert [play['passer_player_name'] for play in typed[GAMES[0]]] == ['J.Hurts', 0.0]
+    assert typed[GAMES[1]][0] == dict.fromkeys(generate.KEY_ORDER)
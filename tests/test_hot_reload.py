@@ -0,0 +1,77 @@
+import time
+
+from pulse_mock import MockAPIClient, NFLMockClient
+from pulse_mock.http_server import RouteTable, load_client
+
+from pulse_mock.cassettes.generate_cassettes_from_csv import make_yaml_for_game
+
+from conftest import BASE_URL, PLAYS, bump_mtime, exchange, http_request as request, interaction, write_cassette
+
+LEAGUES = f'{BASE_URL}/v1/leagues'
+
+
+def rewrite(path, url, body):
+    write_cassette(path, [interaction(url, body)])
+    bump_mtime(path)
+
+
+def test_changed_cassette_is_reloaded(cassette_dir):
+    client = MockAPIClient(cassette_dir)
+    assert client.get(LEAGUES).json() == [{'id': 'NFL'}]
+    assert client.reload_changed_cassettes() == []
+
+    rewrite(f'{cassette_dir}/leagues.yaml', '/v1/leagues', [{'id': 'NFL'}, {'id': 'XFL'}])
+    assert client.get(LEAGUES).json() == [{'id': 'NFL'}]
+    assert client.reload_changed_cassettes() == ['leagues.yaml']
+    assert client.get(LEAGUES).json() == [{'id': 'NFL'}, {'id': 'XFL'}]
+    assert client.reload_changed_cassettes() == []
+
+
+def test_deleted_cassette_is_unloaded_and_new_one_loaded(cassette_dir, tmp_path):
+    client = MockAPIClient(cassette_dir, auto_load_all=True)
+    assert 'leagues.yaml' in client.loaded_cassettes
+    (tmp_path / 'leagues.yaml').unlink()
+    write_cassette(tmp_path / 'extra.yaml', [interaction('/v1/extra', {'new': True})])
+
+    assert sorted(client.reload_changed_cassettes()) == ['extra.yaml', 'leagues.yaml']
+    assert 'leagues.yaml' not in client.loaded_cassettes
+    assert client.try_request('GET', LEAGUES) is None
+    assert client.get(f'{BASE_URL}/v1/extra').json() == {'new': True}
+
+
+def test_watcher_picks_up_changes(cassette_dir):
+    client = MockAPIClient(cassette_dir, watch_interval=0.02)
+    try:
+        client.get(LEAGUES)
+        rewrite(f'{cassette_dir}/leagues.yaml', '/v1/leagues', [{'id': 'CFL'}])
+        deadline = time.monotonic() + 5
+        while client.get(LEAGUES).json() != [{'id': 'CFL'}] and time.monotonic() < deadline:
+            time.sleep(0.02)
+        assert client.get(LEAGUES).json() == [{'id': 'CFL'}]
+    finally:
+        client.stop_watching()
+
+
+def test_changed_game_cassette_is_reread(cassette_dir):
+    client = NFLMockClient(cassette_dir)
+    game, = client.get_game_data()
+    assert len(game['plays']) == 2
+    path = f'{cassette_dir}/jhurts_games/2025_01_DAL_PHI.yaml'
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(make_yaml_for_game('2025_01_DAL_PHI', PLAYS[:1]))
+    bump_mtime(path)
+    game, = client.get_game_data()
+    assert len(game['plays']) == 1
+
+
+def test_http_server_serves_reloaded_content_with_new_etag(cassette_dir):
+    client = load_client(cassette_dir)
+    routes = RouteTable(client)
+    before, = exchange(routes, request('/v1/leagues', close=True))
+
+    rewrite(f'{cassette_dir}/leagues.yaml', '/v1/leagues', [{'id': 'XFL'}])
+    assert client.reload_changed_cassettes() == ['leagues.yaml']
+    stale, after = exchange(routes, request('/v1/leagues', headers={'If-None-Match': before[1]['ETag']}),
+                            request('/v1/leagues', close=True))
+    assert stale[0] == 200 and stale[2] == b'[{"id": "XFL"}]'
+    assert after[1]['ETag'] != before[1]['ETag']
@@ -0,0 +1,86 @@
+import os
+import threading
+
+import pytest
+
+from pulse_mock.http_server import RouteTable, _not_found, load_client
+
+from conftest import BASE_URL, exchange, http_request as request, interaction, write_cassette
+
+
+@pytest.fixture
+def routes(cassette_dir):
+    write_cassette(f'{cassette_dir}/routes.yaml', [
+        {'request': {'method': 'GET', 'url': BASE_URL + '/v1/leagues/{league}/teams/{teamId}/roster'},
+         'response': {'code': 200, 'headers': {'Content-Type': ['application/json']}, 'render': 'team_players'}},
+        interaction('/v1/leagues/{league}/echo/{thing}', '{"thing": "{thing}"}'),
+    ])
+    return RouteTable(load_client(cassette_dir))
+
+
+def test_recorded_route_and_conditional_get(routes):
+    ok, = exchange(routes, request('/v1/leagues', close=True))
+    assert ok[0] == 200
+    assert ok[2] == b'[{"id": "NFL"}]'
+    etag = ok[1]['ETag']
+
+    not_modified, head, stale = exchange(
+        routes,
+        request('/v1/leagues', headers={'If-None-Match': etag}),
+        request('/v1/leagues', method='HEAD'),
+        request('/v1/leagues', headers={'If-None-Match': '"other"'}, close=True),
+    )
+    assert (not_modified[0], not_modified[1]['ETag'], not_modified[2]) == (304, etag, b'')
+    assert (head[0], head[1]['ETag'], head[2]) == (200, etag, b'')
+    assert (stale[0], stale[2]) == (200, b'[{"id": "NFL"}]')
+
+
+def test_templated_routes_render_off_the_event_loop_in_order(routes):
+    calls = []
+    match_route = routes.client.match_route
+
+    def recording_match_route(method, url):
+        calls.append((threading.current_thread() is threading.main_thread(), url))
+        return match_route(method, url)
+
+    routes.client.match_route = recording_match_route
+    roster, leagues, echo, missing = exchange(
+        routes,
+        request('/v1/leagues/NFL/teams/T_DAL/roster'),
+        request('/v1/leagues'),
+        request('/v1/leagues/NFL/echo/abc'),
+        request('/v1/leagues/NFL/teams/T_NONE/roster', close=True),
+    )
+    assert roster[0] == 200 and b'"Prescott"' in roster[2]
+    assert leagues[2] == b'[{"id": "NFL"}]'
+    assert echo[2] == b'{"thing": "abc"}'
+    assert missing[0] == 404
+    assert calls and all(not on_loop and url.startswith(BASE_URL + '/v1/leagues/NFL/')
+                         for on_loop, url in calls)
+
+    # Rendered routes are prepared once and then served without rendering again
+    count = len(calls)
+    cached, = exchange(routes, request('/v1/leagues/NFL/echo/abc', close=True))
+    assert cached[2] == b'{"thing": "abc"}' and len(calls) == count
+
+
+def test_unknown_route_is_404(routes):
+    missing, other, post = exchange(routes, request('/v1/nothing'), request('/v1/other'),
+                                    request('/v1/nothing', method='POST', close=True))
+    assert missing[0] == other[0] == post[0] == 404
+    assert missing[1]['Content-Type'] == 'application/json'
+    assert missing[2] == other[2] == b'{"error": "No recorded interaction for this GET request"}'
+    assert post[2] == b'{"error": "No recorded interaction for this POST request"}'
+    assert _not_found('GET') is _not_found('GET')
+
+
+def test_reload_serves_cassettes_added_to_subdirectories(cassette_dir):
+    routes = RouteTable(load_client(cassette_dir))
+    write_cassette(f'{cassette_dir}/jhurts_games/2025_02_PHI_KC.yaml', [interaction('/v1/new', '{"new": true}')])
+    missing, = exchange(routes, request('/v1/new', close=True))
+    assert missing[0] == 404
+
+    assert routes.client.reload_changed_cassettes() == [os.path.join('jhurts_games', '2025_02_PHI_KC.yaml')]
+    added, = exchange(routes, request('/v1/new', close=True))
+    assert (added[0], added[2]) == (200, b'{"new": true}')
+    assert routes.client.reload_changed_cassettes() == []
@@ -0,0 +1,32 @@
+import pytest
+
+from pulse_mock import MockAPIClient
+from pulse_mock.exceptions import InvalidCassetteError
+from pulse_mock.store import InteractionStore
+
+from conftest import BASE_URL, interaction, write_cassette
+
+
+@pytest.mark.parametrize('code', ['abc', None, [200]])
+def test_bad_status_code_names_the_cassette(tmp_path, code):
+    write_cassette(tmp_path / 'broken.yaml', [interaction('/v1/broken', {}, code=code)])
+    client = MockAPIClient(str(tmp_path))
+    with pytest.raises(InvalidCassetteError, match='broken.yaml'):
+        client.load_cassette('broken')
+
+
+def test_headers_are_pooled_per_store(cassette_dir):
+    store = InteractionStore()
+    client = MockAPIClient(cassette_dir, store=store)
+    client.load_all_available_cassettes()
+    first, *rest = client.interactions
+    assert len(store.headers) == 1
+    assert all(i.headers is first.headers and i.headers_dict() is first.headers_dict() for i in rest)
+    assert first.headers_dict() == {'Content-Type': ['application/json']}
+
+    other = MockAPIClient(cassette_dir, store=InteractionStore())
+    other.load_cassette('leagues')
+    assert other.interactions[0].headers_dict() is not first.headers_dict()
+
+    client.clear_cassettes()
+    assert len(store.headers) == 0
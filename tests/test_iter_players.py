@@ -0,0 +1,79 @@
+import itertools
+
+import pytest
+
+from pulse_mock import NFLMockClient
+
+from conftest import BASE_URL, PLAYERS, interaction, write_cassette
+
+PLAYERS_PATH = '/v1/leagues/NFL/players'
+ROSTER = [dict(PLAYERS[i % len(PLAYERS)], id=f'P{i}') for i in range(5)]
+
+
+def page(players, cursor=None):
+    body = {'players': players}
+    if cursor:
+        body.update(cursor=cursor, has_more=True)
+    return body
+
+
+def recording_client(cassette_dir):
+    client = NFLMockClient(cassette_dir)
+    client.requested = []
+    get = client.get
+
+    def recording_get(url, *args, **kwargs):
+        client.requested.append(url[len(BASE_URL):])
+        return get(url, *args, **kwargs)
+
+    client.get = recording_get
+    return client
+
+
+@pytest.fixture
+def paged_dir(tmp_path):
+    write_cassette(tmp_path / 'players.yaml', [
+        interaction(f'{PLAYERS_PATH}?per_page=2', page(ROSTER[:2], 'c2')),
+        interaction(f'{PLAYERS_PATH}?per_page=2&cursor=c2', page(ROSTER[2:4], 'c3')),
+        interaction(f'{PLAYERS_PATH}?cursor=c3&per_page=2', page(ROSTER[4:])),
+    ])
+    return str(tmp_path)
+
+
+def test_pages_are_followed_by_cursor(paged_dir):
+    client = recording_client(paged_dir)
+    assert list(client.iter_players(per_page=2)) == ROSTER
+    assert client.requested == [f'{PLAYERS_PATH}?per_page=2', f'{PLAYERS_PATH}?per_page=2&cursor=c2',
+                                f'{PLAYERS_PATH}?per_page=2&cursor=c3']
+
+
+def test_later_pages_are_not_requested_when_the_caller_stops(paged_dir):
+    client = recording_client(paged_dir)
+    assert list(itertools.islice(client.iter_players(per_page=2), 2)) == ROSTER[:2]
+    assert client.requested == [f'{PLAYERS_PATH}?per_page=2']
+
+
+def test_single_recorded_page_is_served_once(tmp_path):
+    # Every cursor request falls back to the one recorded page, which has the same body object
+    write_cassette(tmp_path / 'players.yaml', [interaction(PLAYERS_PATH, page(ROSTER, 'c2'))])
+    client = recording_client(str(tmp_path))
+    assert list(client.iter_players(per_page=2)) == ROSTER
+    assert client.requested == [f'{PLAYERS_PATH}?per_page=2', f'{PLAYERS_PATH}?per_page=2&cursor=c2']
+    assert client.get_all_players() == ROSTER
+
+
+def test_repeated_cursor_stops_iteration(tmp_path):
+    write_cassette(tmp_path / 'players.yaml', [
+        interaction(f'{PLAYERS_PATH}?per_page=3', page(ROSTER[:3], 'c2')),
+        interaction(f'{PLAYERS_PATH}?cursor=c2&per_page=3', page(ROSTER[3:], 'c2')),
+    ])
+    client = recording_client(str(tmp_path))
+    assert list(client.iter_players(per_page=3)) == ROSTER
+    assert len(client.requested) == 2
+
+
+def test_find_player_by_name_stops_paging_at_the_limit(paged_dir):
+    client = recording_client(paged_dir)
+    client.get_entities = lambda league='NFL': None
+    assert [p['id'] for p in client.find_player_by_name('a', limit=1)] == ['P0']
+    assert client.requested == [f'{PLAYERS_PATH}?per_page=100']
@@ -0,0 +1,73 @@
+from urllib.parse import urlparse
+
+import pytest
+import yaml
+
+from pulse_mock import MockAPIClient
+from pulse_mock.exceptions import RequestNotFoundError
+
+from conftest import BASE_URL, interaction, write_cassette
+
+CASSETTES = {
+    'first.yaml': [
+        interaction('/v1/things', {'from': 'first'}),
+        interaction('/v1/things', {'from': 'first, POST'}, method='POST'),
+        interaction('/v1/things?page=2', {'from': 'first, page 2'}),
+        interaction('/v1/other#fragment', {'from': 'first, other'}),
+    ],
+    'second.yaml': [
+        interaction('/v1/things', {'from': 'second'}),
+        interaction('/v1/things', {'from': 'second, DELETE'}, method='DELETE'),
+        interaction('/v1/only-second', {'from': 'second, only'}, code=404),
+    ],
+}
+
+REQUESTS = [
+    ('GET', '/v1/things'), ('get', '/v1/things'), ('POST', '/v1/things'), ('DELETE', '/v1/things'),
+    ('GET', '/v1/things?x=1'), ('GET', '/v1/things#top'), ('GET', '/v1/other'), ('GET', '/v1/other?y=2'),
+    ('GET', '/v1/only-second'), ('PUT', '/v1/things'), ('GET', '/v1/missing'), ('GET', '/v1/things/'),
+]
+
+
+def normalize(url):
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
+
+
+def linear_match(interactions, method, url):
+    """The baseline matcher: the first loaded interaction with the same method and normalized URL."""
+    for recorded in interactions:
+        request = recorded['request']
+        if request['method'].upper() == method.upper() and normalize(request['url']) == normalize(url):
+            return recorded['response']
+    return None
+
+
+@pytest.fixture
+def client(tmp_path):
+    interactions = []
+    for name, recorded in CASSETTES.items():
+        write_cassette(tmp_path / name, recorded)
+        with open(tmp_path / name, encoding='utf-8') as f:
+            interactions.extend(yaml.safe_load(f)['interactions'])
+    client = MockAPIClient(str(tmp_path), use_manifest=False)
+    client.load_cassettes(list(CASSETTES))
+    client.recorded = interactions
+    return client
+
+
+@pytest.mark.parametrize('method, path', REQUESTS)
+def test_index_matches_the_linear_scan(client, method, path):
+    expected = linear_match(client.recorded, method, BASE_URL + path)
+    if expected is None:
+        assert client.try_request(method, BASE_URL + path) is None
+        with pytest.raises(RequestNotFoundError):
+            client.request(method, BASE_URL + path)
+    else:
+        for response in (client.try_request(method, BASE_URL + path), client.request(method, BASE_URL + path)):
+            assert (response.status_code, response.text) == (expected['code'], expected['body'])
+
+
+def test_recorded_query_is_preferred_over_the_first_url_match(client):
+    assert client.get(f'{BASE_URL}/v1/things?page=2').json() == {'from': 'first, page 2'}
+    assert client.get(f'{BASE_URL}/v1/things?page=3').json() == {'from': 'first'}
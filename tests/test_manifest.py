@@ -0,0 +1,93 @@
+import json
+import os
+
+import pytest
+
+from pulse_mock import MockAPIClient
+from pulse_mock.exceptions import RequestNotFoundError
+from pulse_mock.manifest import MANIFEST_FILENAME, CassetteManifest
+
+from conftest import BASE_URL, bump_mtime, interaction, write_cassette
+
+
+def refresh(cassette_dir):
+    """Refresh a fresh manifest of cassette_dir; return it and the cassettes it had to read."""
+    client = MockAPIClient(cassette_dir, use_manifest=False)
+    reads = []
+
+    def read_routes(cassette):
+        reads.append(cassette)
+        return client._read_cassette_routes(cassette)
+
+    manifest = CassetteManifest(cassette_dir)
+    manifest.refresh(client.discover_available_cassettes(), read_routes)
+    return manifest, reads
+
+
+@pytest.fixture
+def echo_dir(cassette_dir):
+    write_cassette(f'{cassette_dir}/routes.yaml', [interaction('/v1/leagues/{league}/echo/{thing}', '{"thing": "{thing}"}')])
+    return cassette_dir
+
+
+def test_templated_cassettes_are_listed_once_per_refresh(echo_dir):
+    client = MockAPIClient(echo_dir)
+    manifest = CassetteManifest(echo_dir)
+    manifest.refresh(client.discover_available_cassettes(), client._read_cassette_routes)
+    assert manifest.templated() == ('routes.yaml',)
+    assert manifest.templated() is manifest.templated()
+
+
+def test_unmatched_requests_skip_loading_when_route_cassettes_are_loaded(echo_dir):
+    client = MockAPIClient(echo_dir)
+    assert client.get(f'{BASE_URL}/v1/leagues/NFL/echo/abc').json() == {'thing': 'abc'}
+    assert 'routes.yaml' in client.loaded_cassettes
+
+    attempts = []
+    client.load_cassette = attempts.append
+    for _ in range(2):
+        with pytest.raises(RequestNotFoundError):
+            client.get(f'{BASE_URL}/v1/leagues/NFL/missing/abc')
+    assert attempts == []
+
+
+def test_sidecar_is_reused_until_a_cassette_changes(cassette_dir):
+    manifest, reads = refresh(cassette_dir)
+    assert sorted(reads) == ['games.yaml', 'leagues.yaml', 'players.yaml', 'teams.yaml']
+    assert manifest.find(f'{BASE_URL}/v1/leagues/NFL/teams/T_PHI') == ['teams.yaml']
+    assert manifest.find(f'{BASE_URL}/v1/leagues/NFL/teams/T_PHI', 'post') == []
+
+    manifest, reads = refresh(cassette_dir)
+    assert reads == []
+    assert manifest.find(f'{BASE_URL}/v1/leagues') == ['leagues.yaml']
+
+    write_cassette(f'{cassette_dir}/leagues.yaml', [interaction('/v1/leagues/v2', [])])
+    bump_mtime(f'{cassette_dir}/leagues.yaml')
+    os.remove(f'{cassette_dir}/games.yaml')
+    write_cassette(f'{cassette_dir}/extra.yaml', [interaction('/v1/leagues', [{'id': 'XFL'}])])
+    manifest, reads = refresh(cassette_dir)
+    assert sorted(reads) == ['extra.yaml', 'leagues.yaml']
+    assert manifest.find(f'{BASE_URL}/v1/leagues') == ['extra.yaml']
+    assert manifest.find(f'{BASE_URL}/v1/leagues/v2') == ['leagues.yaml']
+    assert manifest.find(f'{BASE_URL}/v1/leagues/NFL/games') == []
+    with open(f'{cassette_dir}/{MANIFEST_FILENAME}', encoding='utf-8') as f:
+        assert sorted(json.load(f)['cassettes']) == ['extra.yaml', 'leagues.yaml', 'players.yaml', 'teams.yaml']
+
+
+@pytest.mark.parametrize('sidecar', ['not json', '{"version": 0, "cassettes": {}}'])
+def test_unreadable_or_outdated_sidecar_is_rebuilt(cassette_dir, sidecar):
+    with open(f'{cassette_dir}/{MANIFEST_FILENAME}', 'w', encoding='utf-8') as f:
+        f.write(sidecar)
+    manifest, reads = refresh(cassette_dir)
+    assert len(reads) == 4
+    assert manifest.find(f'{BASE_URL}/v1/leagues/NFL/games') == ['games.yaml']
+    assert refresh(cassette_dir)[1] == []
+
+
+def test_auto_load_reads_only_the_cassette_recording_the_url(cassette_dir):
+    client = MockAPIClient(cassette_dir)
+    assert client.get(f'{BASE_URL}/v1/leagues/NFL/teams/T_DAL').json()['name'] == 'Cowboys'
+    assert client.loaded_cassettes == ('teams.yaml',)
+    with pytest.raises(RequestNotFoundError):
+        client.get(f'{BASE_URL}/v1/leagues/NFL/unknown')
+    assert client.loaded_cassettes == ('teams.yaml',)
@@ -0,0 +1,66 @@
+import pytest
+
+from pulse_mock.name_index import EXACT, PREFIX, SUBSTRING, NameIndex
+
+NAMES = [
+    ('Jalen', 'Hurts'), ('A.J.', 'Brown'), ('Dak', 'Prescott'), ('CeeDee', 'Lamb'), ('Jalen', 'Carter'),
+    ('Aaron', 'Aa'), ('', 'Nabers'), ('Saquon', ''), ('Ja', "Ja'Marr Chase"), ('Lamb', 'Lamb'),
+]
+
+
+def entries():
+    for i, (first, last) in enumerate(NAMES):
+        first, last = first.lower(), last.lower()
+        yield (first, last, f"{first} {last}".strip()), (), i
+
+
+def linear_find(query):
+    """The baseline substring scan over first, last and full names."""
+    query = query.lower()
+    matches = []
+    for i, (first, last) in enumerate(NAMES):
+        first, last = first.lower(), last.lower()
+        if query in first or query in last or query in f"{first} {last}".strip():
+            matches.append(i)
+    return matches
+
+
+def queries():
+    names = {name for first, last in NAMES for name in (first.lower(), last.lower(), f"{first} {last}".lower())}
+    found = {name[i:j] for name in names for i in range(len(name)) for j in range(i + 1, min(len(name), i + 6) + 1)}
+    return sorted(found) + ['', 'JALEN', 'zzz', 'aaa', 'n h', 'jalen hurts ', 'lamb lamb', "'"]
+
+
+def test_find_matches_the_substring_scan():
+    index = NameIndex(entries())
+    for query in queries():
+        assert index.find(query) == linear_find(query), query
+        assert index.find(query, limit=2) == linear_find(query)[:2], query
+
+
+def test_search_ranks_exact_then_prefix_then_substring():
+    index = NameIndex(entries())
+    for query in queries():
+        ranked = index.search(query)
+        assert sorted(i for _, i in ranked) == linear_find(query), query
+        assert ranked == sorted(ranked), query
+        for rank, i in ranked:
+            first, last = NAMES[i][0].lower(), NAMES[i][1].lower()
+            names = (first, last, f"{first} {last}".strip())
+            words = {word for name in names for word in name.split()}
+            if query.lower() in names:
+                assert rank == EXACT
+            elif query and any(word.startswith(query.lower()) for word in words | set(names)):
+                assert rank == PREFIX
+            else:
+                assert rank == SUBSTRING
+    assert index.search('jalen', limit=1) == [(EXACT, 0)]
+
+
+@pytest.mark.parametrize('query, expected', [('phi', ['PHI']), ('ph', ['PHI']), ('nyg', ['NYG']), ('ny', []),
+                                             ('yg', []), ('new york', ['NYG', 'NYJ']), ('', ['PHI', 'NYG', 'NYJ'])])
+def test_exact_names_match_only_whole(query, expected):
+    teams = [('Eagles', 'Philadelphia', 'PHI'), ('Giants', 'New York', 'NYG'), ('Jets', 'New York', 'NYJ')]
+    index = NameIndex(((name.lower(), market.lower()), (abbreviation.lower(),), abbreviation)
+                      for name, market, abbreviation in teams)
+    assert index.find(query) == expected
@@ -0,0 +1,34 @@
+import csv
+
+from pulse_mock.cassettes import partition_players as module
+from pulse_mock.cassettes.partition_players import partition_players
+
+HEADER = ['game_id', 'passer_player_name', 'receiver_player_name', 'desc']
+
+
+def test_extracts_are_utf8_and_keep_rows_verbatim(tmp_path, monkeypatch):
+    # A non-UTF-8 locale default (e.g. cp1252 on Windows) must not change how
+    # the files are read or written
+    def locale_open(*args, **kwargs):
+        if 'b' not in (args[1] if len(args) > 1 else kwargs.get('mode', 'r')):
+            kwargs.setdefault('encoding', 'cp1252')
+        return open(*args, **kwargs)
+
+    monkeypatch.setattr(module, 'open', locale_open, raising=False)
+    rows = [
+        ['2025_01_DAL_PHI', 'J.Hurts', 'A.Brown', 'pass to Brown, 12 yds'],
+        ['2025_01_DAL_PHI', 'D.Prescott', 'C.Lamb', 'Señor route – “deep”'],
+        ['2025_02_PHI_KC', 'J.Hurts', 'D.Goedert', 'short\r\nleft'],
+    ]
+    csv_path = tmp_path / 'plays_filtered.csv'
+    with open(csv_path, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(HEADER)
+        writer.writerows(rows)
+
+    written = partition_players(str(csv_path), str(tmp_path / 'out'), chunk_rows=1)
+    assert sorted(written) == ['abrown', 'clamb', 'dgoedert', 'dprescott', 'jhurts']
+    with open(written['dprescott'], encoding='utf-8', newline='') as f:
+        assert list(csv.reader(f)) == [HEADER, rows[1]]
+    with open(written['jhurts'], encoding='utf-8', newline='') as f:
+        assert list(csv.reader(f)) == [HEADER, rows[0], rows[2]]
@@ -0,0 +1,86 @@
+import math
+import os
+import subprocess
+import sys
+
+import pytest
+
+from pulse_mock import NFLMockClient
+from pulse_mock.cassettes.generate_cassettes_from_csv import make_yaml_for_game
+from pulse_mock.schema import KEY_ORDER
+
+np = pytest.importorskip('numpy')
+from pulse_mock.play_store import PlayColumns  # noqa: E402
+
+from conftest import PLAYS, bump_mtime  # noqa: E402
+
+
+def test_play_store_does_not_need_the_cassette_scripts():
+    # pulse_mock/cassettes is a script directory, not shipped by find_packages()
+    code = ('import sys, pulse_mock.play_store, pulse_mock.games; '
+            'print(any(name.startswith("pulse_mock.cassettes") for name in sys.modules))')
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=root)
+    assert out.stdout.strip() == 'False'
+
+
+def test_generator_uses_the_package_schema():
+    from pulse_mock.cassettes import generate_cassettes_from_csv as generate
+    assert generate.KEY_ORDER is KEY_ORDER
+
+
+def test_series_match_the_play_dicts():
+    columns = PlayColumns.from_plays(PLAYS)
+    order = columns.chronological_order()
+    expected_order = sorted(range(len(PLAYS)), key=lambda i: 3600 - PLAYS[i]['game_seconds_remaining'])
+    assert order.tolist() == expected_order
+    for name in ('qb_epa', 'wpa', 'yards_gained'):
+        assert columns.series(name, order).tolist() == [float(PLAYS[i].get(name) or 0.0) for i in expected_order]
+    assert math.isnan(columns.column('yards_gained')[1])
+    assert columns.strings('passer_player_name').tolist() == ['J.Hurts', None]
+
+
+GAME_PLAYS = PLAYS + [
+    {'home_team': 'PHI', 'game_seconds_remaining': 3600.0, 'passer_player_name': 'K.Pickett', 'wpa': 0.03,
+     'receiver_player_name': 'D.Smith', 'air_epa': 1.5},
+    {'home_team': 'PHI', 'game_seconds_remaining': 10.0, 'passer_player_name': 'J.Hurts', 'qb_epa': 2.0,
+     'yards_gained': 'n/a'},
+]
+
+
+def test_columns_match_a_scan_of_the_play_dicts():
+    columns = PlayColumns.from_plays(GAME_PLAYS)
+    assert len(columns) == len(GAME_PLAYS)
+    assert 'yards_gained' in columns.categorical
+    for name in KEY_ORDER:
+        values = [play.get(name) for play in GAME_PLAYS]
+        if name in columns.numeric:
+            assert [None if math.isnan(v) else v for v in columns.column(name).tolist()] == values
+            assert not columns.column(name).flags.writeable
+        else:
+            assert columns.strings(name).tolist() == [None if v is None else str(v) for v in values]
+
+    order = columns.chronological_order()
+    expected_order = sorted(range(len(GAME_PLAYS)), key=lambda i: 3600 - GAME_PLAYS[i]['game_seconds_remaining'])
+    assert order.tolist() == expected_order
+    assert columns.diff('wpa', 'qb_epa', order).tolist() == [
+        (GAME_PLAYS[i].get('wpa') or 0.0) - (GAME_PLAYS[i].get('qb_epa') or 0.0) for i in expected_order
+    ]
+    taken = columns.take(order)
+    assert taken.strings('passer_player_name').tolist() == [GAME_PLAYS[i].get('passer_player_name') for i in expected_order]
+    with pytest.raises(ValueError):
+        columns.series('passer_player_name')
+
+
+def test_game_columns_are_cached_per_cassette_version(cassette_dir):
+    client = NFLMockClient(cassette_dir)
+    columns = client.get_game_columns('2025_01_DAL_PHI')
+    assert columns is client.get_game_columns('2025_01_DAL_PHI')
+    assert columns.column('qb_epa').tolist() == [play['qb_epa'] for play in client.get_game_plays('2025_01_DAL_PHI')]
+
+    path = os.path.join(cassette_dir, 'jhurts_games', '2025_01_DAL_PHI.yaml')
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(make_yaml_for_game('2025_01_DAL_PHI', GAME_PLAYS[:3]))
+    bump_mtime(path)
+    changed = client.get_game_columns('2025_01_DAL_PHI')
+    assert changed is not columns and len(changed) == 3
@@ -0,0 +1,34 @@
+from pulse_mock import MockAPIClient
+from pulse_mock.client import MockResponse
+
+from conftest import BASE_URL
+
+
+def test_content_is_text_for_every_body_type():
+    for body in ('{"a": "é"}', '{"a": "é"}'.encode('utf-8'), memoryview('{"a": "é"}'.encode('utf-8'))):
+        response = MockResponse(200, {}, body)
+        assert response.content == response.text == '{"a": "é"}'
+        assert response.content_bytes == '{"a": "é"}'.encode('utf-8')
+        assert response.body.tobytes() == response.content_bytes
+        assert response.json() == {'a': 'é'}
+
+
+def test_client_response_content_is_text(cassette_dir):
+    response = MockAPIClient(cassette_dir).get(f'{BASE_URL}/v1/leagues')
+    assert isinstance(response.content, str)
+    assert response.content == '[{"id": "NFL"}]'
+    assert response.content_bytes == b'[{"id": "NFL"}]'
+
+
+def test_client_response_headers_are_mutable_copies(cassette_dir):
+    client = MockAPIClient(cassette_dir)
+    response = client.get(f'{BASE_URL}/v1/leagues')
+    headers = response.headers
+    assert type(headers) is dict
+    assert headers == {'Content-Type': ['application/json']}
+    assert type(headers['Content-Type']) is list
+
+    headers['X-Extra'] = '1'
+    headers['Content-Type'].append('charset=utf-8')
+    assert response.headers is headers
+    assert client.get(f'{BASE_URL}/v1/leagues').headers == {'Content-Type': ['application/json']}
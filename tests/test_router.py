@@ -0,0 +1,93 @@
+import itertools
+
+import pytest
+
+from pulse_mock import MockAPIClient, NFLMockClient
+from pulse_mock.exceptions import RequestNotFoundError
+from pulse_mock.router import RenderCache, RouteTrie, is_template
+
+from conftest import BASE_URL, PLAYERS, interaction, write_cassette
+
+TEMPLATES = [
+    ('GET', '/v1/leagues/{league}/teams'),
+    ('GET', '/v1/leagues/{league}/teams/{teamId}'),
+    ('GET', '/v1/leagues/NFL/teams/{teamId}'),
+    ('GET', '/v1/leagues/{league}/teams/T1/players'),
+    ('GET', '/v1/leagues/{league}/teams/{teamId}/players'),
+    ('POST', '/v1/leagues/{league}/teams/{teamId}/players'),
+    ('GET', '/v1/{a}/{b}/{c}/{d}/games'),
+    ('GET', '/v1/leagues/{other}/teams'),
+]
+
+
+def linear_match(method, path):
+    """Scan every template; among the matches prefer a static segment at the first place they differ."""
+    segments = [s for s in path.split('/') if s]
+    best = None
+    for i, (route_method, template) in enumerate(TEMPLATES):
+        parts = [s for s in template.split('/') if s]
+        if route_method != method.upper() or len(parts) != len(segments):
+            continue
+        if all(p.startswith('{') or p == s for p, s in zip(parts, segments)):
+            key = ([p.startswith('{') for p in parts], i)
+            if best is None or key < best[0]:
+                params = {p[1:-1]: s for p, s in zip(parts, segments) if p.startswith('{')}
+                best = (key, (i, params))
+    return best[1] if best else None
+
+
+PATHS = ['/' + '/'.join(segments) for segments in itertools.product(
+    ['v1'], ['leagues', 'x'], ['NFL', 'XFL'], ['teams', 'x'], ['', 'T1', 'T2'], ['', 'players', 'games'])]
+
+
+@pytest.mark.parametrize('method', ['GET', 'post', 'DELETE'])
+def test_trie_matches_the_linear_scan(method):
+    trie = RouteTrie((route_method, template, i) for i, (route_method, template) in enumerate(TEMPLATES))
+    assert trie.size == len(TEMPLATES) - 1  # {other} duplicates the {league} route
+    for path in PATHS:
+        assert trie.match(method, path) == linear_match(method, path), path
+
+
+def test_parameters_are_decoded_and_templates_detected():
+    trie = RouteTrie([('GET', '/v1/players/{playerId}', 'player')])
+    assert trie.match('GET', '/v1/players/A%20B') == ('player', {'playerId': 'A B'})
+    assert trie.match('GET', '/v1/players') is None
+    assert is_template(f'{BASE_URL}/v1/leagues/{{league}}')
+    assert not is_template(f'{BASE_URL}/v1/leagues?q={{x}}')
+
+
+def test_render_cache_evicts_least_recently_used():
+    evicted = []
+    cache = RenderCache(maxsize=2, on_evict=evicted.append)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert (cache.get('b'), cache.get('a'), cache.get('c'), evicted) == (None, 1, 3, [2])
+
+
+def test_templated_bodies_are_rendered_after_exact_recordings(cassette_dir):
+    write_cassette(f'{cassette_dir}/routes.yaml', [
+        interaction('/v1/leagues/{league}/echo/{thing}', '{"league": "{league}", "thing": "{thing}"}'),
+        interaction('/v1/leagues/NFL/echo/recorded', {'recorded': True}),
+    ])
+    client = MockAPIClient(cassette_dir)
+    assert client.get(f'{BASE_URL}/v1/leagues/NFL/echo/recorded').json() == {'recorded': True}
+    assert client.get(f'{BASE_URL}/v1/leagues/XFL/echo/a%22b%5Cc').json() == {'league': 'XFL', 'thing': 'a"b\\c'}
+    with pytest.raises(RequestNotFoundError):
+        client.get(f'{BASE_URL}/v1/leagues/XFL/echo')
+
+
+def test_entity_routes_render_the_recorded_entities(cassette_dir):
+    write_cassette(f'{cassette_dir}/routes.yaml', [
+        {'request': {'method': 'GET', 'url': BASE_URL + '/v1/leagues/{league}/teams/{teamId}/roster'},
+         'response': {'code': 200, 'headers': {}, 'render': 'team_players'}},
+        {'request': {'method': 'GET', 'url': BASE_URL + '/v1/leagues/{league}/people/{playerId}'},
+         'response': {'code': 200, 'headers': {}, 'render': 'player'}},
+    ])
+    client = NFLMockClient(cassette_dir)
+    assert client.get(f'{BASE_URL}/v1/leagues/NFL/teams/T_PHI/roster').json() == client.get_team_players('T_PHI')
+    assert client.get(f'{BASE_URL}/v1/leagues/NFL/people/P3').json() == PLAYERS[2]
+    for path in ('/v1/leagues/NFL/teams/T_NONE/roster', '/v1/leagues/XFL/people/P3'):
+        with pytest.raises(RequestNotFoundError):
+            client.get(BASE_URL + path)
@@ -0,0 +1,65 @@
+import pytest
+
+from pulse_mock import MockAPIClient
+from pulse_mock.exceptions import RequestNotFoundError
+from pulse_mock.stats import endpoint_pattern
+
+from conftest import BASE_URL
+
+LEAGUES = f'{BASE_URL}/v1/leagues'
+
+
+def test_default_json_decode_is_timed(cassette_dir):
+    client = MockAPIClient(cassette_dir, collect_stats=True)
+    response = client.get(LEAGUES)
+    assert response.json() == [{'id': 'NFL'}]
+    assert response.json() == [{'id': 'NFL'}]
+
+    stats = client.stats()
+    assert stats['timings']['decode']['/v1/leagues']['count'] == 2
+    assert stats['counters']['decode_misses'] == {'/v1/leagues': 2}
+    assert 'decode_hits' not in stats['counters']
+
+
+def test_shared_json_decode_is_timed_once(cassette_dir):
+    client = MockAPIClient(cassette_dir, collect_stats=True, share_decoded_json=True)
+    client.get(LEAGUES).json()
+    client.get(LEAGUES).json()
+
+    stats = client.stats()
+    assert stats['timings']['decode']['/v1/leagues']['count'] == 1
+    assert stats['counters']['decode_misses'] == {'/v1/leagues': 1}
+    assert stats['counters']['decode_hits'] == {'/v1/leagues': 1}
+
+
+def test_decode_not_recorded_without_stats(cassette_dir):
+    client = MockAPIClient(cassette_dir)
+    assert client.get(LEAGUES).json() == [{'id': 'NFL'}]
+    assert client.stats()['timings'] == {}
+
+
+def test_requests_misses_and_loads_are_counted_per_pattern(cassette_dir):
+    events = []
+    client = MockAPIClient(cassette_dir, use_compiled_cache=False, stats_hook=lambda event, fields: events.append(event))
+    client.get(f'{BASE_URL}/v1/leagues/NFL/teams/T_PHI')
+    client.get(f'{BASE_URL}/v1/leagues/NFL/teams/T_DAL')
+    with pytest.raises(RequestNotFoundError):
+        client.get(f'{BASE_URL}/v1/leagues/NFL/teams/T_NONE')
+
+    stats = client.stats()
+    assert stats['enabled']
+    assert stats['counters']['requests'] == {'/v1/leagues/{id}/teams/{id}': 3}
+    assert stats['counters']['request_misses'] == {'/v1/leagues/{id}/teams/{id}': 1}
+    assert stats['counters']['auto_load_reads'] == {'teams.yaml': 1}
+    assert stats['timings']['match']['/v1/leagues/{id}/teams/{id}']['count'] == 3
+    assert stats['timings']['load']['teams.yaml']['count'] == 1
+    assert events.count('requests') == 3 and 'load' in events
+
+    client.disable_stats()
+    client.get(LEAGUES)
+    assert client.stats()['enabled'] is False
+
+
+def test_endpoint_pattern_replaces_identifiers():
+    assert endpoint_pattern(f'{BASE_URL}/v1/leagues/NFL/teams/T1/players?per_page=2') == '/v1/leagues/{id}/teams/{id}/players'
+    assert endpoint_pattern(f'{BASE_URL}/v1/leagues') == '/v1/leagues'
@@ -0,0 +1,81 @@
+import pytest
+
+from pulse_mock import MockAPIClient
+from pulse_mock.store import BodyPool, InteractionStore
+
+from conftest import BASE_URL, TEAMS, bump_mtime, interaction, write_cassette
+
+
+def test_clients_get_private_stores_by_default(cassette_dir):
+    a = MockAPIClient(cassette_dir)
+    b = MockAPIClient(cassette_dir)
+    assert a.store is not b.store
+
+    a.get(f'{BASE_URL}/v1/leagues')
+    assert a.loaded_cassettes == ('leagues.yaml',)
+    assert b.loaded_cassettes == ()
+
+    a.clear_cassettes()
+    b.get(f'{BASE_URL}/v1/leagues')
+    assert b.loaded_cassettes == ('leagues.yaml',)
+    assert a.loaded_cassettes == ()
+
+
+def test_shared_store_is_opt_in(cassette_dir):
+    store = InteractionStore.shared(cassette_dir)
+    a = MockAPIClient(cassette_dir, store=store)
+    b = MockAPIClient(cassette_dir, store=InteractionStore.shared(cassette_dir))
+    assert a.store is b.store
+
+    a.get(f'{BASE_URL}/v1/leagues')
+    assert b.loaded_cassettes == ('leagues.yaml',)
+    a.clear_cassettes()
+    assert b.loaded_cassettes == ()
+
+
+def test_private_store_respects_client_options(cassette_dir):
+    frozen = MockAPIClient(cassette_dir, share_decoded_json=True)
+    frozen.get(f'{BASE_URL}/v1/leagues').json()
+    mutable = MockAPIClient(cassette_dir, share_decoded_json=False)
+    leagues = mutable.get(f'{BASE_URL}/v1/leagues').json()
+    leagues.append({'id': 'XFL'})
+    assert mutable.get(f'{BASE_URL}/v1/leagues').json() == [{'id': 'NFL'}]
+
+
+@pytest.mark.parametrize('use_compiled_cache', [False, True])
+def test_equal_bodies_are_interned_across_cassettes(cassette_dir, use_compiled_cache):
+    write_cassette(f'{cassette_dir}/teams_again.yaml', [
+        interaction('/v2/teams', TEAMS), interaction('/v2/nothing', '[{"id": "NFL"} ]'), interaction('/v2/leagues', [{'id': 'NFL'}]),
+    ])
+    for _ in range(2):  # the second client reads the compiled cassettes, when enabled
+        client = MockAPIClient(cassette_dir, auto_load_all=True, use_compiled_cache=use_compiled_cache)
+    bodies = {i.url[len(BASE_URL):]: i.body for i in client.interactions}
+    assert bodies['/v2/teams'] is bodies['/v1/leagues/NFL/teams']
+    assert bodies['/v2/leagues'] is bodies['/v1/leagues']
+    assert bodies['/v2/nothing'] is not bodies['/v1/leagues']
+    assert client.get(f'{BASE_URL}/v2/teams').json() == client.get(f'{BASE_URL}/v1/leagues/NFL/teams').json() == TEAMS
+
+    stats = client.stats()['bodies']
+    assert stats['bodies'] == len(client.interactions)
+    assert stats['unique_bodies'] == len(client.interactions) - 2
+    assert stats['bytes_saved'] == len(bodies['/v2/teams']) + len(bodies['/v2/leagues'])
+
+
+def test_reloading_drops_bodies_no_longer_recorded(cassette_dir):
+    client = MockAPIClient(cassette_dir)
+    client.get(f'{BASE_URL}/v1/leagues')
+    assert len(client.store.bodies) == 1
+    write_cassette(f'{cassette_dir}/leagues.yaml', [interaction('/v1/leagues', [{'id': 'XFL'}])])
+    bump_mtime(f'{cassette_dir}/leagues.yaml')
+    client.reload_changed_cassettes()
+    assert client.get(f'{BASE_URL}/v1/leagues').json() == [{'id': 'XFL'}]
+    assert len(client.store.bodies) == 1
+
+
+def test_body_pool_merges_only_equal_content():
+    pool = BodyPool()
+    body = b'{"a": 1}'
+    assert pool.intern(body) is body
+    assert pool.intern(memoryview(b'{"a": 1}').toreadonly()) is body
+    assert pool.intern(b'{"a": 2}') == b'{"a": 2}'
+    assert len(pool) == 2